@@ -0,0 +1,36 @@
+"""add analytics daily rollups
+
+Revision ID: 003
+Revises: d2a0463b86cc
+Create Date: 2025-04-02
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = 'd2a0463b86cc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create analytics_daily_rollups table
+    # Populate it afterwards with: python -m app.backfill_rollups
+    op.create_table(
+        'analytics_daily_rollups',
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('metric', sa.String(), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'day', 'metric')
+    )
+    op.create_index('ix_analytics_daily_rollups_day_metric', 'analytics_daily_rollups', ['day', 'metric'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_analytics_daily_rollups_day_metric', table_name='analytics_daily_rollups')
+    op.drop_table('analytics_daily_rollups')
@@ -0,0 +1,59 @@
+"""add task status transitions
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-04-09
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create task_status_transitions table
+    op.create_table(
+        'task_status_transitions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('task_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('from_status', sa.String(), nullable=True),
+        sa.Column('to_status', sa.String(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('changed_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['changed_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_status_transitions_project_changed_at', 'task_status_transitions',
+                    ['project_id', 'changed_at'], unique=False)
+
+    # Seed the history from the current tasks: every task is created in its
+    # current status, except Done tasks, which are created Pending and
+    # completed at their last update.
+    op.execute("""
+        INSERT INTO task_status_transitions (id, task_id, project_id, from_status, to_status, changed_at, changed_by)
+        SELECT gen_random_uuid(), id, project_id, NULL,
+               CASE WHEN status = 'Done' THEN 'Pending' ELSE status END,
+               COALESCE(created_at, now()), created_by
+        FROM tasks
+    """)
+    op.execute("""
+        INSERT INTO task_status_transitions (id, task_id, project_id, from_status, to_status, changed_at)
+        SELECT gen_random_uuid(), id, project_id, 'Pending', 'Done',
+               GREATEST(COALESCE(updated_at, now()), COALESCE(created_at, now()))
+        FROM tasks
+        WHERE status = 'Done'
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_task_status_transitions_project_changed_at', table_name='task_status_transitions')
+    op.drop_table('task_status_transitions')
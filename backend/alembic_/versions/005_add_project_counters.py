@@ -0,0 +1,38 @@
+"""add project counters
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-04-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+COUNTERS = ['task_count', 'done_task_count', 'updates_count', 'documents_count', 'members_count']
+
+
+def upgrade():
+    # Add denormalized counters to projects
+    for column in COUNTERS:
+        op.add_column('projects', sa.Column(column, sa.Integer(), nullable=False, server_default='0'))
+
+    # Fill them in from the current rows
+    op.execute("""
+        UPDATE projects SET
+            task_count = (SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id),
+            done_task_count = (SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id AND tasks.status = 'Done'),
+            updates_count = (SELECT count(*) FROM weekly_updates WHERE weekly_updates.project_id = projects.id),
+            documents_count = (SELECT count(*) FROM documents WHERE documents.project_id = projects.id),
+            members_count = (SELECT count(*) FROM project_members WHERE project_members.project_id = projects.id)
+    """)
+
+
+def downgrade():
+    for column in reversed(COUNTERS):
+        op.drop_column('projects', column)
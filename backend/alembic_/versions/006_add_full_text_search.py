@@ -0,0 +1,42 @@
+"""add full-text search vectors
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-04-23
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+# Table, index name and weighted (column, weight) pairs of each search vector
+SEARCH_VECTORS = [
+    ('projects', 'ix_projects_search_vector', [('name', 'A'), ('description', 'B')]),
+    ('tasks', 'ix_tasks_search_vector', [('title', 'A'), ('description', 'B')]),
+    ('weekly_updates', 'ix_weekly_updates_search_vector', [('notes', 'A'), ('ai_summary', 'B')]),
+]
+
+
+def upgrade():
+    # Add generated tsvector columns; existing rows are filled in by the database
+    for table, index, weighted_columns in SEARCH_VECTORS:
+        expression = " || ".join(
+            f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+            for column, weight in weighted_columns
+        )
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(), sa.Computed(expression, persisted=True), nullable=True
+        ))
+        op.create_index(index, table, ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    for table, index, _ in reversed(SEARCH_VECTORS):
+        op.drop_index(index, table_name=table)
+        op.drop_column(table, 'search_vector')
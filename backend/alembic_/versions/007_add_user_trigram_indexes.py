@@ -0,0 +1,29 @@
+"""add trigram indexes for user search
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-04-30
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ILIKE '%term%' on name and email (user search and autocomplete)
+    # can only use an index through pg_trgm
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_users_name_trgm', 'users', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_users_email_trgm', 'users', ['email'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_users_email_trgm', table_name='users')
+    op.drop_index('ix_users_name_trgm', table_name='users')
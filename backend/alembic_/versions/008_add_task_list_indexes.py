@@ -0,0 +1,33 @@
+"""add task list indexes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-05-07
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Task lists filter by project or assignee and status, and page through
+    # (due date with undated tasks last, id); see services/task.py
+    due_date_sort = sa.text("COALESCE(due_date, '9999-12-31'::date)")
+    op.create_index('ix_tasks_project_due_date', 'tasks',
+                    ['project_id', due_date_sort, 'id'], unique=False)
+    op.create_index('ix_tasks_project_status_due_date', 'tasks',
+                    ['project_id', 'status', due_date_sort, 'id'], unique=False)
+    op.create_index('ix_tasks_assignee_status_due_date', 'tasks',
+                    ['assigned_to', 'status', due_date_sort, 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tasks_assignee_status_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_project_status_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_project_due_date', table_name='tasks')
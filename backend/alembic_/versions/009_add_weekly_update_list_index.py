@@ -0,0 +1,25 @@
+"""add weekly update list index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-05-14
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # A project's updates are read newest first, by (date, id): the update
+    # list pages through them and the "My work" overview takes the latest
+    op.create_index('ix_weekly_updates_project_date', 'weekly_updates',
+                    ['project_id', 'date', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_weekly_updates_project_date', table_name='weekly_updates')
@@ -0,0 +1,28 @@
+"""add weekly update summary status
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-05-21
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # AI summaries are generated in the background; this tracks their progress
+    op.add_column('weekly_updates', sa.Column('ai_summary_status', sa.String(), nullable=True))
+    # When a worker claimed the summary, so that claims abandoned by a crash can be taken over
+    op.add_column('weekly_updates', sa.Column('ai_summary_started_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE weekly_updates SET ai_summary_status = 'done' WHERE ai_summary IS NOT NULL")
+
+
+def downgrade():
+    op.drop_column('weekly_updates', 'ai_summary_started_at')
+    op.drop_column('weekly_updates', 'ai_summary_status')
@@ -0,0 +1,38 @@
+"""add ai cache entries
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-05-28
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Model responses keyed by a hash of their model and input, so the same
+    # prompt is only paid for once
+    op.create_table(
+        'ai_cache_entries',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('response', sa.Text(), nullable=False),
+        sa.Column('hits', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index('ix_ai_cache_entries_created_at', 'ai_cache_entries', ['created_at'], unique=False)
+    op.create_index('ix_ai_cache_entries_last_used_at', 'ai_cache_entries', ['last_used_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_ai_cache_entries_last_used_at', table_name='ai_cache_entries')
+    op.drop_index('ix_ai_cache_entries_created_at', table_name='ai_cache_entries')
+    op.drop_table('ai_cache_entries')
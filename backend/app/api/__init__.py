@@ -11,6 +11,9 @@ from app.api.password_reset import router as password_reset_router
 from app.api.project_members import router as project_members_router
 from app.api.analytics import router as analytics_router
 from app.api.team import router as team_router
+from app.api.export import router as export_router
+from app.api.search import router as search_router
+from app.api.me import router as me_router
 
 # Main API router
 api_router = APIRouter()
@@ -26,4 +29,7 @@ api_router.include_router(users_router, prefix="/users", tags=["Users"])  # New
 api_router.include_router(password_reset_router, prefix="/password", tags=["Password Reset"])
 api_router.include_router(project_members_router, prefix="/projects", tags=["Project Members"])
 api_router.include_router(team_router, prefix="/team", tags=["Team"])
-api_router.include_router(analytics_router, prefix="/analytics", tags=["Analytics"])
\ No newline at end of file
+api_router.include_router(analytics_router, prefix="/analytics", tags=["Analytics"])
+api_router.include_router(export_router, prefix="/export", tags=["Export"])
+api_router.include_router(search_router, prefix="/search", tags=["Search"])
+api_router.include_router(me_router, prefix="/me", tags=["Me"])
\ No newline at end of file
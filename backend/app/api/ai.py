@@ -4,9 +4,10 @@ from typing import Dict, Any
 
 from app.core.db import get_db
 from app.core.security import get_current_user
-from app.core.config import settings
 from app.models.user import User
 from app.services.ai import predict_project_delay, generate_project_report
+from app.services.ai_cache import ai_cache
+from app.services.ai_providers import ai_circuit, get_ai_provider, require_ai_provider
 from app.services.project import get_project_by_id
 
 router = APIRouter()
@@ -21,11 +22,7 @@ def predict_delay(
     """
     Predict potential project delays using AI analysis
     """
-    if not settings.OPENAI_API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI services are not available"
-        )
+    require_ai_provider()
 
     # Check if project exists
     project = get_project_by_id(db, project_id=project_id)
@@ -47,11 +44,7 @@ def generate_report(
     """
     Generate a comprehensive project status report using AI
     """
-    if not settings.OPENAI_API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI services are not available"
-        )
+    require_ai_provider()
 
     # Check if project exists
     project = get_project_by_id(db, project_id=project_id)
@@ -68,4 +61,49 @@ def generate_report(
             detail="Failed to generate report"
         )
 
-    return {"report": report}
\ No newline at end of file
+    return {"report": report}
+
+
+@router.get("/cache/", response_model=Dict[str, Any])
+def get_ai_cache_stats(
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get AI response cache statistics
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Dictionary with hit/miss and eviction counters of the AI cache
+    """
+    if current_user.role not in ["Admin", "Manager"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to access AI cache statistics"
+        )
+
+    return ai_cache.stats()
+
+
+@router.get("/status/", response_model=Dict[str, Any])
+def get_ai_status(
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get the AI provider and the state of its circuit breaker
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Dictionary with the provider, its model, whether it is available
+        and the circuit breaker state and counters
+    """
+    provider = get_ai_provider()
+    return {
+        "provider": provider.name,
+        "model": provider.model,
+        "available": provider.available() and not ai_circuit.is_open(),
+        "circuit": ai_circuit.stats()
+    }
@@ -1,17 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.core.db import get_db
 from app.core.security import get_current_user
 from app.models.user import User
-from app.services.analytics import get_project_analytics, get_user_analytics
+from app.services.analytics import (
+    get_cached_project_analytics, get_cached_user_analytics, get_cached_dashboard_analytics, analytics_cache
+)
+from app.services.project import get_project_by_id
+from app.services.risk import get_delay_risk
 
 router = APIRouter()
 
 
 @router.get("/projects/", response_model=Dict[str, Any])
 def get_projects_analytics(
+        start: Optional[date] = Query(None, description="First day of the time series"),
+        end: Optional[date] = Query(None, description="Last day of the time series (default: today)"),
+        granularity: str = Query("month", description="Bucket size: day, week, month or quarter"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
@@ -20,11 +28,17 @@ def get_projects_analytics(
 
     This endpoint returns comprehensive analytics for projects including:
     - Status distribution
-    - Monthly progress
+    - Progress per time bucket
     - Delay risk assessment
     - Activity timeline
 
+    Time series cover the last 6 buckets unless a start date is given;
+    every bucket in the range is present, even when empty.
+
     Args:
+        start: First day of the time series
+        end: Last day of the time series
+        granularity: Bucket size of the time series
         db: Database session
         current_user: Current authenticated user
 
@@ -38,7 +52,50 @@ def get_projects_analytics(
             detail="Not enough permissions to access analytics data"
         )
 
-    return get_project_analytics(db)
+    return get_cached_project_analytics(db, start=start, end=end, granularity=granularity)
+
+
+@router.get("/projects/{project_id}/delay-risk/", response_model=Dict[str, Any])
+def get_project_delay_risk(
+        project_id: str,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get the delay risk score of a single project
+
+    Uses the same scoring as the dashboard's delay risk section.
+
+    Args:
+        project_id: Project ID
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Dictionary with the project's risk percentage and risk level
+    """
+    # Verify user has permission to view analytics
+    if current_user.role not in ["Admin", "Manager"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to access analytics data"
+        )
+
+    project = get_project_by_id(db, project_id=project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    scores = get_delay_risk(db, project_ids=[project.id])
+    if not scores:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Project has no valid schedule to score"
+        )
+
+    return scores[0]
 
 
 @router.get("/users/", response_model=Dict[str, Any])
@@ -69,11 +126,14 @@ def get_users_analytics(
             detail="Not enough permissions to access analytics data"
         )
 
-    return get_user_analytics(db)
+    return get_cached_user_analytics(db)
 
 
 @router.get("/dashboard/", response_model=Dict[str, Any])
 def get_analytics_dashboard(
+        start: Optional[date] = Query(None, description="First day of the time series"),
+        end: Optional[date] = Query(None, description="Last day of the time series (default: today)"),
+        granularity: str = Query("month", description="Bucket size: day, week, month or quarter"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
@@ -81,9 +141,14 @@ def get_analytics_dashboard(
     Get complete analytics dashboard data
 
     This endpoint combines project and user analytics into a single response
-    for more efficient dashboard loading.
+    for more efficient dashboard loading. All analytics sections run
+    concurrently on separate connections, and the result is served from the
+    analytics snapshot cache, which is invalidated by writes that change it.
 
     Args:
+        start: First day of the project time series
+        end: Last day of the project time series
+        granularity: Bucket size of the project time series
         db: Database session
         current_user: Current authenticated user
 
@@ -97,11 +162,28 @@ def get_analytics_dashboard(
             detail="Not enough permissions to access analytics data"
         )
 
-    # Get both project and user analytics
-    project_analytics = get_project_analytics(db)
-    user_analytics = get_user_analytics(db)
+    # Get both project and user analytics, computed concurrently
+    return get_cached_dashboard_analytics(db, start=start, end=end, granularity=granularity)
+
+
+@router.get("/cache/", response_model=Dict[str, Any])
+def get_analytics_cache_stats(
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get analytics snapshot cache statistics
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Dictionary with hit/miss counters of the analytics cache
+    """
+    # Verify user has permission to view analytics
+    if current_user.role not in ["Admin", "Manager"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to access analytics data"
+        )
 
-    return {
-        "projects": project_analytics,
-        "users": user_analytics
-    }
\ No newline at end of file
+    return analytics_cache.stats()
@@ -1,8 +1,9 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
+from app.core.pagination import set_next_cursor
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.document import DocumentResponse, DocumentUpdate, DocumentCreate
@@ -46,15 +47,19 @@ async def upload_document(
 @router.get("/projects/{project_id}/documents", response_model=List[DocumentResponse])
 def get_project_documents(
         project_id: str,
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     """
     Get all documents for a project
     """
-    return get_documents_by_project(db, project_id=project_id, skip=skip, limit=limit)
+    documents = get_documents_by_project(db, project_id=project_id, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, documents)
+    return documents
 
 
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
@@ -86,13 +91,6 @@ def update_document_details(
     """
     Update a document (name only)
     """
-    db_document = get_document(db, document_id=document_id)
-    if not db_document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
-
     return update_document(db, document_id=document_id, document=document)
 
 
@@ -105,12 +103,5 @@ def delete_document_endpoint(
     """
     Delete a document
     """
-    db_document = get_document(db, document_id=document_id)
-    if not db_document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
-
     delete_document(db, document_id=document_id)
     return {"detail": "Document successfully deleted"}
\ No newline at end of file
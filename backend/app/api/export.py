@@ -0,0 +1,87 @@
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.services.export import (
+    check_export_format, stream_export, tasks_export_statement,
+    updates_export_statement, analytics_series_export_statement
+)
+
+router = APIRouter()
+
+
+def _check_export_permission(current_user: User) -> None:
+    # Exports expose every project, like the analytics endpoints
+    if current_user.role not in ["Admin", "Manager"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to export data"
+        )
+
+
+def _export_response(db: Session, stmt: Select, export_format: str, name: str) -> StreamingResponse:
+    media_type = check_export_format(export_format)
+    return StreamingResponse(
+        stream_export(db.get_bind(), stmt, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+
+@router.get("/tasks")
+def export_tasks(
+        format: str = Query("ndjson", description="Export format: ndjson or csv"),
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        updated_since: Optional[datetime] = Query(None, description="Only tasks updated at or after this time"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Stream all tasks as NDJSON or CSV
+    """
+    _check_export_permission(current_user)
+    stmt = tasks_export_statement(project_id=project_id, status_filter=status, updated_since=updated_since)
+    return _export_response(db, stmt, format, "tasks")
+
+
+@router.get("/updates")
+def export_updates(
+        format: str = Query("ndjson", description="Export format: ndjson or csv"),
+        project_id: Optional[str] = None,
+        since: Optional[date] = Query(None, description="First update date"),
+        until: Optional[date] = Query(None, description="Last update date"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Stream all weekly updates as NDJSON or CSV
+    """
+    _check_export_permission(current_user)
+    stmt = updates_export_statement(project_id=project_id, since=since, until=until)
+    return _export_response(db, stmt, format, "updates")
+
+
+@router.get("/analytics")
+def export_analytics_series(
+        format: str = Query("ndjson", description="Export format: ndjson or csv"),
+        start: Optional[date] = Query(None, description="First day of the time series"),
+        end: Optional[date] = Query(None, description="Last day of the time series (default: today)"),
+        granularity: str = Query("month", description="Bucket size: day, week, month or quarter"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Stream the analytics time series (tasks added and completed, updates and
+    active projects per bucket) as NDJSON or CSV
+    """
+    _check_export_permission(current_user)
+    stmt = analytics_series_export_statement(start=start, end=end, granularity=granularity)
+    return _export_response(db, stmt, format, "analytics")
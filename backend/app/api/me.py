@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.schemas.overview import MyOverview
+from app.services.overview import get_my_overview
+
+router = APIRouter()
+
+
+@router.get("/overview", response_model=MyOverview)
+def read_my_overview(
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get the current user's projects, open tasks and latest project updates
+
+    Projects come with their progress and latest update; the user's open
+    tasks are grouped per project into due buckets (overdue, today,
+    this_week, later, no_due_date), each listing the first few tasks and
+    the bucket's total.
+    """
+    return get_my_overview(db, user_id=str(current_user.id))
@@ -52,8 +52,7 @@ def update_project_member_role(
     # Update the role
     member.role = role_data.role
     db.add(member)
-    db.commit()
-    db.refresh(member)
+    db.flush()
 
     # Return the updated member
     return {
@@ -1,19 +1,25 @@
+from datetime import date
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
+from app.core.pagination import set_next_cursor
 from app.core.security import get_current_user
 from app.models.user import User
-from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate, ProjectDetailResponse
-from app.schemas.task import TaskResponse
+from app.schemas.project import (
+    ProjectCreate, ProjectResponse, ProjectUpdate, ProjectDetailResponse, BurndownResponse
+)
+from app.schemas.task import TaskImportResult, TaskResponse
 from app.schemas.update import UpdateResponse
 from app.services.project import (
     create_project, get_projects, get_user_projects, get_project_by_id,
     update_project, delete_project, get_project_with_details,
-    add_team_member, remove_team_member, calculate_project_progress
+    add_team_member, remove_team_member, progress_percentage
 )
+from app.services.burndown import get_project_burndown
 from app.services.task import get_tasks_by_project
+from app.services.task_import import import_format, import_tasks
 from app.services.update import get_updates_by_project
 
 router = APIRouter()
@@ -33,10 +39,12 @@ def create_new_project(
 
 @router.get("/", response_model=List[ProjectResponse])
 def read_projects(
+        response: Response,
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
         my_projects: bool = False,
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
@@ -45,15 +53,16 @@ def read_projects(
     """
     if my_projects:
         # Get projects where user is a member
-        projects = get_user_projects(db, user_id=str(current_user.id), skip=skip, limit=limit)
+        projects = get_user_projects(db, user_id=str(current_user.id), skip=skip, limit=limit, cursor=cursor)
     else:
         # Get all projects
-        projects = get_projects(db, skip=skip, limit=limit, status=status)
+        projects = get_projects(db, skip=skip, limit=limit, status=status, cursor=cursor)
 
-    # Calculate progress for each project
+    # Progress comes from the task counters already loaded with each project
     for project in projects:
-        project.progress = calculate_project_progress(db, str(project.id))
+        project.progress = progress_percentage(project.task_count, project.done_task_count)
 
+    set_next_cursor(response, projects)
     return projects
 
 
@@ -105,8 +114,10 @@ def delete_project_endpoint(
 @router.get("/{project_id}/tasks", response_model=List[TaskResponse])
 def read_project_tasks(
         project_id: str,
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
@@ -121,14 +132,37 @@ def read_project_tasks(
             detail="Project not found"
         )
 
-    return get_tasks_by_project(db, project_id=project_id, skip=skip, limit=limit)
+    tasks = get_tasks_by_project(db, project_id=project_id, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, tasks)
+    return tasks
+
+
+@router.post("/{project_id}/tasks/import", response_model=TaskImportResult)
+def import_project_tasks(
+        project_id: str,
+        file: UploadFile = File(..., description="CSV or XLSX file with a header row"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Import tasks into a project from a CSV or XLSX file
+
+    Recognized columns are title, description, status, priority, due_date
+    and assignee_email. Rows that fail validation are skipped and reported
+    by line number; all other rows are imported.
+    """
+    file_format = import_format(file.filename)
+    return import_tasks(db, project_id=project_id, file=file.file, file_format=file_format,
+                        created_by=str(current_user.id))
 
 
 @router.get("/{project_id}/updates", response_model=List[UpdateResponse])
 def read_project_updates(
         project_id: str,
+        response: Response,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
@@ -143,7 +177,23 @@ def read_project_updates(
             detail="Project not found"
         )
 
-    return get_updates_by_project(db, project_id=project_id, skip=skip, limit=limit)
+    updates = get_updates_by_project(db, project_id=project_id, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, updates)
+    return updates
+
+
+@router.get("/{project_id}/burndown", response_model=BurndownResponse)
+def read_project_burndown(
+        project_id: str,
+        start: Optional[date] = Query(None, description="First day of the series (default: project start)"),
+        end: Optional[date] = Query(None, description="Last day of the series (default: today)"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get daily total, completed and remaining task counts for a project
+    """
+    return get_project_burndown(db, project_id=project_id, start=start, end=end)
 
 
 @router.post("/{project_id}/members/{user_id}", status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.pagination import set_next_cursor
+from app.core.security import get_current_user
+from app.models.user import User
+from app.schemas.search import SearchResult
+from app.services.search import search
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[SearchResult])
+def search_everything(
+        response: Response,
+        q: str = Query(..., min_length=1, max_length=200, description="Search query (web search syntax)"),
+        types: Optional[List[str]] = Query(None, description="Result types: project, task, update"),
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Search projects, tasks and weekly updates, best match first
+    """
+    results = search(db, q, kinds=types, project_id=project_id, status_filter=status,
+                      limit=limit, cursor=cursor)
+    set_next_cursor(response, results)
+    return results
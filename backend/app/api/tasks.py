@@ -1,15 +1,17 @@
+from datetime import date
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
+from app.core.pagination import set_next_cursor
 from app.core.security import get_current_user
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.schemas.task import TaskBulkUpdate, TaskCreate, TaskResponse, TaskUpdate
 from app.services.task import (
     create_task, get_task, get_tasks_by_project, get_tasks_by_user,
-    update_task, delete_task
+    update_task, bulk_update_tasks, delete_task
 )
 
 router = APIRouter()
@@ -37,27 +39,55 @@ def create_new_task(
         raise
 
 
+@router.patch("/bulk", response_model=List[TaskResponse])
+def bulk_update_task_details(
+        bulk: TaskBulkUpdate,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Update many tasks at once
+
+    Send `ids` with a `patch` applied to all of them, or `items` with a
+    patch (and `id`) per task. The update is all or nothing.
+    """
+    return bulk_update_tasks(db, bulk=bulk, changed_by=str(current_user.id))
 
 
 @router.get("/", response_model=List[TaskResponse])
 def read_tasks(
+        response: Response,
         project_id: Optional[str] = None,
         assigned_to_me: bool = False,
-        status: Optional[str] = None,
+        status_filter: Optional[str] = Query(None, alias="status", description="Task status"),
+        priority: Optional[str] = Query(None, description="Task priority"),
+        assigned_to: Optional[str] = Query(None, description="Assignee user ID (with project_id)"),
+        due_from: Optional[date] = Query(None, description="Only tasks due on or after this date"),
+        due_to: Optional[date] = Query(None, description="Only tasks due on or before this date"),
+        overdue: bool = Query(False, description="Only open tasks past their due date"),
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
     """
     Get tasks filtered by project or assigned user
+
+    All filters are applied in the database before paging, so every page
+    is full until the last one.
     """
-    if assigned_to_me:
+    filters = dict(status=status_filter, priority=priority, due_from=due_from, due_to=due_to, overdue=overdue)
+
+    if project_id:
+        # Get tasks for a specific project, optionally only those of one assignee
+        assignee = str(current_user.id) if assigned_to_me else assigned_to
+        tasks = get_tasks_by_project(db, project_id=project_id, skip=skip, limit=limit, cursor=cursor,
+                                     assigned_to=assignee, **filters)
+    elif assigned_to_me:
         # Get tasks assigned to current user
-        tasks = get_tasks_by_user(db, user_id=str(current_user.id), skip=skip, limit=limit)
-    elif project_id:
-        # Get tasks for a specific project
-        tasks = get_tasks_by_project(db, project_id=project_id, skip=skip, limit=limit)
+        tasks = get_tasks_by_user(db, user_id=str(current_user.id), skip=skip, limit=limit, cursor=cursor,
+                                  **filters)
     else:
         # Invalid request - need either project_id or assigned_to_me
         raise HTTPException(
@@ -65,10 +95,7 @@ def read_tasks(
             detail="Either project_id or assigned_to_me parameter is required"
         )
 
-    # Filter by status if provided
-    if status and tasks:
-        tasks = [task for task in tasks if task.status == status]
-
+    set_next_cursor(response, tasks)
     return tasks
 
 
@@ -101,14 +128,7 @@ def update_task_details(
     """
     Update a task
     """
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-
-    return update_task(db, task_id=task_id, task=task)
+    return update_task(db, task_id=task_id, task=task, changed_by=str(current_user.id))
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -120,13 +140,6 @@ def delete_task_endpoint(
     """
     Delete a task
     """
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-
     delete_task(db, task_id=task_id)
     return {"detail": "Task successfully deleted"}
 
@@ -141,13 +154,6 @@ def assign_task(
     """
     Assign a task to a user or self (if user_id not provided)
     """
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-
     # Assign to self if user_id not provided
     if not user_id:
         user_id = str(current_user.id)
@@ -1,13 +1,16 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
 from app.core.security import get_current_user
 from app.models.user import User
-from app.schemas.update import UpdateCreate, UpdateResponse, UpdateUpdate
+from app.schemas.update import UpdateCreate, UpdateResponse, UpdateSummaryStatus, UpdateUpdate
 from app.services.update import create_update, get_update, update_update, delete_update
-from app.services.ai import generate_update_summary
+from app.services.ai import ai_available
+from app.services.summaries import (
+    get_batch_summary_progress, get_summary_status, request_update_summary, start_batch_summary
+)
 
 router = APIRouter()
 
@@ -22,24 +25,53 @@ def create_project_update(
 ):
     """
     Create a new weekly update for a project
+
+    The AI summary is generated in the background: the update is returned
+    with ai_summary_status "pending", and its progress is reported by
+    GET /updates/{update_id}/summary.
     """
-    # Create update
-    db_update = create_update(
+    return create_update(
         db=db,
         update=update,
         project_id=project_id,
-        user_id=str(current_user.id)
+        user_id=str(current_user.id),
+        summarize=generate_ai_summary and ai_available()
     )
 
-    # Generate AI summary if requested
-    if generate_ai_summary:
-        ai_summary = generate_update_summary(update.notes)
-        if ai_summary:
-            # Update the record with AI summary
-            update_data = UpdateUpdate(ai_summary=ai_summary)
-            db_update = update_update(db, update_id=str(db_update.id), update=update_data)
 
-    return db_update
+@router.post("/updates/batch-summary", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+def start_update_batch_summary(
+        limit: Optional[int] = Query(None, ge=1, description="Most updates to summarize (default: all)"),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Summarize all updates without an AI summary, several per prompt
+
+    Runs in the background; poll GET /updates/batch-summary for progress.
+    """
+    if current_user.role not in ["Admin", "Manager"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to run batch summarization"
+        )
+
+    return start_batch_summary(limit=limit)
+
+
+@router.get("/updates/batch-summary", response_model=Dict[str, Any])
+def read_update_batch_summary_progress(
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get the progress of the current or last batch summarization
+    """
+    if current_user.role not in ["Admin", "Manager"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to view batch summarization"
+        )
+
+    return get_batch_summary_progress()
 
 
 @router.get("/updates/{update_id}", response_model=UpdateResponse)
@@ -72,21 +104,9 @@ def update_project_update(
     """
     Update a weekly update
     """
-    # Check if update exists
-    db_update = get_update(db, update_id=update_id)
-    if not db_update:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Update not found"
-        )
-
-    # Regenerate AI summary if requested and notes are updated
-    if regenerate_ai_summary and update.notes:
-        ai_summary = generate_update_summary(update.notes)
-        if ai_summary:
-            update.ai_summary = ai_summary
-
-    return update_update(db, update_id=update_id, update=update)
+    # Regenerate AI summary in the background if requested and notes are updated
+    summarize = regenerate_ai_summary and bool(update.notes) and ai_available()
+    return update_update(db, update_id=update_id, update=update, summarize=summarize)
 
 
 @router.delete("/updates/{update_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -98,19 +118,12 @@ def delete_project_update(
     """
     Delete a weekly update
     """
-    # Check if update exists
-    db_update = get_update(db, update_id=update_id)
-    if not db_update:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Update not found"
-        )
-
     delete_update(db, update_id=update_id)
     return {"detail": "Update successfully deleted"}
 
 
-@router.post("/updates/{update_id}/generate-summary", response_model=UpdateResponse)
+@router.post("/updates/{update_id}/generate-summary", response_model=UpdateResponse,
+             status_code=status.HTTP_202_ACCEPTED)
 def generate_update_ai_summary(
         update_id: str,
         db: Session = Depends(get_db),
@@ -118,25 +131,20 @@ def generate_update_ai_summary(
 ):
     """
     Generate or regenerate AI summary for an update
-    """
-    # Check if update exists
-    db_update = get_update(db, update_id=update_id)
-    if not db_update:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Update not found"
-        )
 
-    # Generate AI summary
-    ai_summary = generate_update_summary(db_update.notes)
-    if not ai_summary:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to generate AI summary"
-        )
+    The summary is generated in the background; poll
+    GET /updates/{update_id}/summary for its progress.
+    """
+    return request_update_summary(db, update_id=update_id)
 
-    # Update the record with AI summary
-    update_data = UpdateUpdate(ai_summary=ai_summary)
-    db_update = update_update(db, update_id=update_id, update=update_data)
 
-    return db_update
\ No newline at end of file
+@router.get("/updates/{update_id}/summary", response_model=UpdateSummaryStatus)
+def read_update_summary_status(
+        update_id: str,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Get the progress of an update's AI summary
+    """
+    return get_summary_status(db, update_id=update_id)
@@ -1,19 +1,21 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.db import get_db
 from app.core.security import get_current_user
 from app.models.user import User
-from app.schemas.user import UserResponse, UserCreate, UserUpdate, UserRoleUpdate
+from app.schemas.user import UserResponse, UserCreate, UserUpdate, UserRoleUpdate, UserSuggestion
 from app.services.user import (
     create_user,
     get_user,
     get_users,
     update_user,
     delete_user,
-    update_user_role
+    update_user_role,
+    autocomplete_users,
+    AUTOCOMPLETE_LIMIT
 )
 
 router = APIRouter()
@@ -33,6 +35,19 @@ def read_users(
     return get_users(db=db, skip=skip, limit=limit, role=role)
 
 
+@router.get("/autocomplete", response_model=List[UserSuggestion])
+def autocomplete(
+        q: str = Query(..., max_length=100, description="Text typed so far (name or email)"),
+        limit: int = Query(10, ge=1, le=AUTOCOMPLETE_LIMIT),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Suggest users for a member picker, best matches first
+    """
+    return autocomplete_users(db, q, limit=limit)
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 def read_user(
         user_id: UUID,
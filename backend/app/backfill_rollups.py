@@ -0,0 +1,26 @@
+"""
+Analytics rollup backfill script.
+Run this after applying the rollup migration, or to repair a drifted rollup:
+
+    python -m app.backfill_rollups
+"""
+
+from app.core.db import SessionLocal
+from app.services.rollup import rebuild_rollups
+
+
+def backfill_rollups():
+    db = SessionLocal()
+    try:
+        written = rebuild_rollups(db)
+        db.commit()
+        print(f"Analytics rollup rebuilt with {written} rows.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_rollups()
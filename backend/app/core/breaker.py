@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Any, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing dependency for a while
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    allow() refuses calls for `reset_seconds`. Then a single trial call is
+    let through (half open): its success closes the circuit, its failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.rejected = 0
+        self.opened = 0
+
+    def _reopens_at(self) -> float:
+        return self._opened_at + self.reset_seconds
+
+    def is_open(self) -> bool:
+        """
+        Whether calls are currently refused, without claiming a trial call
+        """
+        with self._lock:
+            if self._state == OPEN:
+                return time.monotonic() < self._reopens_at()
+            return self._state == HALF_OPEN and self._trial_running
+
+    def retry_after(self) -> int:
+        """
+        Seconds until the circuit lets a trial call through
+        """
+        with self._lock:
+            return max(1, int(self._reopens_at() - time.monotonic() + 0.999))
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go ahead; it must then be reported with
+        record_success() or record_failure()
+        """
+        with self._lock:
+            if self._state == OPEN and time.monotonic() >= self._reopens_at():
+                self._state = HALF_OPEN
+                self._trial_running = False
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_ignored(self) -> None:
+        """
+        Report an allowed call whose outcome says nothing about the
+        dependency's health; a half-open circuit stays half open
+        """
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.opened += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        State and counters for monitoring
+        """
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutiveFailures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+                "failureThreshold": self.failure_threshold,
+                "resetSeconds": self.reset_seconds
+            }
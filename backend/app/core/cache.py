@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class SnapshotCache:
+    """
+    Process-local TTL cache for expensive, read-mostly snapshots
+
+    At most one computation runs at a time per key: concurrent callers wait
+    for the running one and reuse its result. Keys share a fixed set of
+    `lock_stripes` locks, so two keys may occasionally wait on each other.
+    A value computed while the cache was being invalidated is returned to
+    its caller but never stored.
+    """
+
+    def __init__(self, ttl_seconds: float, lock_stripes: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, tuple] = {}
+        # Reentrant, in case a computation reads another key of the same stripe
+        self._key_locks = [threading.RLock() for _ in range(lock_stripes)]
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _lookup(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+        return None
+
+    def _purge_expired(self) -> None:
+        # Keys can carry request parameters, so drop stale ones instead of
+        # letting them pile up. Caller holds self._lock.
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry[0] <= now]:
+            del self._entries[key]
+
+    def _key_lock(self, key: Hashable) -> threading.RLock:
+        return self._key_locks[hash(key) % len(self._key_locks)]
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, computing it on a miss
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            with self._key_lock(key):
+                # Another caller may have filled the entry while we waited
+                entry = self._lookup(key)
+                if entry is None:
+                    with self._lock:
+                        self.misses += 1
+                        generation = self._generation
+
+                    value = compute()
+
+                    with self._lock:
+                        if generation == self._generation and self.ttl_seconds > 0:
+                            self._purge_expired()
+                            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                    return value
+
+        with self._lock:
+            self.hits += 1
+        return entry[1]
+
+    def invalidate(self) -> None:
+        """
+        Drop every cached snapshot
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters for monitoring cache effectiveness
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "ttlSeconds": self.ttl_seconds
+            }
+
+
+class LRUCache:
+    """
+    Process-local LRU cache with a TTL
+
+    Holds at most `max_entries` values; the least recently used one is
+    evicted to make room for a new one. Values must not be None, which
+    get() returns on a miss.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store `value` for `key`, evicting the least recently used entries
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop every entry
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters for monitoring cache effectiveness
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttlSeconds": self.ttl_seconds
+            }
@@ -18,6 +18,73 @@ class Settings(BaseSettings):
     # AI settings
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     AI_MODEL: str = "gpt-3.5-turbo"
+    # "openai", or "local" for the deterministic offline backend (tests, benchmarks)
+    AI_PROVIDER: str = os.getenv("AI_PROVIDER", "openai")
+    # Delay added to every AI call, plus up to the jitter, to load-test with realistic timings
+    AI_SIMULATED_LATENCY_SECONDS: float = float(os.getenv("AI_SIMULATED_LATENCY_SECONDS", "0"))
+    AI_SIMULATED_JITTER_SECONDS: float = float(os.getenv("AI_SIMULATED_JITTER_SECONDS", "0"))
+
+    # AI calls: time limit per call, calls (and pooled connections) in
+    # flight at once, how long a call waits for a free slot, and retries of
+    # transient errors with jittered exponential backoff
+    AI_TIMEOUT_SECONDS: float = float(os.getenv("AI_TIMEOUT_SECONDS", "30"))
+    AI_MAX_CONCURRENCY: int = int(os.getenv("AI_MAX_CONCURRENCY", "8"))
+    AI_CONCURRENCY_WAIT_SECONDS: float = float(os.getenv("AI_CONCURRENCY_WAIT_SECONDS", "5"))
+    AI_MAX_RETRIES: int = int(os.getenv("AI_MAX_RETRIES", "2"))
+    AI_RETRY_BACKOFF_SECONDS: float = float(os.getenv("AI_RETRY_BACKOFF_SECONDS", "0.5"))
+    # Consecutive failed AI calls that open the circuit breaker, and how long it stays open
+    AI_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    AI_CIRCUIT_RESET_SECONDS: float = float(os.getenv("AI_CIRCUIT_RESET_SECONDS", "30"))
+
+    # Background update summaries: worker threads, jobs waiting beyond
+    # those, and retries with exponential backoff of a summary refused
+    # because the AI provider was degraded or busy
+    AI_SUMMARY_WORKERS: int = int(os.getenv("AI_SUMMARY_WORKERS", "2"))
+    AI_SUMMARY_QUEUE_SIZE: int = int(os.getenv("AI_SUMMARY_QUEUE_SIZE", "100"))
+    AI_SUMMARY_MAX_RETRIES: int = int(os.getenv("AI_SUMMARY_MAX_RETRIES", "3"))
+    AI_SUMMARY_RETRY_BACKOFF_SECONDS: float = float(os.getenv("AI_SUMMARY_RETRY_BACKOFF_SECONDS", "1.0"))
+    # A summary claimed longer ago than this was abandoned (crash, restart) and may be taken over
+    AI_SUMMARY_STALE_SECONDS: int = int(os.getenv("AI_SUMMARY_STALE_SECONDS", "600"))
+
+    # Batch summarization: updates read per keyset page, and the estimated
+    # input tokens and number of updates packed into one prompt
+    AI_BATCH_PAGE_SIZE: int = int(os.getenv("AI_BATCH_PAGE_SIZE", "500"))
+    AI_BATCH_TOKEN_BUDGET: int = int(os.getenv("AI_BATCH_TOKEN_BUDGET", "3000"))
+    AI_BATCH_MAX_UPDATES: int = int(os.getenv("AI_BATCH_MAX_UPDATES", "20"))
+
+    # Model responses are cached by their input: how long they are reused,
+    # how many are kept in the database, and how many in memory in front of it
+    AI_CACHE_TTL_SECONDS: int = int(os.getenv("AI_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    AI_CACHE_MAX_ENTRIES: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "10000"))
+    AI_CACHE_MEMORY_ENTRIES: int = int(os.getenv("AI_CACHE_MEMORY_ENTRIES", "256"))
+
+    # Analytics settings
+    ANALYTICS_CACHE_TTL_SECONDS: int = int(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "60"))
+    # Maximum analytics sections (and so pooled connections) running at once per request
+    ANALYTICS_MAX_WORKERS: int = int(os.getenv("ANALYTICS_MAX_WORKERS", "4"))
+    # Largest number of buckets a single analytics time series may span
+    ANALYTICS_MAX_BUCKETS: int = int(os.getenv("ANALYTICS_MAX_BUCKETS", "400"))
+    # Longest burndown series, in days, served for a single project
+    BURNDOWN_MAX_DAYS: int = int(os.getenv("BURNDOWN_MAX_DAYS", "1830"))
+
+    # Open tasks listed per project and due bucket on the "My work" overview
+    OVERVIEW_TASKS_PER_BUCKET: int = int(os.getenv("OVERVIEW_TASKS_PER_BUCKET", "5"))
+
+    # Rows fetched per round trip from the server-side cursor of an export
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # Rows parsed, validated and inserted together by a task import
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+
+    # Most tasks a single bulk update may change
+    TASK_BULK_MAX_ITEMS: int = int(os.getenv("TASK_BULK_MAX_ITEMS", "1000"))
+
+    # Delay risk scoring: weight of the schedule/completion gap, points added
+    # per blocked update, and the scores above which risk is Medium / High
+    DELAY_RISK_SCHEDULE_WEIGHT: float = float(os.getenv("DELAY_RISK_SCHEDULE_WEIGHT", "1.0"))
+    DELAY_RISK_BLOCKED_WEIGHT: float = float(os.getenv("DELAY_RISK_BLOCKED_WEIGHT", "0.0"))
+    DELAY_RISK_MEDIUM_THRESHOLD: float = float(os.getenv("DELAY_RISK_MEDIUM_THRESHOLD", "30"))
+    DELAY_RISK_HIGH_THRESHOLD: float = float(os.getenv("DELAY_RISK_HIGH_THRESHOLD", "60"))
 
     # CORS settings
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:8000"]
@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class JobQueue:
+    """
+    Bounded pool of background worker threads with retries
+
+    At most `max_workers` jobs run at once and at most `max_pending` more
+    wait for a worker; submit() refuses jobs beyond that rather than
+    queueing without limit. A job that raises is retried up to
+    `max_retries` times, sleeping `backoff_seconds * 2**attempt` (with
+    jitter) in between; `retry_if`, if given, limits retries to the errors
+    it accepts. Once a job will not be retried `on_failure` is called with
+    its last error.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_pending: int, max_retries: int,
+                 backoff_seconds: float, retry_if: Optional[Callable[[Exception], bool]] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.retry_if = retry_if
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.rejected = 0
+        self.retried = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Threads are only started once the first job comes in
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+            return self._executor
+
+    def submit(self, job: Callable[..., Any], *args: Any,
+               on_failure: Optional[Callable[[Exception], Any]] = None) -> bool:
+        """
+        Queue `job(*args)`, returning False if the queue is full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return False
+
+        with self._lock:
+            self.submitted += 1
+        try:
+            self._get_executor().submit(self._run, job, args, on_failure)
+        except RuntimeError:
+            # Shut down
+            self._slots.release()
+            return False
+        return True
+
+    def _run(self, job: Callable[..., Any], args: tuple, on_failure: Optional[Callable[[Exception], Any]]) -> None:
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    job(*args)
+                except Exception as error:
+                    if attempt == self.max_retries or (self.retry_if is not None and not self.retry_if(error)):
+                        with self._lock:
+                            self.failed += 1
+                        print(f"{self.name} job failed after {attempt + 1} attempts: {error}")
+                        if on_failure is not None:
+                            on_failure(error)
+                        return
+                    with self._lock:
+                        self.retried += 1
+                    time.sleep(self.backoff_seconds * 2 ** attempt * random.uniform(0.5, 1.5))
+                else:
+                    with self._lock:
+                        self.completed += 1
+                    return
+        finally:
+            self._slots.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers; jobs not started yet are dropped, and running
+        ones are waited for when `wait` is True
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Job counters for monitoring the queue
+        """
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "retried": self.retried,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
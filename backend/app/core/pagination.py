@@ -0,0 +1,119 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Query
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class SortKey(NamedTuple):
+    """
+    One component of a keyset sort order
+
+    `expression` is what the query orders by, `value` reads the same value
+    from a result row and `parse` turns its cursor form back into a value.
+    """
+    expression: Any
+    value: Callable[[Any], Any]
+    parse: Callable[[str], Any]
+
+
+class Page(list):
+    """
+    A list of results that also knows the cursor of the next page
+
+    next_cursor is None on the last page.
+    """
+
+    def __init__(self, items: Sequence[Any] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Opaque cursor token for a tuple of sort-key values
+    """
+    payload = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """
+    Sort-key values of a cursor token, raising 400 if it is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(keys):
+            raise ValueError("wrong number of values")
+        return [key.parse(value) for key, value in zip(keys, raw)]
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def paginate(
+        query: Query,
+        keys: Sequence[SortKey],
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        descending: bool = False
+) -> Page:
+    """
+    Fetch one page of `query` ordered by `keys`
+
+    With a cursor, the page starts right after the row the cursor was
+    taken from (a row-value comparison on the sort keys, which an index on
+    those keys can serve). Without one, `skip` is used as a plain offset.
+    Either way the returned page carries the cursor of the next page.
+
+    Args:
+        query: Query to paginate, without ordering or limits
+        keys: Sort keys, ending with a unique column
+        cursor: Cursor token returned with the previous page
+        skip: Offset used when no cursor is given
+        limit: Maximum number of rows in the page
+        descending: Sort all keys in descending order
+
+    Returns:
+        Page of results
+    """
+    expressions = [key.expression for key in keys]
+
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        position = tuple_(*[literal(value, type_=expression.type)
+                            for value, expression in zip(values, expressions)])
+        rows = tuple_(*expressions)
+        query = query.filter(rows < position if descending else rows > position)
+
+    query = query.order_by(*[
+        expression.desc() if descending else expression.asc() for expression in expressions
+    ])
+    if not cursor and skip:
+        query = query.offset(skip)
+
+    # One extra row tells whether there is a next page
+    items = query.limit(limit + 1).all()
+    if len(items) <= limit:
+        return Page(items)
+
+    items = items[:limit]
+    return Page(items, encode_cursor([key.value(items[-1]) for key in keys]))
+
+
+def set_next_cursor(response: Response, page: Page) -> None:
+    """
+    Expose the cursor of the next page in the X-Next-Cursor header
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+def run_sections(
+        db: Session,
+        sections: Dict[Hashable, Callable[[Session], Any]],
+        max_workers: Optional[int] = None
+) -> Dict[Hashable, Any]:
+    """
+    Run independent read-only query sections concurrently
+
+    Each section receives its own session bound to the same engine as `db`,
+    so sections run on separate pooled connections. At most `max_workers`
+    sections run at once for this call (ANALYTICS_MAX_WORKERS by default);
+    with a cap of 1 the sections run one after another on `db` itself.
+
+    Args:
+        db: Request database session
+        sections: Mapping of section key to a callable taking a session
+        max_workers: Concurrency cap for this call
+
+    Returns:
+        Mapping of section key to the section's result
+    """
+    if max_workers is None:
+        max_workers = settings.ANALYTICS_MAX_WORKERS
+
+    if max_workers <= 1 or len(sections) <= 1:
+        return {name: section(db) for name, section in sections.items()}
+
+    bind = db.get_bind()
+
+    def run(section: Callable[[Session], Any]) -> Any:
+        session = Session(bind=bind, autoflush=False)
+        try:
+            return section(session)
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sections)),
+                            thread_name_prefix="analytics-section") as executor:
+        futures = {name: executor.submit(run, section) for name, section in sections.items()}
+        return {name: future.result() for name, future in futures.items()}
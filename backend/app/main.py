@@ -5,6 +5,8 @@ from pathlib import Path
 
 from app.api import api_router
 from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.services.summaries import recover_update_summaries, stop_batch_summary, summary_queue
 
 # Create upload directory if it doesn't exist
 UPLOAD_DIR = Path("uploads")
@@ -24,11 +26,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API router
 app.include_router(api_router, prefix="/api")
 
+@app.on_event("startup")
+def resume_background_jobs():
+    """
+    Queue again the AI summaries a previous run left pending or running
+    """
+    try:
+        recover_update_summaries()
+    except Exception as e:
+        # The API can serve requests without it; summaries stay pending
+        print(f"Error recovering AI summaries: {e}")
+
+@app.on_event("shutdown")
+def stop_background_jobs():
+    """
+    Let running AI summary jobs finish and stop a batch summarization
+    after its current prompt; queued summaries stay pending until the next
+    startup queues them again
+    """
+    stop_batch_summary()
+    summary_queue.shutdown(wait=True)
+
 @app.get("/")
 def read_root():
     """
@@ -5,6 +5,9 @@ from app.models.task import Task
 from app.models.document import Document
 from app.models.project_member import ProjectMember
 from app.models.password_reset import PasswordResetToken
+from app.models.analytics_rollup import AnalyticsDailyRollup
+from app.models.task_transition import TaskStatusTransition
+from app.models.ai_cache import AICacheEntry
 
 # Export all models
 __all__ = [
@@ -15,4 +18,7 @@ __all__ = [
     "Document",
     "ProjectMember",
     "PasswordResetToken",
+    "AnalyticsDailyRollup",
+    "TaskStatusTransition",
+    "AICacheEntry",
 ]
\ No newline at end of file
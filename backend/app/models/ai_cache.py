@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, func
+
+from app.core.db import Base
+
+
+class AICacheEntry(Base):
+    __tablename__ = "ai_cache_entries"
+
+    # sha256 of (model, system prompt, input); see services/ai_cache.py
+    key = Column(String(64), primary_key=True)
+    model = Column(String, nullable=False)
+    response = Column(Text, nullable=False)
+    hits = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Expired and least recently used entries are evicted
+    __table_args__ = (
+        Index('ix_ai_cache_entries_created_at', 'created_at'),
+        Index('ix_ai_cache_entries_last_used_at', 'last_used_at'),
+    )
+
+    def __repr__(self):
+        return f"<AICacheEntry {self.key[:12]} {self.model}>"
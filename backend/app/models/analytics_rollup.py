@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Integer, Date, ForeignKey, Index
+from app.core.utils import UUID
+
+from app.core.db import Base
+
+
+class AnalyticsDailyRollup(Base):
+    __tablename__ = "analytics_daily_rollups"
+
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    metric = Column(String, primary_key=True)  # tasks_created, tasks_completed, updates_created
+    value = Column(Integer, nullable=False, default=0)
+
+    # Analytics scan every project over a date range
+    __table_args__ = (Index('ix_analytics_daily_rollups_day_metric', 'day', 'metric'),)
+
+    def __repr__(self):
+        return f"<AnalyticsDailyRollup {self.project_id} {self.day} {self.metric}={self.value}>"
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Text, Date, ForeignKey, DateTime, func
+from sqlalchemy import Column, String, Text, Date, ForeignKey, DateTime, Integer, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.core.utils import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
 
 from app.core.db import Base
@@ -19,9 +20,27 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Denormalized counters, maintained with every write (see services/counters.py)
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    done_task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    updates_count = Column(Integer, nullable=False, default=0, server_default="0")
+    documents_count = Column(Integer, nullable=False, default=0, server_default="0")
+    members_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Full-text search document, generated by the database (see services/search.py)
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    )))
+
+    __table_args__ = (Index('ix_projects_search_vector', 'search_vector', postgresql_using='gin'),)
+
     # Relationships
     weekly_updates = relationship("WeeklyUpdate", back_populates="project", cascade="all, delete-orphan")
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+    # Read-only: memberships are written through ProjectMember directly
+    members = relationship("ProjectMember", viewonly=True, order_by="ProjectMember.joined_at")
 
     def __repr__(self):
         return f"<Project {self.name}>"
\ No newline at end of file
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, String, Text, Date, ForeignKey, DateTime, func
+from sqlalchemy import Column, String, Text, Date, ForeignKey, DateTime, Computed, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.core.utils import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
+from datetime import date
 
 from app.core.db import Base
 
+# Tasks without a due date sort after all others
+NO_DUE_DATE = date.max
+
 
 class Task(Base):
     __tablename__ = "tasks"
@@ -21,10 +26,28 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Full-text search document, generated by the database (see services/search.py)
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    )))
+
+    __table_args__ = (Index('ix_tasks_search_vector', 'search_vector', postgresql_using='gin'),)
+
     # Relationships
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", foreign_keys=[assigned_to])
     creator = relationship("User", foreign_keys=[created_by])
 
     def __repr__(self):
-        return f"<Task {self.title}>"
\ No newline at end of file
+        return f"<Task {self.title}>"
+
+
+# Task lists filter by project or assignee (and often status) and are
+# ordered by due date, then ID (see services/task.py)
+Index('ix_tasks_project_due_date', Task.project_id, func.coalesce(Task.due_date, NO_DUE_DATE), Task.id)
+Index('ix_tasks_project_status_due_date', Task.project_id, Task.status,
+      func.coalesce(Task.due_date, NO_DUE_DATE), Task.id)
+Index('ix_tasks_assignee_status_due_date', Task.assigned_to, Task.status,
+      func.coalesce(Task.due_date, NO_DUE_DATE), Task.id)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, func
+from app.core.utils import UUID
+import uuid
+
+from app.core.db import Base
+
+
+class TaskStatusTransition(Base):
+    __tablename__ = "task_status_transitions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(String, nullable=True)  # NULL when the task was created
+    to_status = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    changed_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
+    # Burndown series read one project's history in time order
+    __table_args__ = (Index('ix_task_status_transitions_project_changed_at', 'project_id', 'changed_at'),)
+
+    def __repr__(self):
+        return f"<TaskStatusTransition {self.task_id} {self.from_status}->{self.to_status}>"
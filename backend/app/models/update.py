@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Text, Date, ForeignKey, DateTime, func
+from sqlalchemy import Column, String, Text, Date, ForeignKey, DateTime, Computed, Index, func
 from app.core.utils import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 import uuid
 
 from app.core.db import Base
@@ -17,13 +17,29 @@ class WeeklyUpdate(Base):
     status = Column(String, nullable=False)  # Completed, In Progress, Blocked
     notes = Column(Text, nullable=False)
     ai_summary = Column(Text, nullable=True)
+    ai_summary_status = Column(String, nullable=True)  # pending, running, done, failed (see services/summaries.py)
+    ai_summary_started_at = Column(DateTime(timezone=True), nullable=True)  # When a worker claimed the summary
     linked_task_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=True, default=[])  # Add this line
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Full-text search document, generated by the database (see services/search.py)
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(notes, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(ai_summary, '')), 'B')",
+        persisted=True
+    )))
+
+    __table_args__ = (Index('ix_weekly_updates_search_vector', 'search_vector', postgresql_using='gin'),)
+
     # Relationships
     project = relationship("Project", back_populates="weekly_updates")
     user = relationship("User")
 
     def __repr__(self):
-        return f"<WeeklyUpdate {self.date} - {self.status}>"
\ No newline at end of file
+        return f"<WeeklyUpdate {self.date} - {self.status}>"
+
+
+# Update lists and the latest update of a project read a project's updates
+# newest first (see services/update.py and services/overview.py)
+Index('ix_weekly_updates_project_date', WeeklyUpdate.project_id, WeeklyUpdate.date, WeeklyUpdate.id)
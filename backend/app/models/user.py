@@ -22,5 +22,8 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # name and email also have pg_trgm GIN indexes for search (migration 007);
+    # they are not declared here because they need the pg_trgm extension
+
     def __repr__(self):
         return f"<User {self.email}>"
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Project counter reconciliation script.
+Run this to repair project counters that drifted from the source tables:
+
+    python -m app.reconcile_counters
+"""
+
+from app.core.db import SessionLocal
+from app.services.counters import reconcile_project_counters
+
+
+def reconcile_counters():
+    db = SessionLocal()
+    try:
+        corrected = reconcile_project_counters(db)
+        db.commit()
+        print(f"Project counters reconciled, {corrected} projects corrected.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile_counters()
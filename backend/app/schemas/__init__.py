@@ -2,12 +2,15 @@ from app.schemas.user import UserBase, UserCreate, UserUpdate, UserInDB, UserRes
 from app.schemas.project import ProjectBase, ProjectCreate, ProjectUpdate, ProjectInDB, ProjectResponse, \
     ProjectDetailResponse
 from app.schemas.update import UpdateBase, UpdateCreate, UpdateUpdate, UpdateInDB, UpdateResponse, \
-    UpdateWithUserResponse
-from app.schemas.task import TaskBase, TaskCreate, TaskUpdate, TaskInDB, TaskResponse, TaskWithUserResponse
+    UpdateWithUserResponse, UpdateSummaryStatus
+from app.schemas.task import TaskBase, TaskCreate, TaskUpdate, TaskInDB, TaskResponse, TaskWithUserResponse, \
+    TaskBulkItem, TaskBulkUpdate, TaskImportError, TaskImportResult
 from app.schemas.document import DocumentBase, DocumentCreate, DocumentUpdate, DocumentInDB, DocumentResponse, \
     DocumentWithUserResponse
 from app.schemas.password_reset import PasswordResetRequest, PasswordReset
 from app.schemas.project_member import ProjectMemberBase, ProjectMemberCreate, ProjectMemberResponse, ProjectMemberUpdate
+from app.schemas.search import SearchResult
+from app.schemas.overview import OverviewTask, OverviewTaskGroup, OverviewUpdate, OverviewProject, MyOverview
 
 # Export all schemas
 __all__ = [
@@ -19,9 +22,11 @@ __all__ = [
 
     # Update schemas
     "UpdateBase", "UpdateCreate", "UpdateUpdate", "UpdateInDB", "UpdateResponse", "UpdateWithUserResponse",
+    "UpdateSummaryStatus",
 
     # Task schemas
     "TaskBase", "TaskCreate", "TaskUpdate", "TaskInDB", "TaskResponse", "TaskWithUserResponse",
+    "TaskBulkItem", "TaskBulkUpdate", "TaskImportError", "TaskImportResult",
 
     # Document schemas
     "DocumentBase", "DocumentCreate", "DocumentUpdate", "DocumentInDB", "DocumentResponse", "DocumentWithUserResponse",
@@ -29,5 +34,11 @@ __all__ = [
     # Password reset schemas
     "PasswordResetRequest", "PasswordReset",
 
-    "ProjectMemberBase", "ProjectMemberCreate", "ProjectMemberResponse", "ProjectMemberUpdate"
+    "ProjectMemberBase", "ProjectMemberCreate", "ProjectMemberResponse", "ProjectMemberUpdate",
+
+    # Search schemas
+    "SearchResult",
+
+    # Overview schemas
+    "OverviewTask", "OverviewTaskGroup", "OverviewUpdate", "OverviewProject", "MyOverview",
 ]
\ No newline at end of file
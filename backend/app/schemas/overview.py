@@ -0,0 +1,41 @@
+from pydantic import BaseModel, UUID4, Field
+from typing import List, Optional
+from datetime import date
+
+
+class OverviewTask(BaseModel):
+    id: UUID4
+    title: str
+    status: str
+    priority: Optional[str] = None
+    due_date: Optional[date] = None
+
+
+class OverviewTaskGroup(BaseModel):
+    bucket: str = Field(..., description="Due bucket: overdue, today, this_week, later, no_due_date")
+    total: int  # All open tasks in the bucket; tasks holds at most OVERVIEW_TASKS_PER_BUCKET
+    tasks: List[OverviewTask]
+
+
+class OverviewUpdate(BaseModel):
+    id: UUID4
+    date: date
+    status: str
+    author_name: Optional[str] = None
+    summary: Optional[str] = None  # AI summary, or the start of the notes
+
+
+class OverviewProject(BaseModel):
+    id: UUID4
+    name: str
+    status: str
+    end_date: date
+    progress: int
+    is_member: bool
+    open_tasks: int  # Open tasks assigned to the user
+    task_groups: List[OverviewTaskGroup] = []
+    latest_update: Optional[OverviewUpdate] = None
+
+
+class MyOverview(BaseModel):
+    projects: List[OverviewProject]
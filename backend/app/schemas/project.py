@@ -79,6 +79,22 @@ class ProjectDetailResponse(ProjectResponse):
     team_members: List[dict] = []  # List of user info dicts
     task_count: int = 0
     updates_count: int = 0
+    documents_count: int = 0
+    members_count: int = 0
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+class BurndownPoint(BaseModel):
+    date: date
+    total: int
+    completed: int
+    remaining: int
+
+
+class BurndownResponse(BaseModel):
+    project_id: UUID4
+    start_date: date
+    end_date: date
+    points: List[BurndownPoint] = []
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, UUID4, Field
+from typing import Optional
+
+
+class SearchResult(BaseModel):
+    kind: str = Field(..., description="Result type: project, task or update")
+    id: UUID4
+    project_id: UUID4
+    project_name: Optional[str] = None
+    title: str
+    snippet: Optional[str] = None
+    status: Optional[str] = None
+    rank: float
+
+    class Config:
+        orm_mode = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, UUID4, validator, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
 
 
@@ -66,6 +66,40 @@ class TaskUpdate(BaseModel):
         return v
 
 
+class TaskBulkItem(TaskUpdate):
+    id: UUID4
+
+
+class TaskBulkUpdate(BaseModel):
+    """
+    Either the same patch for a list of task IDs, or a patch per task
+    """
+    ids: Optional[List[UUID4]] = None
+    patch: Optional[TaskUpdate] = None
+    items: Optional[List[TaskBulkItem]] = None
+
+    @validator('items', always=True)
+    def one_form_only(cls, v, values):
+        uniform = values.get('ids') is not None or values.get('patch') is not None
+        if uniform and v is not None:
+            raise ValueError('Send either ids with patch, or items, not both')
+        if not uniform and v is None:
+            raise ValueError('Either ids with patch, or items is required')
+        if uniform and (values.get('ids') is None or values.get('patch') is None):
+            raise ValueError('ids and patch must be sent together')
+        return v
+
+
+class TaskImportError(BaseModel):
+    row: int  # Line in the file, the header being line 1
+    detail: str
+
+
+class TaskImportResult(BaseModel):
+    imported: int
+    errors: List[TaskImportError] = []
+
+
 class TaskInDB(TaskBase):
     id: UUID4
     project_id: UUID4
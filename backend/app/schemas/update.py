@@ -59,6 +59,7 @@ class UpdateResponse(UpdateBase):
     project_id: UUID4
     user_id: UUID4
     ai_summary: Optional[str] = None
+    ai_summary_status: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     linked_task_ids: Optional[List[UUID4]] = []  # Add this line
@@ -67,6 +68,12 @@ class UpdateResponse(UpdateBase):
         orm_mode = True
 
 
+class UpdateSummaryStatus(BaseModel):
+    update_id: UUID4
+    status: Optional[str] = Field(None, description="AI summary status: pending, running, done, failed")
+    ai_summary: Optional[str] = None
+
+
 class UpdateWithUserResponse(UpdateResponse):
     user_name: str  # Calculated field
 
@@ -94,6 +94,16 @@ class UserResponse(UserBase):
         orm_mode = True
 
 
+class UserSuggestion(BaseModel):
+    id: UUID4
+    name: str
+    email: str
+    role: Optional[str] = None
+
+    class Config:
+        orm_mode = True
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
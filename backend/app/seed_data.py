@@ -9,6 +9,8 @@ from sqlalchemy.orm import Session
 from app.core.db import SessionLocal
 from app.core.security import get_password_hash
 from app.models import User, Project, WeeklyUpdate, Task, ProjectMember
+from app.services.counters import reconcile_project_counters
+from app.services.rollup import rebuild_rollups
 
 
 def create_users(db: Session):
@@ -412,6 +414,11 @@ def seed_data():
         create_tasks(db)
         create_weekly_updates(db)
 
+        # Seed rows bypass the services, so derive counters and rollups here
+        reconcile_project_counters(db)
+        rebuild_rollups(db)
+        db.commit()
+
         print("Data seeding completed successfully.")
     finally:
         db.close()
@@ -4,7 +4,8 @@ from app.services.project import get_project_by_id, get_projects, get_user_proje
     delete_project, calculate_project_progress, get_project_with_details, add_team_member, remove_team_member
 from app.services.update import get_update, get_updates_by_project, create_update, update_update, delete_update, \
     get_latest_project_update, get_updates_with_user_info
-from app.services.task import get_task, get_tasks_by_project, get_tasks_by_user, create_task, update_task, delete_task, \
+from app.services.task import get_task, get_tasks_by_project, get_tasks_by_user, create_task, update_task, \
+    bulk_update_tasks, delete_task, \
     get_tasks_with_user_info
 from app.services.document import get_document, get_documents_by_project, create_document, update_document, \
     delete_document, get_documents_with_user_info
@@ -24,7 +25,8 @@ __all__ = [
     "get_latest_project_update", "get_updates_with_user_info",
 
     # Task services
-    "get_task", "get_tasks_by_project", "get_tasks_by_user", "create_task", "update_task", "delete_task",
+    "get_task", "get_tasks_by_project", "get_tasks_by_user", "create_task", "update_task", "bulk_update_tasks",
+    "delete_task",
     "get_tasks_with_user_info",
 
     # Document services
@@ -1,89 +1,119 @@
-from typing import Dict, List, Any, Optional
-import os
-from openai import OpenAI
+from typing import Dict, Any, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
 from app.models.update import WeeklyUpdate
 from app.models.task import Task
 from app.models.project import Project
+from app.services.ai_cache import ai_cache
+from app.services.ai_providers import (
+    DELAY_PREDICTION_PROMPT, PROJECT_REPORT_PROMPT, UPDATE_SUMMARY_PROMPT, AIUnavailableError, ai_unavailable,
+    get_ai_provider
+)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+
+def ai_available() -> bool:
+    """
+    Whether the configured AI provider can be called
+    """
+    return get_ai_provider().available()
+
+
+def summarize_update_notes(update_notes: str) -> str:
+    """
+    Summarize weekly update notes with the configured AI provider
+
+    Unlike generate_update_summary, errors are raised so that callers can
+    retry them.
+    """
+    provider = get_ai_provider()
+    return ai_cache.get_or_generate(
+        provider.model, UPDATE_SUMMARY_PROMPT, update_notes,
+        lambda: provider.summarize_update(update_notes)
+    )
 
 
 def generate_update_summary(update_notes: str) -> Optional[str]:
     """
     Generate an AI summary from weekly update notes
     """
-    if not settings.OPENAI_API_KEY:
+    if not ai_available():
         return None
 
     try:
-        response = client.chat.completions.create(
-            model=settings.AI_MODEL,
-            messages=[
-                {"role": "system",
-                 "content": "You are an assistant that summarizes weekly project updates. Create a concise, professional summary highlighting key achievements, challenges, and next steps."},
-                {"role": "user", "content": f"Summarize this project update: {update_notes}"}
-            ],
-            max_tokens=150
-        )
-        return response.choices[0].message.content.strip()
+        return summarize_update_notes(update_notes)
     except Exception as e:
         print(f"Error generating AI summary: {e}")
         return None
 
 
-def predict_project_delay(db: Session, project_id: str) -> Dict[str, Any]:
+def _project_facts(db: Session, project_id: str) -> Optional[Dict[str, Any]]:
     """
-    Analyze project updates and tasks to predict potential delays
+    What the delay prediction and the status report are based on: the
+    project, its task counts by status and its five latest updates
     """
-    if not settings.OPENAI_API_KEY:
-        return {"analysis": "AI analysis not available", "risk_level": "Unknown"}
-
-    # Get project information
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
-        return {"analysis": "Project not found", "risk_level": "Unknown"}
+        return None
 
-    # Get recent updates
     updates = db.query(WeeklyUpdate).filter(
         WeeklyUpdate.project_id == project_id
     ).order_by(WeeklyUpdate.date.desc()).limit(5).all()
 
-    # Get tasks with their status
-    tasks = db.query(Task).filter(
+    status_counts = dict(db.query(Task.status, func.count(Task.id)).filter(
         Task.project_id == project_id
-    ).all()
+    ).group_by(Task.status).all())
+    total_tasks = sum(status_counts.values())
+    completed_tasks = status_counts.get("Done", 0)
+
+    return {
+        "name": project.name,
+        "description": project.description,
+        "start_date": project.start_date,
+        "end_date": project.end_date,
+        "status": project.status,
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "in_progress_tasks": status_counts.get("In Progress", 0),
+        "pending_tasks": status_counts.get("Pending", 0),
+        "completion_percentage": int((completed_tasks / total_tasks) * 100) if total_tasks else 0,
+        "blocked_updates": sum(1 for update in updates if update.status == "Blocked"),
+        "updates": [{"date": update.date, "status": update.status, "notes": update.notes} for update in updates],
+    }
+
+
+def _project_prompt(project: Dict[str, Any], with_completion: bool) -> str:
+    # The facts as text for a language model; also the AI cache input
+    updates_text = "\n".join([f"Date: {update['date']}, Status: {update['status']}\n{update['notes']}"
+                              for update in project["updates"]])
+    project_info = f"Project: {project['name']}\nDescription: {project['description']}\nStart date: {project['start_date']}\nEnd date: {project['end_date']}\nStatus: {project['status']}"
+    if with_completion:
+        project_info += f"\nCompletion: {project['completion_percentage']}%"
+    tasks_info = f"Total tasks: {project['total_tasks']}\nCompleted: {project['completed_tasks']}\nIn progress: {project['in_progress_tasks']}\nPending: {project['pending_tasks']}"
+
+    return f"{project_info}\n\n{tasks_info}\n\nRecent updates:\n{updates_text}"
+
 
-    # Calculate task statistics
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for task in tasks if task.status == "Done")
-    in_progress_tasks = sum(1 for task in tasks if task.status == "In Progress")
-    pending_tasks = sum(1 for task in tasks if task.status == "Pending")
+def predict_project_delay(db: Session, project_id: str) -> Dict[str, Any]:
+    """
+    Analyze project updates and tasks to predict potential delays
+    """
+    provider = get_ai_provider()
+    if not provider.available():
+        return {"analysis": "AI analysis not available", "risk_level": "Unknown"}
 
-    # Prepare data for analysis
-    updates_text = "\n".join([f"Date: {update.date}, Status: {update.status}\n{update.notes}" for update in updates])
-    project_info = f"Project: {project.name}\nDescription: {project.description}\nStart date: {project.start_date}\nEnd date: {project.end_date}\nStatus: {project.status}"
-    tasks_info = f"Total tasks: {total_tasks}\nCompleted: {completed_tasks}\nIn progress: {in_progress_tasks}\nPending: {pending_tasks}"
+    project = _project_facts(db, project_id)
+    if not project:
+        return {"analysis": "Project not found", "risk_level": "Unknown"}
 
-    # Combine all information
-    analysis_input = f"{project_info}\n\n{tasks_info}\n\nRecent updates:\n{updates_text}"
+    analysis_input = _project_prompt(project, with_completion=False)
 
     try:
-        response = client.chat.completions.create(
-            model=settings.AI_MODEL,
-            messages=[
-                {"role": "system",
-                 "content": "You are an AI specialized in project management. Analyze this project information and identify potential risks of delay. Provide a percentage risk of delay and detailed explanation."},
-                {"role": "user", "content": f"Analyze for delay risks: {analysis_input}"}
-            ],
-            max_tokens=500
+        analysis = ai_cache.get_or_generate(
+            provider.model, DELAY_PREDICTION_PROMPT, analysis_input,
+            lambda: provider.analyze_delay(project, analysis_input)
         )
 
-        analysis = response.choices[0].message.content.strip()
-
         # Determine risk level based on analysis content
         risk_level = "Medium"  # Default
         if "high risk" in analysis.lower() or "significant risk" in analysis.lower():
@@ -95,6 +125,8 @@ def predict_project_delay(db: Session, project_id: str) -> Dict[str, Any]:
             "analysis": analysis,
             "risk_level": risk_level
         }
+    except AIUnavailableError as e:
+        raise ai_unavailable(str(e))
     except Exception as e:
         print(f"Error predicting delays: {e}")
         return {"analysis": "Unable to generate prediction", "risk_level": "Unknown"}
@@ -104,55 +136,23 @@ def generate_project_report(db: Session, project_id: str) -> Optional[str]:
     """
     Generate a comprehensive project status report
     """
-    if not settings.OPENAI_API_KEY:
+    provider = get_ai_provider()
+    if not provider.available():
         return None
 
-    # Get project information
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = _project_facts(db, project_id)
     if not project:
         return None
 
-    # Get recent updates
-    updates = db.query(WeeklyUpdate).filter(
-        WeeklyUpdate.project_id == project_id
-    ).order_by(WeeklyUpdate.date.desc()).limit(5).all()
-
-    # Get tasks with their status
-    tasks = db.query(Task).filter(
-        Task.project_id == project_id
-    ).all()
-
-    # Calculate task statistics
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for task in tasks if task.status == "Done")
-    in_progress_tasks = sum(1 for task in tasks if task.status == "In Progress")
-    pending_tasks = sum(1 for task in tasks if task.status == "Pending")
-
-    # Calculate completion percentage
-    completion_percentage = 0
-    if total_tasks > 0:
-        completion_percentage = int((completed_tasks / total_tasks) * 100)
-
-    # Prepare data for report
-    updates_text = "\n".join([f"Date: {update.date}, Status: {update.status}\n{update.notes}" for update in updates])
-    project_info = f"Project: {project.name}\nDescription: {project.description}\nStart date: {project.start_date}\nEnd date: {project.end_date}\nStatus: {project.status}\nCompletion: {completion_percentage}%"
-    tasks_info = f"Total tasks: {total_tasks}\nCompleted: {completed_tasks}\nIn progress: {in_progress_tasks}\nPending: {pending_tasks}"
-
-    # Combine all information
-    report_input = f"{project_info}\n\n{tasks_info}\n\nRecent updates:\n{updates_text}"
+    report_input = _project_prompt(project, with_completion=True)
 
     try:
-        response = client.chat.completions.create(
-            model=settings.AI_MODEL,
-            messages=[
-                {"role": "system",
-                 "content": "You are an AI specialized in project management reporting. Create a professional, comprehensive project status report based on the data provided. Include achievements, challenges, current status, and next steps."},
-                {"role": "user", "content": f"Generate status report for: {report_input}"}
-            ],
-            max_tokens=1000
+        return ai_cache.get_or_generate(
+            provider.model, PROJECT_REPORT_PROMPT, report_input,
+            lambda: provider.write_report(project, report_input)
         )
-
-        return response.choices[0].message.content.strip()
+    except AIUnavailableError as e:
+        raise ai_unavailable(str(e))
     except Exception as e:
         print(f"Error generating project report: {e}")
-        return None
\ No newline at end of file
+        return None
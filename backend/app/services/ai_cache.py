@@ -0,0 +1,139 @@
+import hashlib
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.models.ai_cache import AICacheEntry
+
+
+def cache_key(model: str, system_prompt: str, prompt: str) -> str:
+    """
+    Content address of a model call: sha256 of its model and full input
+    """
+    digest = hashlib.sha256()
+    for part in (model, system_prompt, prompt):
+        encoded = part.encode("utf-8")
+        # Length prefixes keep ("ab", "c") and ("a", "bc") apart
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class AIResponseCache:
+    """
+    Two-level cache of model responses keyed by their input
+
+    Lookups try an in-process LRU first, then the ai_cache_entries table,
+    which is shared by all workers and survives restarts. Entries expire
+    `ttl_seconds` after they were generated; beyond `max_entries` the least
+    recently used rows are deleted. The table is read and written in a
+    session of its own, so a cached response outlives a request that rolls
+    back after paying for it.
+    """
+
+    def __init__(self, memory_entries: int, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.memory = LRUCache(max_entries=memory_entries, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self.db_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _cutoff(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+
+    def _load(self, db: Session, key: str) -> Optional[str]:
+        # Looks the entry up and marks it used in one statement
+        stmt = update(AICacheEntry).where(
+            AICacheEntry.key == key, AICacheEntry.created_at > self._cutoff()
+        ).values(
+            hits=AICacheEntry.hits + 1, last_used_at=func.now()
+        ).returning(AICacheEntry.response)
+        return db.execute(stmt.execution_options(synchronize_session=False)).scalar_one_or_none()
+
+    def _store(self, db: Session, key: str, model: str, response: str) -> None:
+        stmt = insert(AICacheEntry).values(key=key, model=model, response=response, hits=0)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AICacheEntry.key],
+            set_={"response": stmt.excluded.response, "hits": 0,
+                  "created_at": func.now(), "last_used_at": func.now()}
+        )
+        db.execute(stmt)
+        self._evict(db)
+
+    def _evict(self, db: Session) -> None:
+        # Runs after each miss, which costs a model call, so it is cheap in comparison
+        expired = db.execute(delete(AICacheEntry).where(AICacheEntry.created_at <= self._cutoff()))
+        overflow = select(AICacheEntry.key).order_by(
+            AICacheEntry.last_used_at.desc()
+        ).offset(self.max_entries).scalar_subquery()
+        evicted = db.execute(delete(AICacheEntry).where(AICacheEntry.key.in_(overflow)))
+        with self._lock:
+            self.evictions += expired.rowcount + evicted.rowcount
+
+    def get_or_generate(self, model: str, system_prompt: str, prompt: str, generate: Callable[[], str]) -> str:
+        """
+        Return the cached response to this input, calling `generate` on a miss
+
+        Errors raised by `generate` propagate and nothing is cached.
+        """
+        if self.ttl_seconds <= 0:
+            return generate()
+
+        key = cache_key(model, system_prompt, prompt)
+        response = self.memory.get(key)
+        if response is not None:
+            return response
+
+        with SessionLocal() as db:
+            response = self._load(db, key)
+            db.commit()
+        if response is not None:
+            with self._lock:
+                self.db_hits += 1
+            self.memory.set(key, response)
+            return response
+
+        with self._lock:
+            self.misses += 1
+        response = generate()
+
+        with SessionLocal() as db:
+            self._store(db, key, model, response)
+            db.commit()
+        self.memory.set(key, response)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters of both cache levels
+        """
+        memory = self.memory.stats()
+        with self._lock:
+            lookups = memory["hits"] + self.db_hits + self.misses
+            return {
+                "memoryHits": memory["hits"],
+                "dbHits": self.db_hits,
+                "misses": self.misses,
+                "hitRate": round((memory["hits"] + self.db_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "memoryEntries": memory["entries"],
+                "memoryEvictions": memory["evictions"],
+                "maxEntries": self.max_entries,
+                "ttlSeconds": self.ttl_seconds
+            }
+
+
+ai_cache = AIResponseCache(
+    memory_entries=settings.AI_CACHE_MEMORY_ENTRIES,
+    max_entries=settings.AI_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AI_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,410 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, status
+
+from app.core.breaker import CircuitBreaker
+from app.core.config import settings
+from app.services.risk import score_delay_risk
+
+# System prompts of the three AI features
+UPDATE_SUMMARY_PROMPT = "You are an assistant that summarizes weekly project updates. Create a concise, professional summary highlighting key achievements, challenges, and next steps."
+DELAY_PREDICTION_PROMPT = "You are an AI specialized in project management. Analyze this project information and identify potential risks of delay. Provide a percentage risk of delay and detailed explanation."
+BATCH_SUMMARY_PROMPT = "You are an assistant that summarizes weekly project updates. You receive several numbered updates. For each one, write a concise, professional summary highlighting key achievements, challenges, and next steps. Reply with only a JSON array of strings: one summary per update, in the same order."
+PROJECT_REPORT_PROMPT = "You are an AI specialized in project management reporting. Create a professional, comprehensive project status report based on the data provided. Include achievements, challenges, current status, and next steps."
+
+# Sentences kept by the local provider's update summaries
+LOCAL_SUMMARY_SENTENCES = 3
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"[a-z][a-z'-]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be been but by for from has have in into is it its of on or our so that the their "
+    "this to was we were will with".split()
+)
+
+
+class AIProvider:
+    """
+    Backend of the AI features
+
+    `project` arguments are the facts gathered by services/ai.py (name,
+    dates, task counts, recent updates); `prompt` is the same data
+    rendered as the text sent to a language model.
+    """
+    name = "base"
+    model = "base"
+
+    def available(self) -> bool:
+        return True
+
+    def summarize_update(self, notes: str) -> str:
+        raise NotImplementedError
+
+    def summarize_updates(self, notes: List[str]) -> List[str]:
+        """
+        Summaries of several updates, in order; providers that can answer
+        them all in one call override this
+        """
+        return [self.summarize_update(text) for text in notes]
+
+    def analyze_delay(self, project: Dict[str, Any], prompt: str) -> str:
+        raise NotImplementedError
+
+    def write_report(self, project: Dict[str, Any], prompt: str) -> str:
+        raise NotImplementedError
+
+
+class OpenAIProvider(AIProvider):
+    """
+    OpenAI chat completions
+
+    The client is created on first use rather than at import, so the
+    application starts, and the other providers work, without the openai
+    package or an API key. All threads share it and its pool of at most
+    `max_connections` HTTP connections; every call is bounded by
+    `timeout_seconds`, and retries are left to ResilientProvider.
+    """
+    name = "openai"
+
+    def __init__(self, api_key: str, model: str, timeout_seconds: float, max_connections: int):
+        self.api_key = api_key
+        self.model = model
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self._client = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                import httpx
+                from openai import OpenAI
+                http_client = httpx.Client(
+                    limits=httpx.Limits(max_connections=self.max_connections,
+                                        max_keepalive_connections=self.max_connections),
+                    timeout=self.timeout_seconds
+                )
+                self._client = OpenAI(api_key=self.api_key, http_client=http_client, max_retries=0,
+                                      timeout=self.timeout_seconds)
+            return self._client
+
+    def _chat(self, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        response = self._get_client().chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            timeout=self.timeout_seconds
+        )
+        return response.choices[0].message.content.strip()
+
+    def summarize_update(self, notes: str) -> str:
+        return self._chat(UPDATE_SUMMARY_PROMPT, f"Summarize this project update: {notes}", max_tokens=150)
+
+    def summarize_updates(self, notes: List[str]) -> List[str]:
+        prompt = "\n\n".join(f"Update {number}:\n{text}" for number, text in enumerate(notes, start=1))
+        answer = self._chat(BATCH_SUMMARY_PROMPT, prompt, max_tokens=150 * len(notes))
+        summaries = json.loads(answer[answer.find("["):answer.rfind("]") + 1] or "null")
+        if not isinstance(summaries, list) or len(summaries) != len(notes):
+            raise ValueError(f"Expected {len(notes)} summaries from the model")
+        return [str(summary).strip() for summary in summaries]
+
+    def analyze_delay(self, project: Dict[str, Any], prompt: str) -> str:
+        return self._chat(DELAY_PREDICTION_PROMPT, f"Analyze for delay risks: {prompt}", max_tokens=500)
+
+    def write_report(self, project: Dict[str, Any], prompt: str) -> str:
+        return self._chat(PROJECT_REPORT_PROMPT, f"Generate status report for: {prompt}", max_tokens=1000)
+
+
+def extractive_summary(text: str, max_sentences: int = LOCAL_SUMMARY_SENTENCES) -> str:
+    """
+    The `max_sentences` most representative sentences of `text`, in order
+
+    Sentences are scored by the average frequency, across the whole text,
+    of their non-stopword words.
+    """
+    sentences = [sentence for sentence in _SENTENCE_END.split(" ".join(text.split())) if sentence]
+    if len(sentences) <= max_sentences:
+        return " ".join(sentences)
+
+    frequencies = Counter(word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS)
+
+    def score(index: int) -> float:
+        words = [word for word in _WORD.findall(sentences[index].lower()) if word not in _STOPWORDS]
+        return sum(frequencies[word] for word in words) / len(words) if words else 0.0
+
+    best = sorted(range(len(sentences)), key=lambda index: (-score(index), index))[:max_sentences]
+    return " ".join(sentences[index] for index in sorted(best))
+
+
+class LocalProvider(AIProvider):
+    """
+    Deterministic offline backend
+
+    Summaries are extractive, delay risk comes from the same schedule
+    heuristic as the analytics (services/risk.py) and reports are filled
+    in from a template. Used for tests, benchmarks and development without
+    network access.
+    """
+    name = "local"
+    model = "local-extractive"
+
+    def summarize_update(self, notes: str) -> str:
+        return extractive_summary(notes)
+
+    def _risk(self, project: Dict[str, Any]) -> str:
+        if not project["start_date"] or not project["end_date"]:
+            return "Medium risk of delay: the project has no complete schedule."
+
+        scores = score_delay_risk(
+            [project["start_date"]], [project["end_date"]], [project["total_tasks"]],
+            [project["completed_tasks"]], [project["blocked_updates"]]
+        )
+        if not scores["valid"][0]:
+            return "Medium risk of delay: the project has no complete schedule."
+        return f"{scores['risk'][0]} risk of delay, estimated at {int(scores['riskPercentage'][0])}%."
+
+    def analyze_delay(self, project: Dict[str, Any], prompt: str) -> str:
+        return (
+            f"{self._risk(project)} {project['completed_tasks']} of {project['total_tasks']} tasks are done, "
+            f"{project['in_progress_tasks']} in progress and {project['pending_tasks']} pending; "
+            f"{project['blocked_updates']} of the last {len(project['updates'])} updates report a blocker."
+        )
+
+    def write_report(self, project: Dict[str, Any], prompt: str) -> str:
+        lines: List[str] = [
+            f"Status report: {project['name']}",
+            "",
+            f"Status: {project['status']}. Schedule: {project['start_date']} to {project['end_date']}.",
+            f"Completion: {project['completion_percentage']}% ({project['completed_tasks']} of "
+            f"{project['total_tasks']} tasks done, {project['in_progress_tasks']} in progress, "
+            f"{project['pending_tasks']} pending).",
+            self._risk(project),
+            "",
+            "Recent updates:",
+        ]
+        for update in project["updates"]:
+            lines.append(f"- {update['date']} ({update['status']}): {extractive_summary(update['notes'], 1)}")
+        if not project["updates"]:
+            lines.append("- None")
+        return "\n".join(lines)
+
+
+class SimulatedLatencyProvider(AIProvider):
+    """
+    Wraps a provider, delaying every call by `latency_seconds` plus up to
+    `jitter_seconds`, to load-test the AI paths with realistic timings
+
+    A call whose delay exceeds `timeout_seconds` waits that long and then
+    raises TimeoutError, like a client timeout against a slow provider.
+    """
+
+    def __init__(self, provider: AIProvider, latency_seconds: float, jitter_seconds: float = 0.0,
+                 timeout_seconds: float = float("inf")):
+        self.provider = provider
+        self.name = provider.name
+        self.model = provider.model
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.timeout_seconds = timeout_seconds
+
+    def available(self) -> bool:
+        return self.provider.available()
+
+    def _wait(self) -> None:
+        delay = self.latency_seconds + random.uniform(0, self.jitter_seconds)
+        if delay > self.timeout_seconds:
+            time.sleep(self.timeout_seconds)
+            raise TimeoutError(f"Simulated AI call timed out after {self.timeout_seconds}s")
+        time.sleep(delay)
+
+    def summarize_update(self, notes: str) -> str:
+        self._wait()
+        return self.provider.summarize_update(notes)
+
+    def summarize_updates(self, notes: List[str]) -> List[str]:
+        self._wait()
+        return self.provider.summarize_updates(notes)
+
+    def analyze_delay(self, project: Dict[str, Any], prompt: str) -> str:
+        self._wait()
+        return self.provider.analyze_delay(project, prompt)
+
+    def write_report(self, project: Dict[str, Any], prompt: str) -> str:
+        self._wait()
+        return self.provider.write_report(project, prompt)
+
+
+class AIUnavailableError(Exception):
+    """
+    Raised instead of calling the provider while it is degraded or busy
+    """
+
+
+@lru_cache(maxsize=None)
+def _transport_errors() -> tuple:
+    # Client libraries are only imported if installed and once an error occurs
+    errors = [TimeoutError, ConnectionError]
+    try:
+        import httpx
+        errors.append(httpx.TransportError)
+    except ImportError:
+        pass
+    try:
+        import openai
+        errors.append(openai.APIConnectionError)  # Includes APITimeoutError
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+def _is_transient(error: Exception) -> bool:
+    # Only timeouts, connection errors, rate limits and server errors are
+    # worth retrying. Other HTTP errors mean the provider is up but refused
+    # the call, and anything else (a malformed answer, a bug) would fail again.
+    if isinstance(error, _transport_errors()):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+class ResilientProvider(AIProvider):
+    """
+    Bounds and protects the calls to a provider
+
+    At most `max_concurrency` calls run at once across all threads; a call
+    that cannot start within `wait_seconds` fails with AIUnavailableError
+    instead of queueing. Transient errors are retried up to `max_retries`
+    times with full-jitter exponential backoff, and feed `breaker`: while
+    it is open, calls fail fast with AIUnavailableError.
+    """
+
+    def __init__(self, provider: AIProvider, breaker: CircuitBreaker, max_concurrency: int,
+                 wait_seconds: float, max_retries: int, backoff_seconds: float):
+        self.provider = provider
+        self.name = provider.name
+        self.model = provider.model
+        self.breaker = breaker
+        self.wait_seconds = wait_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def available(self) -> bool:
+        return self.provider.available()
+
+    def _call(self, method, *args) -> Any:
+        if not self._slots.acquire(timeout=self.wait_seconds):
+            raise AIUnavailableError("Too many AI requests in progress")
+        try:
+            for attempt in range(self.max_retries + 1):
+                if not self.breaker.allow():
+                    raise AIUnavailableError("AI services are temporarily unavailable")
+                try:
+                    result = method(*args)
+                except Exception as error:
+                    if not _is_transient(error):
+                        # Says nothing about the provider being degraded
+                        self.breaker.record_ignored()
+                        raise
+                    self.breaker.record_failure()
+                    if attempt == self.max_retries:
+                        raise
+                    time.sleep(random.uniform(0, self.backoff_seconds * 2 ** attempt))
+                else:
+                    self.breaker.record_success()
+                    return result
+        finally:
+            self._slots.release()
+
+    def summarize_update(self, notes: str) -> str:
+        return self._call(self.provider.summarize_update, notes)
+
+    def summarize_updates(self, notes: List[str]) -> List[str]:
+        return self._call(self.provider.summarize_updates, notes)
+
+    def analyze_delay(self, project: Dict[str, Any], prompt: str) -> str:
+        return self._call(self.provider.analyze_delay, project, prompt)
+
+    def write_report(self, project: Dict[str, Any], prompt: str) -> str:
+        return self._call(self.provider.write_report, project, prompt)
+
+
+# Shared by every thread calling the provider
+ai_circuit = CircuitBreaker(
+    failure_threshold=settings.AI_CIRCUIT_FAILURE_THRESHOLD,
+    reset_seconds=settings.AI_CIRCUIT_RESET_SECONDS,
+)
+
+AI_PROVIDERS = ("openai", "local")
+
+
+@lru_cache(maxsize=None)
+def get_ai_provider() -> AIProvider:
+    """
+    The provider selected by Settings.AI_PROVIDER, built on first use
+    """
+    if settings.AI_PROVIDER == "openai":
+        provider: AIProvider = OpenAIProvider(
+            api_key=settings.OPENAI_API_KEY, model=settings.AI_MODEL,
+            timeout_seconds=settings.AI_TIMEOUT_SECONDS, max_connections=settings.AI_MAX_CONCURRENCY
+        )
+    elif settings.AI_PROVIDER == "local":
+        provider = LocalProvider()
+    else:
+        raise ValueError(f"AI_PROVIDER must be one of {list(AI_PROVIDERS)}, not {settings.AI_PROVIDER!r}")
+
+    if settings.AI_SIMULATED_LATENCY_SECONDS > 0 or settings.AI_SIMULATED_JITTER_SECONDS > 0:
+        provider = SimulatedLatencyProvider(
+            provider, settings.AI_SIMULATED_LATENCY_SECONDS, settings.AI_SIMULATED_JITTER_SECONDS,
+            timeout_seconds=settings.AI_TIMEOUT_SECONDS
+        )
+
+    return ResilientProvider(
+        provider, ai_circuit,
+        max_concurrency=settings.AI_MAX_CONCURRENCY,
+        wait_seconds=settings.AI_CONCURRENCY_WAIT_SECONDS,
+        max_retries=settings.AI_MAX_RETRIES,
+        backoff_seconds=settings.AI_RETRY_BACKOFF_SECONDS,
+    )
+
+
+def ai_unavailable(detail: str) -> HTTPException:
+    """
+    503 for an AI request refused while the provider is degraded
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=detail,
+        headers={"Retry-After": str(ai_circuit.retry_after())}
+    )
+
+
+def require_ai_provider() -> AIProvider:
+    """
+    The configured provider, or a 503 if it cannot be called
+
+    Fails fast while the circuit breaker is open, before any other work
+    is done for the request.
+    """
+    provider = get_ai_provider()
+    if not provider.available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI services are not available"
+        )
+    if ai_circuit.is_open():
+        raise ai_unavailable("AI services are temporarily unavailable")
+    return provider
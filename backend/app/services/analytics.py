@@ -1,170 +1,356 @@
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct, extract, text
-from datetime import datetime, timedelta
+from sqlalchemy import func, distinct, extract, text, select, cast, literal_column, Date, DateTime, Select
+from datetime import date, datetime, timedelta
 
+from app.core.cache import SnapshotCache
+from app.core.config import settings
+from app.core.db import on_commit
+from app.core.parallel import run_sections
 from app.models.project import Project
 from app.models.user import User
 from app.models.task import Task
 from app.models.update import WeeklyUpdate
 from app.models.project_member import ProjectMember
+from app.models.analytics_rollup import AnalyticsDailyRollup
+from app.services.risk import get_delay_risk
+from app.services.rollup import TASKS_CREATED, TASKS_COMPLETED, UPDATES_CREATED
 
 
-def get_project_analytics(db: Session) -> Dict[str, Any]:
+# Supported bucket sizes for time series, with the interval between buckets
+GRANULARITY_STEPS = {
+    "day": "1 day",
+    "week": "1 week",
+    "month": "1 month",
+    "quarter": "3 months",
+}
+
+# Number of buckets shown when no start date is given
+DEFAULT_BUCKETS = 6
+
+# Snapshots of project, user and dashboard analytics shared by the analytics endpoints.
+# The cache is per process; each worker keeps its own copy.
+analytics_cache = SnapshotCache(ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS)
+
+
+def invalidate_analytics(db: Session) -> None:
     """
-    Generate analytics data for projects
+    Drop cached analytics once the current transaction commits
 
-    Args:
-        db: Database session
+    Call this from any write that changes the numbers shown on the
+    analytics dashboard.
+    """
+    on_commit(db, analytics_cache.invalidate)
 
-    Returns:
-        Dictionary containing various project analytics metrics
+
+def get_cached_project_analytics(
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: str = "month"
+) -> Dict[str, Any]:
+    """
+    Project analytics served from the snapshot cache
     """
-    # Get current date
-    now = datetime.now()
+    start, end = resolve_time_range(start, end, granularity)
+    return analytics_cache.get_or_compute(
+        ("projects", start, end, granularity),
+        lambda: get_project_analytics(db, start=start, end=end, granularity=granularity)
+    )
 
-    # Get project status distribution
-    status_distribution = []
-    for status in ['Active', 'Completed', 'On Hold']:
-        count = db.query(func.count(Project.id)).filter(Project.status == status).scalar()
-        status_distribution.append({"name": status, "value": count or 0})
 
-    # Get monthly progress for the last 6 months
-    monthly_progress = []
-    for i in range(5, -1, -1):
-        month_date = now - timedelta(days=30 * i)
-        month_name = month_date.strftime("%b")
-
-        # Get tasks completed in this month
-        completed_tasks = db.query(func.count(Task.id)).filter(
-            Task.status == "Done",
-            extract('month', Task.updated_at) == month_date.month,
-            extract('year', Task.updated_at) == month_date.year
-        ).scalar() or 0
-
-        # Get tasks added in this month
-        added_tasks = db.query(func.count(Task.id)).filter(
-            extract('month', Task.created_at) == month_date.month,
-            extract('year', Task.created_at) == month_date.year
-        ).scalar() or 0
-
-        # Get active projects in this month
-        active_projects = db.query(func.count(Project.id)).filter(
-            Project.status == "Active",
-            Project.start_date <= month_date,
-            (Project.end_date >= month_date) | (Project.end_date.is_(None))
-        ).scalar() or 0
+def get_cached_user_analytics(db: Session) -> Dict[str, Any]:
+    """
+    User analytics served from the snapshot cache
+    """
+    return analytics_cache.get_or_compute("users", lambda: get_user_analytics(db))
 
-        monthly_progress.append({
-            "month": month_name,
-            "completed": completed_tasks,
-            "added": added_tasks,
-            "activeProjects": active_projects
-        })
 
-    # Project delay risk assessment
-    # This would typically involve complex logic based on:
-    # - Project timeline vs progress
-    # - Task completion rates
-    # - Blockers reported in updates
-    # Here's a simplified version
-    projects = db.query(Project).filter(Project.status == "Active").all()
-    delay_risk = []
-
-    for project in projects:
-        # Calculate a simple risk percentage based on:
-        # - Time elapsed vs. progress made
-        # - Number of blocked tasks
-        today = datetime.now().date()
-
-        if project.end_date and project.start_date:
-            total_days = (project.end_date - project.start_date).days
-            if total_days > 0:
-                elapsed_days = (today - project.start_date).days
-                project_progress_ratio = elapsed_days / total_days
-
-                # Get task completion ratio
-                total_tasks = db.query(func.count(Task.id)).filter(Task.project_id == project.id).scalar() or 1
-                completed_tasks = db.query(func.count(Task.id)).filter(
-                    Task.project_id == project.id,
-                    Task.status == "Done"
-                ).scalar() or 0
-
-                task_completion_ratio = completed_tasks / total_tasks
-
-                # If elapsed time exceeds progress, there's risk
-                risk_percentage = int((project_progress_ratio - task_completion_ratio) * 100)
-                risk_percentage = max(0, min(100, risk_percentage))  # Clamp between 0 and 100
-
-                # Determine risk level
-                risk_level = "Low"
-                if risk_percentage > 30:
-                    risk_level = "Medium"
-                if risk_percentage > 60:
-                    risk_level = "High"
-
-                delay_risk.append({
-                    "name": project.name,
-                    "riskPercentage": risk_percentage,
-                    "risk": risk_level
-                })
-
-    # Get activity timeline (updates, tasks, etc.) for the last 6 months
-    activity_timeline = []
-    for i in range(5, -1, -1):
-        month_date = now - timedelta(days=30 * i)
+def get_cached_dashboard_analytics(
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: str = "month"
+) -> Dict[str, Any]:
+    """
+    Combined dashboard analytics served from the snapshot cache
+    """
+    start, end = resolve_time_range(start, end, granularity)
+    return analytics_cache.get_or_compute(
+        ("dashboard", start, end, granularity),
+        lambda: get_dashboard_analytics(db, start=start, end=end, granularity=granularity)
+    )
+
+
+def _bucket_start(day: date, granularity: str) -> date:
+    """
+    First day of the bucket containing `day`
+    """
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
 
-        # Format date as YYYY-MM
-        date_str = month_date.strftime("%Y-%m")
 
-        # Count updates
-        updates_count = db.query(func.count(WeeklyUpdate.id)).filter(
-            extract('month', WeeklyUpdate.created_at) == month_date.month,
-            extract('year', WeeklyUpdate.created_at) == month_date.year
-        ).scalar() or 0
+def _shift_months(day: date, months: int) -> date:
+    """
+    First day of the month `months` months away from `day`
+    """
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
 
-        # Count tasks created
-        tasks_count = db.query(func.count(Task.id)).filter(
-            extract('month', Task.created_at) == month_date.month,
-            extract('year', Task.created_at) == month_date.year
-        ).scalar() or 0
+
+def _bucket_count(start: date, end: date, granularity: str) -> int:
+    """
+    Number of buckets between the buckets containing `start` and `end`
+    """
+    first, last = _bucket_start(start, granularity), _bucket_start(end, granularity)
+    if granularity == "day":
+        return (last - first).days + 1
+    if granularity == "week":
+        return (last - first).days // 7 + 1
+    months = (last.year - first.year) * 12 + last.month - first.month
+    return months + 1 if granularity == "month" else months // 3 + 1
+
+
+def resolve_time_range(
+        start: Optional[date],
+        end: Optional[date],
+        granularity: str
+) -> Tuple[date, date]:
+    """
+    Validate a requested time range and fill in the defaults
+
+    The range ends today and covers the last DEFAULT_BUCKETS buckets unless
+    given explicitly.
+    """
+    if granularity not in GRANULARITY_STEPS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Granularity must be one of {list(GRANULARITY_STEPS)}"
+        )
+
+    if end is None:
+        end = datetime.now().date()
+
+    if start is None:
+        last = _bucket_start(end, granularity)
+        if granularity == "day":
+            start = last - timedelta(days=DEFAULT_BUCKETS - 1)
+        elif granularity == "week":
+            start = last - timedelta(weeks=DEFAULT_BUCKETS - 1)
+        elif granularity == "month":
+            start = _shift_months(last, -(DEFAULT_BUCKETS - 1))
+        else:
+            start = _shift_months(last, -3 * (DEFAULT_BUCKETS - 1))
+
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start date must be before end date"
+        )
+
+    if _bucket_count(start, end, granularity) > settings.ANALYTICS_MAX_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Time range exceeds {settings.ANALYTICS_MAX_BUCKETS} {granularity} buckets"
+        )
+
+    return start, end
+
+
+def _bucket_labels(bucket_start: date, granularity: str) -> Tuple[str, str]:
+    """
+    Short label (chart axis) and period label (timeline) of a bucket
+    """
+    if granularity == "month":
+        return bucket_start.strftime("%b"), bucket_start.strftime("%Y-%m")
+    if granularity == "quarter":
+        quarter = (bucket_start.month - 1) // 3 + 1
+        return f"Q{quarter} {bucket_start.year}", f"{bucket_start.year}-Q{quarter}"
+    return bucket_start.strftime("%b %d"), bucket_start.isoformat()
+
+
+def bucketed_series_statement(start: date, end: date, granularity: str) -> Select:
+    """
+    Gap-filled per-bucket counts as a single statement
+
+    Buckets come from generate_series, rollup metrics are summed per bucket
+    and left-joined onto them, and active projects are counted per bucket
+    with a correlated subquery. Every bucket is present, even if empty.
+    Rows have bucket_start, added, completed, updates and active_projects.
+    """
+    step = literal_column(f"interval '{GRANULARITY_STEPS[granularity]}'")
+    unit = literal_column(f"'{granularity}'")
+
+    buckets = select(
+        cast(func.generate_series(
+            func.date_trunc(unit, cast(start, DateTime)),
+            cast(end, DateTime),
+            step
+        ), Date).label("bucket_start")
+    ).subquery("buckets")
+
+    rollup_bucket = cast(func.date_trunc(unit, cast(AnalyticsDailyRollup.day, DateTime)), Date)
+    metric_total = lambda metric: func.sum(AnalyticsDailyRollup.value).filter(  # noqa: E731
+        AnalyticsDailyRollup.metric == metric
+    )
+    rollup = select(
+        rollup_bucket.label("bucket_start"),
+        metric_total(TASKS_CREATED).label("added"),
+        metric_total(TASKS_COMPLETED).label("completed"),
+        metric_total(UPDATES_CREATED).label("updates")
+    ).where(
+        AnalyticsDailyRollup.day >= _bucket_start(start, granularity),
+        AnalyticsDailyRollup.day <= end
+    ).group_by(rollup_bucket).subquery("rollup")
+
+    active_projects = select(func.count(Project.id)).where(
+        Project.status == "Active",
+        Project.start_date < buckets.c.bucket_start + step,
+        Project.end_date >= buckets.c.bucket_start
+    ).scalar_subquery()
+
+    return select(
+        buckets.c.bucket_start,
+        func.coalesce(rollup.c.added, 0).label("added"),
+        func.coalesce(rollup.c.completed, 0).label("completed"),
+        func.coalesce(rollup.c.updates, 0).label("updates"),
+        active_projects.label("active_projects")
+    ).select_from(
+        buckets.outerjoin(rollup, rollup.c.bucket_start == buckets.c.bucket_start)
+    ).order_by(buckets.c.bucket_start)
+
+
+def _bucketed_series(db: Session, start: date, end: date, granularity: str) -> List[Any]:
+    """
+    Gap-filled per-bucket counts in one round trip
+    """
+    return db.execute(bucketed_series_statement(start, end, granularity)).all()
+
+
+def _status_distribution(db: Session) -> List[Dict[str, Any]]:
+    """
+    Number of projects per status
+    """
+    status_counts = dict(
+        db.query(Project.status, func.count(Project.id)).group_by(Project.status).all()
+    )
+    return [
+        {"name": status, "value": status_counts.get(status, 0)}
+        for status in ['Active', 'Completed', 'On Hold']
+    ]
+
+
+def _delay_risk(db: Session) -> List[Dict[str, Any]]:
+    """
+    Project delay risk assessment, scored as one batch
+    """
+    return [
+        {"name": entry["name"], "riskPercentage": entry["riskPercentage"], "risk": entry["risk"]}
+        for entry in get_delay_risk(db)
+    ]
+
+
+def _project_sections(start: date, end: date, granularity: str) -> Dict[str, Callable[[Session], Any]]:
+    """
+    Independent queries behind the project analytics
+    """
+    return {
+        "statusDistribution": _status_distribution,
+        "series": lambda db: _bucketed_series(db, start, end, granularity),
+        "delayRisk": _delay_risk,
+    }
+
+
+def _assemble_project_analytics(sections: Dict[str, Any], granularity: str) -> Dict[str, Any]:
+    """
+    Build the project analytics response from the section results
+    """
+    monthly_progress = []
+    activity_timeline = []
+    for bucket in sections["series"]:
+        label, period = _bucket_labels(bucket.bucket_start, granularity)
+
+        # Get progress for this bucket
+        monthly_progress.append({
+            "month": label,
+            "period": bucket.bucket_start.isoformat(),
+            "completed": int(bucket.completed),
+            "added": int(bucket.added),
+            "activeProjects": bucket.active_projects
+        })
 
         # In a real system, you'd have a comments table
         # For this example, we'll use a placeholder value
-        comments_count = int(updates_count * 0.8)  # Just an example ratio
+        comments_count = int(bucket.updates * 0.8)  # Just an example ratio
 
+        # Get activity timeline (updates, tasks, etc.) for this bucket
         activity_timeline.append({
-            "date": date_str,
-            "updates": updates_count,
-            "tasks": tasks_count,
+            "date": period,
+            "updates": int(bucket.updates),
+            "tasks": int(bucket.added),
             "comments": comments_count
         })
 
     return {
-        "statusDistribution": status_distribution,
+        "statusDistribution": sections["statusDistribution"],
         "monthlyProgress": monthly_progress,
-        "delayRisk": delay_risk,
+        "delayRisk": sections["delayRisk"],
         "activityTimeline": activity_timeline
     }
 
 
-def get_user_analytics(db: Session) -> Dict[str, Any]:
+def get_project_analytics(
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: str = "month"
+) -> Dict[str, Any]:
     """
-    Generate analytics data for users
+    Generate analytics data for projects
+
+    Every series is computed with grouped queries, so the number of
+    statements is constant regardless of the number of projects. Task
+    and update counts come from the daily rollup rather than the raw
+    tables. The independent sections run concurrently.
 
     Args:
         db: Database session
+        start: First day of the time series (default: last 6 buckets)
+        end: Last day of the time series (default: today)
+        granularity: Bucket size: day, week, month or quarter
 
     Returns:
-        Dictionary containing various user analytics metrics
+        Dictionary containing various project analytics metrics
     """
-    # Get user role distribution
-    role_distribution = []
-    for role in ['Admin', 'Manager', 'Contributor']:
-        count = db.query(func.count(User.id)).filter(User.role == role).scalar()
-        role_distribution.append({"name": role, "value": count or 0})
+    start, end = resolve_time_range(start, end, granularity)
+    sections = run_sections(db, _project_sections(start, end, granularity))
+    return _assemble_project_analytics(sections, granularity)
 
-    # Get top contributors based on updates and completed tasks
+
+def _role_distribution(db: Session) -> List[Dict[str, Any]]:
+    """
+    Number of users per role
+    """
+    role_counts = dict(
+        db.query(User.role, func.count(User.id)).group_by(User.role).all()
+    )
+    return [
+        {"name": role, "value": role_counts.get(role, 0)}
+        for role in ['Admin', 'Manager', 'Contributor']
+    ]
+
+
+def _top_contributors(db: Session) -> List[Dict[str, Any]]:
+    """
+    Top contributors based on updates and completed tasks
+    """
     top_contributors_query = db.query(
         User.name,
         func.count(distinct(WeeklyUpdate.id)).label('updates'),
@@ -184,20 +370,32 @@ def get_user_analytics(db: Session) -> Dict[str, Any]:
             "updates": updates_count,
             "tasks": tasks_count
         })
+    return top_contributors
+
+
+def _activity_by_day(db: Session) -> List[Dict[str, Any]]:
+    """
+    User activity by day of week, read from the daily rollup
+    """
+    # isodow numbers days from 1 (Monday) to 7 (Sunday)
+    weekday = extract('isodow', AnalyticsDailyRollup.day)
+    weekday_rows = db.query(
+        weekday,
+        AnalyticsDailyRollup.metric,
+        func.sum(AnalyticsDailyRollup.value)
+    ).filter(
+        AnalyticsDailyRollup.metric.in_([TASKS_CREATED, UPDATES_CREATED])
+    ).group_by(weekday, AnalyticsDailyRollup.metric).all()
+
+    weekday_counts = defaultdict(int)
+    for day_num, metric, total in weekday_rows:
+        weekday_counts[(int(day_num), metric)] = int(total or 0)
 
-    # Get user activity by day of week
     activity_by_day = []
     for day_num, day_name in enumerate(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'],
-                                       0):
-        # Count updates created on this day
-        updates_count = db.query(func.count(WeeklyUpdate.id)).filter(
-            extract('dow', WeeklyUpdate.created_at) == day_num + 1  # PostgreSQL days start from 1 (Sunday)
-        ).scalar() or 0
-
-        # Count tasks created on this day
-        tasks_count = db.query(func.count(Task.id)).filter(
-            extract('dow', Task.created_at) == day_num + 1
-        ).scalar() or 0
+                                       1):
+        updates_count = weekday_counts[(day_num, UPDATES_CREATED)]
+        tasks_count = weekday_counts[(day_num, TASKS_CREATED)]
 
         # For this example, we'll simulate comment counts
         comments_count = int(updates_count * 1.5)  # Just an example ratio
@@ -208,8 +406,13 @@ def get_user_analytics(db: Session) -> Dict[str, Any]:
             "comments": comments_count,
             "tasks": tasks_count
         })
+    return activity_by_day
+
 
-    # Get project assignments per user
+def _project_assignments(db: Session) -> List[Dict[str, Any]]:
+    """
+    Project memberships and open tasks per user
+    """
     project_assignments_query = db.query(
         User.id,
         User.name,
@@ -230,10 +433,64 @@ def get_user_analytics(db: Session) -> Dict[str, Any]:
             "projectCount": project_count,
             "activeTasks": active_tasks
         })
+    return project_assignments
+
+
+# Independent queries behind the user analytics, keyed by response field
+USER_SECTIONS = {
+    "roleDistribution": _role_distribution,
+    "topContributors": _top_contributors,
+    "activityByDay": _activity_by_day,
+    "projectAssignments": _project_assignments,
+}
+
+
+def get_user_analytics(db: Session) -> Dict[str, Any]:
+    """
+    Generate analytics data for users
+
+    The independent sections run concurrently.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary containing various user analytics metrics
+    """
+    return run_sections(db, USER_SECTIONS)
+
+
+def get_dashboard_analytics(
+        db: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: str = "month"
+) -> Dict[str, Any]:
+    """
+    Generate project and user analytics in a single concurrent run
+
+    All sections of both analytics share one executor, so the wall-clock
+    time is close to that of the slowest section.
+
+    Args:
+        db: Database session
+        start: First day of the project time series
+        end: Last day of the project time series
+        granularity: Bucket size of the project time series
+
+    Returns:
+        Dictionary with "projects" and "users" analytics
+    """
+    start, end = resolve_time_range(start, end, granularity)
+    project_sections = _project_sections(start, end, granularity)
+
+    sections = {("projects", name): section for name, section in project_sections.items()}
+    sections.update({("users", name): section for name, section in USER_SECTIONS.items()})
+    results = run_sections(db, sections)
 
     return {
-        "roleDistribution": role_distribution,
-        "topContributors": top_contributors,
-        "activityByDay": activity_by_day,
-        "projectAssignments": project_assignments
-    }
\ No newline at end of file
+        "projects": _assemble_project_analytics(
+            {name: results[("projects", name)] for name in project_sections}, granularity
+        ),
+        "users": {name: results[("users", name)] for name in USER_SECTIONS}
+    }
@@ -0,0 +1,132 @@
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Date, DateTime, case, cast, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.task_transition import TaskStatusTransition
+
+
+def status_transition(task_id, project_id, from_status: Optional[str], to_status: str,
+                      changed_by=None) -> Dict[str, Any]:
+    """
+    History row for a task entering `to_status`
+
+    Use from_status=None when the task is created.
+    """
+    return {
+        "task_id": task_id,
+        "project_id": project_id,
+        "from_status": from_status,
+        "to_status": to_status,
+        "changed_by": changed_by,
+    }
+
+
+def record_status_transitions(db: Session, transitions: List[Dict[str, Any]]) -> None:
+    """
+    Append status transitions to the task history in a single insert
+
+    Runs inside the caller's transaction so the history is committed
+    together with the status change.
+    """
+    if transitions:
+        db.execute(TaskStatusTransition.__table__.insert(), transitions)
+
+
+def get_project_burndown(
+        db: Session,
+        project_id: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    Daily burndown/burnup series for a project
+
+    The series is computed from the status transition history in a single
+    statement: transitions are summed per day (earlier ones are folded into
+    the first day), left-joined onto a generate_series of days and
+    accumulated with a window sum.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        start: First day of the series (default: project start date)
+        end: Last day of the series (default: today)
+
+    Returns:
+        Dictionary with the series bounds and one point per day with the
+        total, completed and remaining task counts
+    """
+    project = db.query(Project.start_date).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    if end is None:
+        end = datetime.now().date()
+    if start is None:
+        start = min(project.start_date or end, end)
+        start = max(start, end - timedelta(days=settings.BURNDOWN_MAX_DAYS - 1))
+
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start date must be before end date"
+        )
+    if (end - start).days + 1 > settings.BURNDOWN_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Burndown range exceeds {settings.BURNDOWN_MAX_DAYS} days"
+        )
+
+    days = select(
+        cast(func.generate_series(
+            cast(start, DateTime), cast(end, DateTime), literal_column("interval '1 day'")
+        ), Date).label("day")
+    ).subquery("days")
+
+    # Transitions before the first day count towards its starting totals
+    event_day = func.greatest(cast(TaskStatusTransition.changed_at, Date), start)
+    events = select(
+        event_day.label("day"),
+        func.sum(case((TaskStatusTransition.from_status.is_(None), 1), else_=0)).label("added"),
+        func.sum(
+            case((TaskStatusTransition.to_status == "Done", 1), else_=0)
+            - case((TaskStatusTransition.from_status == "Done", 1), else_=0)
+        ).label("completed")
+    ).where(
+        TaskStatusTransition.project_id == project_id,
+        TaskStatusTransition.changed_at < cast(end + timedelta(days=1), DateTime)
+    ).group_by(event_day).subquery("events")
+
+    running = lambda column: func.sum(func.coalesce(column, 0)).over(order_by=days.c.day)  # noqa: E731
+    stmt = select(
+        days.c.day,
+        running(events.c.added).label("total"),
+        running(events.c.completed).label("completed")
+    ).select_from(
+        days.outerjoin(events, events.c.day == days.c.day)
+    ).order_by(days.c.day)
+
+    points = []
+    for row in db.execute(stmt):
+        total, completed = int(row.total), int(row.completed)
+        points.append({
+            "date": row.day,
+            "total": total,
+            "completed": completed,
+            "remaining": total - completed
+        })
+
+    return {
+        "project_id": project_id,
+        "start_date": start,
+        "end_date": end,
+        "points": points
+    }
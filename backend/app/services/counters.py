@@ -0,0 +1,105 @@
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Any
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from app.models.update import WeeklyUpdate
+
+# Counter columns kept on projects
+TASK_COUNT = "task_count"
+DONE_TASK_COUNT = "done_task_count"
+UPDATES_COUNT = "updates_count"
+DOCUMENTS_COUNT = "documents_count"
+MEMBERS_COUNT = "members_count"
+
+COUNTER_COLUMNS = [TASK_COUNT, DONE_TASK_COUNT, UPDATES_COUNT, DOCUMENTS_COUNT, MEMBERS_COUNT]
+
+CounterKey = Tuple[Any, str]
+
+
+def task_counter_deltas(project_id, status: str, sign: int = 1) -> Counter:
+    """
+    Counter contribution of a single task
+
+    Use sign=-1 to remove the contribution of a task's previous state.
+    """
+    deltas = Counter()
+    deltas[(project_id, TASK_COUNT)] += sign
+    if status == "Done":
+        deltas[(project_id, DONE_TASK_COUNT)] += sign
+    return deltas
+
+
+def apply_counter_deltas(db: Session, deltas: Dict[CounterKey, int]) -> None:
+    """
+    Add deltas to the project counters
+
+    Counters are incremented in SQL (column = column + delta), one row per
+    project in a single executemany, inside the caller's transaction so
+    they are committed together with the write that produced them.
+    """
+    by_project: Dict[Any, Dict[str, int]] = {}
+    for (project_id, column), delta in deltas.items():
+        if delta:
+            by_project.setdefault(project_id, dict.fromkeys(COUNTER_COLUMNS, 0))[column] += delta
+    if not by_project:
+        return
+
+    # Counters are bookkeeping, so projects.updated_at is left untouched
+    projects = Project.__table__
+    stmt = update(projects).where(
+        projects.c.id == bindparam("project_id")
+    ).values({
+        "updated_at": projects.c.updated_at,
+        **{column: projects.c[column] + bindparam(f"delta_{column}") for column in COUNTER_COLUMNS}
+    })
+    db.execute(stmt, [
+        {"project_id": project_id, **{f"delta_{column}": delta for column, delta in columns.items()}}
+        for project_id, columns in by_project.items()
+    ])
+
+
+def _actual_counts() -> Dict[str, Any]:
+    """
+    Correlated subqueries computing each counter from the source tables
+    """
+    def count(column, *criteria):
+        return select(func.count(column)).where(*criteria).scalar_subquery()
+
+    return {
+        TASK_COUNT: count(Task.id, Task.project_id == Project.id),
+        DONE_TASK_COUNT: count(Task.id, Task.project_id == Project.id, Task.status == "Done"),
+        UPDATES_COUNT: count(WeeklyUpdate.id, WeeklyUpdate.project_id == Project.id),
+        DOCUMENTS_COUNT: count(Document.id, Document.project_id == Project.id),
+        MEMBERS_COUNT: count(ProjectMember.id, ProjectMember.project_id == Project.id),
+    }
+
+
+def reconcile_project_counters(db: Session, project_ids: Optional[List[Any]] = None) -> int:
+    """
+    Recompute project counters from the source tables
+
+    Only projects whose counters drifted are written. Does not commit;
+    the caller decides when the repair becomes visible.
+
+    Args:
+        db: Database session
+        project_ids: Restrict to these projects instead of all of them
+
+    Returns:
+        Number of projects whose counters were corrected
+    """
+    actual = _actual_counts()
+    stmt = update(Project).values(updated_at=Project.updated_at, **actual).where(
+        or_(*[getattr(Project, column) != value for column, value in actual.items()])
+    )
+    if project_ids is not None:
+        stmt = stmt.where(Project.id.in_(project_ids))
+
+    result = db.execute(stmt.execution_options(synchronize_session=False))
+    return result.rowcount
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
@@ -6,15 +7,24 @@ import os
 import shutil
 from pathlib import Path
 
+from app.core.db import delete_or_404, on_commit, update_or_404
+from app.core.pagination import Page, SortKey, paginate
 from app.models.document import Document
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.document import DocumentCreate, DocumentUpdate
 from app.core.config import settings
+from app.services.counters import DOCUMENTS_COUNT, apply_counter_deltas
 
 # Define upload directory
 UPLOAD_DIR = Path("uploads")
 
+# Documents are listed newest first, then by ID
+DOCUMENT_SORT_KEYS = [
+    SortKey(Document.uploaded_at, lambda document: document.uploaded_at, datetime.fromisoformat),
+    SortKey(Document.id, lambda document: document.id, uuid.UUID),
+]
+
 
 def get_document(db: Session, document_id: str) -> Optional[Document]:
     """
@@ -23,13 +33,16 @@ def get_document(db: Session, document_id: str) -> Optional[Document]:
     return db.query(Document).filter(Document.id == document_id).first()
 
 
-def get_documents_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[Document]:
+def get_documents_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100,
+                             cursor: Optional[str] = None) -> Page:
     """
     Get documents for a project
+
+    Pass the next_cursor of a page as `cursor` to get the following page;
+    `skip` is only used without a cursor.
     """
-    return db.query(Document).filter(
-        Document.project_id == project_id
-    ).order_by(Document.uploaded_at.desc()).offset(skip).limit(limit).all()
+    query = db.query(Document).filter(Document.project_id == project_id)
+    return paginate(query, DOCUMENT_SORT_KEYS, cursor=cursor, skip=skip, limit=limit, descending=True)
 
 
 def create_document(db: Session, document: DocumentCreate, uploaded_file, uploaded_by: str) -> Document:
@@ -72,8 +85,8 @@ def create_document(db: Session, document: DocumentCreate, uploaded_file, upload
     )
 
     db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    apply_counter_deltas(db, {(db_document.project_id, DOCUMENTS_COUNT): 1})
+    db.flush()
     return db_document
 
 
@@ -81,21 +94,10 @@ def update_document(db: Session, document_id: str, document: DocumentUpdate) ->
     """
     Update a document (name only)
     """
-    db_document = get_document(db, document_id=document_id)
-    if not db_document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
-
-    # Update document fields
     document_data = document.dict(exclude_unset=True)
-    for key, value in document_data.items():
-        setattr(db_document, key, value)
+    db_document = update_or_404(db, Document, document_id, document_data, detail="Document not found")
 
-    db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    db.flush()
     return db_document
 
 
@@ -103,19 +105,18 @@ def delete_document(db: Session, document_id: str) -> None:
     """
     Delete a document
     """
-    db_document = get_document(db, document_id=document_id)
-    if not db_document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    deleted = delete_or_404(db, Document, document_id, detail="Document not found",
+                            returning=[Document.project_id, Document.file_path])
+    apply_counter_deltas(db, {(deleted.project_id, DOCUMENTS_COUNT): -1})
+    db.flush()
+
+    # Delete the file once the row is gone for good
+    on_commit(db, lambda: _remove_file(deleted.file_path))
 
-    # Delete file if it exists
-    if os.path.exists(db_document.file_path):
-        os.remove(db_document.file_path)
 
-    db.delete(db_document)
-    db.commit()
+def _remove_file(file_path: str) -> None:
+    if os.path.exists(file_path):
+        os.remove(file_path)
 
 
 def get_documents_with_user_info(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[dict]:
@@ -0,0 +1,183 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterator, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.task import Task
+from app.models.update import WeeklyUpdate
+from app.models.user import User
+from app.services.analytics import bucketed_series_statement, resolve_time_range
+
+# Supported export formats and their media types
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def check_export_format(export_format: str) -> str:
+    """
+    Validate an export format and return its media type
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Format must be one of {list(EXPORT_FORMATS)}"
+        )
+    return EXPORT_FORMATS[export_format]
+
+
+def tasks_export_statement(
+        project_id: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        updated_since: Optional[datetime] = None
+) -> Select:
+    """
+    Tasks with their project and assignee names, oldest first
+    """
+    assignee = aliased(User)
+    stmt = select(
+        Task.id,
+        Task.project_id,
+        Project.name.label("project_name"),
+        Task.title,
+        Task.description,
+        Task.status,
+        Task.priority,
+        Task.due_date,
+        Task.assigned_to,
+        assignee.name.label("assignee_name"),
+        Task.created_by,
+        Task.created_at,
+        Task.updated_at
+    ).join(
+        Project, Project.id == Task.project_id
+    ).outerjoin(
+        assignee, assignee.id == Task.assigned_to
+    ).order_by(Task.created_at, Task.id)
+
+    if project_id:
+        stmt = stmt.where(Task.project_id == project_id)
+    if status_filter:
+        stmt = stmt.where(Task.status == status_filter)
+    if updated_since:
+        stmt = stmt.where(Task.updated_at >= updated_since)
+    return stmt
+
+
+def updates_export_statement(
+        project_id: Optional[str] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+) -> Select:
+    """
+    Weekly updates with their project and author names, oldest first
+    """
+    stmt = select(
+        WeeklyUpdate.id,
+        WeeklyUpdate.project_id,
+        Project.name.label("project_name"),
+        WeeklyUpdate.user_id,
+        User.name.label("user_name"),
+        WeeklyUpdate.date,
+        WeeklyUpdate.status,
+        WeeklyUpdate.notes,
+        WeeklyUpdate.ai_summary,
+        WeeklyUpdate.created_at,
+        WeeklyUpdate.updated_at
+    ).join(
+        Project, Project.id == WeeklyUpdate.project_id
+    ).join(
+        User, User.id == WeeklyUpdate.user_id
+    ).order_by(WeeklyUpdate.date, WeeklyUpdate.id)
+
+    if project_id:
+        stmt = stmt.where(WeeklyUpdate.project_id == project_id)
+    if since:
+        stmt = stmt.where(WeeklyUpdate.date >= since)
+    if until:
+        stmt = stmt.where(WeeklyUpdate.date <= until)
+    return stmt
+
+
+def analytics_series_export_statement(
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        granularity: str = "month"
+) -> Select:
+    """
+    Gap-filled analytics time series, one row per bucket
+    """
+    start, end = resolve_time_range(start, end, granularity)
+    return bucketed_series_statement(start, end, granularity)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def stream_export(bind: Engine, stmt: Select, export_format: str,
+                  batch_size: Optional[int] = None) -> Iterator[str]:
+    """
+    Stream the rows of `stmt` as NDJSON lines or CSV
+
+    Rows are read through a server-side cursor on a dedicated connection,
+    `batch_size` at a time, and one chunk is yielded per batch, so memory
+    use does not grow with the number of rows exported. The connection is
+    held only while the response is being sent.
+
+    Args:
+        bind: Engine to open the export connection on
+        stmt: Select statement producing the rows
+        export_format: "ndjson" or "csv"
+        batch_size: Rows per fetch (EXPORT_BATCH_SIZE by default)
+
+    Returns:
+        Iterator of text chunks
+    """
+    if batch_size is None:
+        batch_size = settings.EXPORT_BATCH_SIZE
+
+    with bind.connect() as connection:
+        result = connection.execution_options(
+            stream_results=True, yield_per=batch_size
+        ).execute(stmt)
+        columns = list(result.keys())
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for partition in result.partitions():
+                writer.writerows([_csv_value(value) for value in row] for row in partition)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            for partition in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(columns, row)), default=_json_default) + "\n"
+                    for row in partition
+                )
@@ -0,0 +1,165 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import case, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task, NO_DUE_DATE
+from app.models.update import WeeklyUpdate
+from app.models.user import User
+from app.services.project import progress_percentage
+
+# Due buckets of open tasks, in the order they are shown
+OVERDUE = "overdue"
+DUE_TODAY = "today"
+DUE_THIS_WEEK = "this_week"
+DUE_LATER = "later"
+NO_DUE_DATE_BUCKET = "no_due_date"
+DUE_BUCKETS = [OVERDUE, DUE_TODAY, DUE_THIS_WEEK, DUE_LATER, NO_DUE_DATE_BUCKET]
+
+# Statuses of tasks that still need work
+OPEN_TASK_STATUSES = ["Pending", "In Progress"]
+
+# Characters of the notes shown for updates without an AI summary
+UPDATE_EXCERPT_LENGTH = 280
+
+
+def _due_bucket(today: date):
+    """
+    SQL expression putting a task in its due bucket
+    """
+    return case(
+        (Task.due_date.is_(None), NO_DUE_DATE_BUCKET),
+        (Task.due_date < today, OVERDUE),
+        (Task.due_date == today, DUE_TODAY),
+        (Task.due_date <= today + timedelta(days=7), DUE_THIS_WEEK),
+        else_=DUE_LATER
+    )
+
+
+def _open_tasks(db: Session, user_id: str, today: date, per_bucket: int) -> List[Any]:
+    """
+    The user's open tasks, at most `per_bucket` per project and due bucket
+
+    Each row also carries the total number of tasks in its bucket.
+    """
+    bucket = _due_bucket(today).label("bucket")
+    partition = [Task.project_id, bucket]
+    ranked = select(
+        Task.id, Task.project_id, Task.title, Task.status, Task.priority, Task.due_date, bucket,
+        func.row_number().over(
+            partition_by=partition, order_by=[func.coalesce(Task.due_date, NO_DUE_DATE), Task.id]
+        ).label("position"),
+        func.count().over(partition_by=partition).label("total")
+    ).where(
+        Task.assigned_to == user_id,
+        Task.status.in_(OPEN_TASK_STATUSES)
+    ).subquery()
+
+    stmt = select(ranked).where(ranked.c.position <= per_bucket).order_by(
+        ranked.c.project_id, ranked.c.position
+    )
+    return db.execute(stmt).all()
+
+
+def _projects(db: Session, user_id: str) -> List[Any]:
+    """
+    Projects the user is a member of or has open tasks in
+    """
+    membership = select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)
+    assigned = select(Task.project_id).where(
+        Task.assigned_to == user_id,
+        Task.status.in_(OPEN_TASK_STATUSES)
+    )
+    stmt = select(
+        Project.id, Project.name, Project.status, Project.end_date,
+        Project.task_count, Project.done_task_count,
+        Project.id.in_(membership).label("is_member")
+    ).where(
+        or_(Project.id.in_(membership), Project.id.in_(assigned))
+    ).order_by(Project.end_date, Project.name, Project.id)
+    return db.execute(stmt).all()
+
+
+def _latest_updates(db: Session, project_ids: List[Any]) -> Dict[Any, Any]:
+    """
+    The most recent weekly update of each project, by project ID
+    """
+    if not project_ids:
+        return {}
+
+    stmt = select(
+        WeeklyUpdate.project_id, WeeklyUpdate.id, WeeklyUpdate.date, WeeklyUpdate.status,
+        User.name.label("author_name"),
+        func.coalesce(WeeklyUpdate.ai_summary, func.left(WeeklyUpdate.notes, literal(UPDATE_EXCERPT_LENGTH)))
+        .label("summary")
+    ).outerjoin(
+        User, User.id == WeeklyUpdate.user_id
+    ).where(
+        WeeklyUpdate.project_id.in_(project_ids)
+    ).distinct(
+        WeeklyUpdate.project_id
+    ).order_by(
+        WeeklyUpdate.project_id, WeeklyUpdate.date.desc(), WeeklyUpdate.id.desc()
+    )
+    return {row.project_id: row for row in db.execute(stmt)}
+
+
+def get_my_overview(db: Session, user_id: str, today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Everything the "My work" home screen shows, in three queries
+
+    Args:
+        db: Database session
+        user_id: User the overview is for
+        today: Reference date for the due buckets (default: today)
+
+    Returns:
+        The user's projects with progress, their open tasks grouped by
+        due bucket and the latest update of each project
+    """
+    today = today or date.today()
+
+    projects = _projects(db, user_id)
+    tasks = _open_tasks(db, user_id, today, settings.OVERVIEW_TASKS_PER_BUCKET)
+    latest_updates = _latest_updates(db, [project.id for project in projects])
+
+    groups: Dict[Any, Dict[str, Dict[str, Any]]] = {}
+    for task in tasks:
+        group = groups.setdefault(task.project_id, {}).setdefault(
+            task.bucket, {"bucket": task.bucket, "total": task.total, "tasks": []}
+        )
+        group["tasks"].append({
+            "id": task.id,
+            "title": task.title,
+            "status": task.status,
+            "priority": task.priority,
+            "due_date": task.due_date,
+        })
+
+    result = []
+    for project in projects:
+        project_groups = groups.get(project.id, {})
+        latest = latest_updates.get(project.id)
+        result.append({
+            "id": project.id,
+            "name": project.name,
+            "status": project.status,
+            "end_date": project.end_date,
+            "progress": progress_percentage(project.task_count, project.done_task_count),
+            "is_member": project.is_member,
+            "open_tasks": sum(group["total"] for group in project_groups.values()),
+            "task_groups": [project_groups[bucket] for bucket in DUE_BUCKETS if bucket in project_groups],
+            "latest_update": {
+                "id": latest.id,
+                "date": latest.date,
+                "status": latest.status,
+                "author_name": latest.author_name,
+                "summary": latest.summary,
+            } if latest else None,
+        })
+
+    return {"projects": result}
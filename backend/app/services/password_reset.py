@@ -45,8 +45,7 @@ def create_password_reset_token(db: Session, email: str) -> Optional[str]:
 
     # Add new token
     db.add(db_token)
-    db.commit()
-    db.refresh(db_token)
+    db.flush()
 
     return token
 
@@ -105,7 +104,7 @@ def reset_password(db: Session, token: str, new_password: str) -> bool:
     db.query(PasswordResetToken).filter(PasswordResetToken.token == token).delete()
 
     db.add(user)
-    db.commit()
+    db.flush()
 
     return True
 
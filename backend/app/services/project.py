@@ -1,14 +1,23 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from datetime import datetime
+from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException, status
 import uuid
 
+from app.core.db import delete_or_404, update_or_404
+from app.core.pagination import Page, SortKey, paginate
 from app.models.project import Project
-from app.models.task import Task
-from app.models.update import WeeklyUpdate
 from app.models.project_member import ProjectMember
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.analytics import invalidate_analytics
+from app.services.counters import MEMBERS_COUNT, apply_counter_deltas
+
+
+# Projects are listed oldest first, then by ID
+PROJECT_SORT_KEYS = [
+    SortKey(Project.created_at, lambda project: project.created_at, datetime.fromisoformat),
+    SortKey(Project.id, lambda project: project.id, uuid.UUID),
+]
 
 
 def get_project_by_id(db: Session, project_id: str) -> Optional[Project]:
@@ -20,34 +29,52 @@ def get_project_by_id(db: Session, project_id: str) -> Optional[Project]:
     return db.query(Project).filter(Project.id == project_id).first()
 
 
-def get_projects(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[Project]:
+def get_projects(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None,
+                 cursor: Optional[str] = None) -> Page:
     """
     Get a list of projects with optional filtering by status
+
+    Pass the next_cursor of a page as `cursor` to get the following page;
+    `skip` is only used without a cursor.
     """
     query = db.query(Project)
 
     if status:
         query = query.filter(Project.status == status)
 
-    return query.offset(skip).limit(limit).all()
+    return paginate(query, PROJECT_SORT_KEYS, cursor=cursor, skip=skip, limit=limit)
 
 
-def get_user_projects(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[Project]:
+def get_user_projects(db: Session, user_id: str, skip: int = 0, limit: int = 100,
+                      cursor: Optional[str] = None) -> Page:
     """
     Get projects where user is a member
+
+    Pass the next_cursor of a page as `cursor` to get the following page;
+    `skip` is only used without a cursor.
     """
-    return db.query(Project).join(
+    query = db.query(Project).join(
         ProjectMember, Project.id == ProjectMember.project_id
     ).filter(
         ProjectMember.user_id == user_id
-    ).offset(skip).limit(limit).all()
+    )
+    return paginate(query, PROJECT_SORT_KEYS, cursor=cursor, skip=skip, limit=limit)
 
 
 def create_project(db: Session, project: ProjectCreate, user_id: str) -> Project:
     """
     Create a new project
     """
-    # Create new project
+    # Creator is a project member with the Project Manager role, other
+    # team members join as Team Members
+    members = [(user_id, "Project Manager")]
+    for member_id in project.team_members or []:
+        # Skip if it's the creator (already added above)
+        if str(member_id) == user_id:
+            continue
+        members.append((member_id, "Team Member"))
+
+    # Create new project, with its member count already set
     db_project = Project(
         id=uuid.uuid4(),
         name=project.name,
@@ -55,37 +82,19 @@ def create_project(db: Session, project: ProjectCreate, user_id: str) -> Project
         start_date=project.start_date,
         end_date=project.end_date,
         status=project.status,
-        created_by=user_id
+        created_by=user_id,
+        members_count=len(members)
     )
-
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-
-    # Add creator as a project member (with ProjectManager role)
-    db_project_member = ProjectMember(
-        project_id=db_project.id,
-        user_id=user_id,
-        role="Project Manager"
-    )
+    db.flush()
 
-    db.add(db_project_member)
+    db.add_all([
+        ProjectMember(project_id=db_project.id, user_id=member_id, role=role)
+        for member_id, role in members
+    ])
 
-    # Add team members if provided
-    if project.team_members:
-        for member_id in project.team_members:
-            # Skip if it's the creator (already added above)
-            if str(member_id) == user_id:
-                continue
-
-            db_member = ProjectMember(
-                project_id=db_project.id,
-                user_id=member_id,
-                role="Team Member"
-            )
-            db.add(db_member)
-
-    db.commit()
+    invalidate_analytics(db)
+    db.flush()
 
     return db_project
 
@@ -94,109 +103,94 @@ def update_project(db: Session, project_id: str, project: ProjectUpdate) -> Proj
     """
     Update a project
     """
-    db_project = get_project_by_id(db, project_id=project_id)
-    if not db_project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-
-    # Update project fields
     project_data = project.dict(exclude_unset=True)
-    for key, value in project_data.items():
-        setattr(db_project, key, value)
+    db_project = update_or_404(db, Project, project_id, project_data, detail="Project not found")
 
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    # Status, dates and name all appear on the analytics dashboard
+    if project_data.keys() & {"status", "start_date", "end_date", "name"}:
+        invalidate_analytics(db)
+
+    db.flush()
     return db_project
 
 
 def delete_project(db: Session, project_id: str) -> None:
     """
     Delete a project
+
+    Its tasks, updates, documents and memberships go with it through
+    their ON DELETE CASCADE foreign keys.
     """
-    db_project = get_project_by_id(db, project_id=project_id)
-    if not db_project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
+    delete_or_404(db, Project, project_id, detail="Project not found")
+    invalidate_analytics(db)
+    db.flush()
 
-    db.delete(db_project)
-    db.commit()
+
+def progress_percentage(total_tasks: int, completed_tasks: int) -> int:
+    """
+    Share of completed tasks as a whole percentage
+    """
+    if not total_tasks:
+        return 0
+    return int((completed_tasks / total_tasks) * 100)
 
 
 def calculate_project_progress(db: Session, project_id: str) -> int:
     """
     Calculate project progress based on completed tasks
+
+    Reads the project's task counters instead of counting its tasks.
     """
-    # Get total tasks and completed tasks
-    total_tasks = db.query(func.count(Task.id)).filter(
-        Task.project_id == project_id
-    ).scalar()
-
-    completed_tasks = db.query(func.count(Task.id)).filter(
-        Task.project_id == project_id,
-        Task.status == "Done"
-    ).scalar()
-
-    # Calculate progress
-    if total_tasks == 0:
+    counts = db.query(Project.task_count, Project.done_task_count).filter(
+        Project.id == project_id
+    ).first()
+    if not counts:
         return 0
 
-    progress = int((completed_tasks / total_tasks) * 100)
-    return progress
+    return progress_percentage(counts.task_count, counts.done_task_count)
 
 
 def get_project_with_details(db: Session, project_id: str) -> Dict[str, Any]:
     """
     Get project with additional details (progress, team members, etc.)
+
+    Runs two statements whatever the team size: the project row, which
+    carries the task and update counters, and its members joined to their
+    users.
     """
-    project = get_project_by_id(db, project_id=project_id)
+    project = None
+    if project_id is not None and project_id != "null":
+        project = db.query(Project).options(
+            selectinload(Project.members).joinedload(ProjectMember.user)
+        ).filter(Project.id == project_id).first()
+
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    # Calculate progress
-    progress = calculate_project_progress(db, project_id)
-
-    # Get team members
-    team_members = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id
-    ).all()
-
-    # Get task count
-    task_count = db.query(func.count(Task.id)).filter(
-        Task.project_id == project_id
-    ).scalar()
-
-    # Get updates count
-    updates_count = db.query(func.count(WeeklyUpdate.id)).filter(
-        WeeklyUpdate.project_id == project_id
-    ).scalar()
+    # Progress and counts come from the project's counters
+    progress = progress_percentage(project.task_count, project.done_task_count)
 
     # Convert each ProjectMember to a dict. Adjust the fields as necessary.
     def convert_project_member(pm: ProjectMember) -> dict:
         return {
             "project_id": pm.project_id,
             "user_id": pm.user_id,
-            "user_name": pm.user.name
-            # include additional fields if needed
+            "user_name": pm.user.name,
+            "role": pm.role
         }
 
-    team_members_converted = [convert_project_member(pm) for pm in team_members]
-
+    team_members_converted = [convert_project_member(pm) for pm in project.members]
 
     # Prepare response
     result = {
         **project.__dict__,
         "progress": progress,
         "team_members": team_members_converted,
-        "task_count": task_count,
-        "updates_count": updates_count
+        "task_count": project.task_count,
+        "updates_count": project.updates_count
     }
 
     return result
@@ -234,8 +228,9 @@ def add_team_member(db: Session, project_id: str, user_id: str, role: str = "Tea
     )
 
     db.add(db_member)
-    db.commit()
-    db.refresh(db_member)
+    apply_counter_deltas(db, {(project_id, MEMBERS_COUNT): 1})
+    invalidate_analytics(db)
+    db.flush()
 
     return db_member
 
@@ -257,4 +252,6 @@ def remove_team_member(db: Session, project_id: str, user_id: str) -> None:
         )
 
     db.delete(member)
-    db.commit()
\ No newline at end of file
+    apply_counter_deltas(db, {(project_id, MEMBERS_COUNT): -1})
+    invalidate_analytics(db)
+    db.flush()
\ No newline at end of file
@@ -6,6 +6,8 @@ from uuid import UUID
 from app.models.project_member import ProjectMember
 from app.models.project import Project
 from app.models.user import User
+from app.services.analytics import invalidate_analytics
+from app.services.counters import MEMBERS_COUNT, apply_counter_deltas
 
 
 def get_project_members(db: Session, project_id: UUID) -> List[dict]:
@@ -86,8 +88,9 @@ def add_member_to_project(
     )
 
     db.add(new_member)
-    db.commit()
-    db.refresh(new_member)
+    apply_counter_deltas(db, {(project_id, MEMBERS_COUNT): 1})
+    invalidate_analytics(db)
+    db.flush()
 
     # Return member with user details
     return {
@@ -136,8 +139,7 @@ def update_project_member(
     # Update role
     member.role = role
     db.add(member)
-    db.commit()
-    db.refresh(member)
+    db.flush()
 
     # Return member with user details
     return {
@@ -175,7 +177,10 @@ def remove_member_from_project(
         )
     ).delete()
 
-    db.commit()
+    if result:
+        apply_counter_deltas(db, {(project_id, MEMBERS_COUNT): -result})
+        invalidate_analytics(db)
+    db.flush()
 
     return result > 0
 
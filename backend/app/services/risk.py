@@ -0,0 +1,141 @@
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.update import WeeklyUpdate
+
+
+def score_delay_risk(
+        start_dates: Sequence[date],
+        end_dates: Sequence[date],
+        total_tasks: Sequence[int],
+        done_tasks: Sequence[int],
+        blocked_updates: Sequence[int],
+        today: Optional[date] = None,
+        schedule_weight: Optional[float] = None,
+        blocked_weight: Optional[float] = None,
+        medium_threshold: Optional[float] = None,
+        high_threshold: Optional[float] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Score delay risk for a batch of projects at once
+
+    Risk is the gap between the share of the schedule already elapsed and
+    the share of tasks done, plus a penalty per blocked update, clamped to
+    0-100. Weights and thresholds default to the values in Settings.
+
+    Args:
+        start_dates: Project start dates
+        end_dates: Project end dates
+        total_tasks: Number of tasks per project
+        done_tasks: Number of done tasks per project
+        blocked_updates: Number of blocked weekly updates per project
+        today: Reference date, defaults to the current date
+
+    Returns:
+        Dictionary of arrays: "valid" (projects with a positive duration),
+        "riskPercentage" and "risk" (Low, Medium or High)
+    """
+    if today is None:
+        today = datetime.now().date()
+    if schedule_weight is None:
+        schedule_weight = settings.DELAY_RISK_SCHEDULE_WEIGHT
+    if blocked_weight is None:
+        blocked_weight = settings.DELAY_RISK_BLOCKED_WEIGHT
+    if medium_threshold is None:
+        medium_threshold = settings.DELAY_RISK_MEDIUM_THRESHOLD
+    if high_threshold is None:
+        high_threshold = settings.DELAY_RISK_HIGH_THRESHOLD
+
+    starts = np.array(start_dates, dtype="datetime64[D]")
+    ends = np.array(end_dates, dtype="datetime64[D]")
+    total = np.array([count or 0 for count in total_tasks], dtype=float)
+    done = np.array([count or 0 for count in done_tasks], dtype=float)
+    blocked = np.array([count or 0 for count in blocked_updates], dtype=float)
+
+    total_days = (ends - starts).astype(int)
+    elapsed_days = (np.datetime64(today, "D") - starts).astype(int)
+    valid = total_days > 0
+
+    schedule_ratio = elapsed_days / np.where(valid, total_days, 1)
+    completion_ratio = done / np.maximum(total, 1)
+
+    # If elapsed time exceeds progress, there's risk
+    raw_risk = schedule_weight * (schedule_ratio - completion_ratio) * 100 + blocked_weight * blocked
+    risk_percentage = np.clip(np.trunc(raw_risk), 0, 100).astype(int)
+
+    risk_level = np.full(risk_percentage.shape, "Low", dtype=object)
+    risk_level[risk_percentage > medium_threshold] = "Medium"
+    risk_level[risk_percentage > high_threshold] = "High"
+
+    return {
+        "valid": valid,
+        "riskPercentage": risk_percentage,
+        "risk": risk_level
+    }
+
+
+def get_delay_risk(db: Session, project_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Delay risk for all active projects, or for the given projects
+
+    Task counts come from the project counters and blocked-update counts
+    from a single grouped query, then all projects are scored as one batch.
+
+    Args:
+        db: Database session
+        project_ids: Restrict to these projects instead of all active ones
+
+    Returns:
+        List of dictionaries with project id, name, risk percentage and level.
+        Projects without a positive duration are left out.
+    """
+    blocked_counts = db.query(
+        WeeklyUpdate.project_id,
+        func.count(WeeklyUpdate.id).label('blocked')
+    ).filter(
+        WeeklyUpdate.status == "Blocked"
+    ).group_by(WeeklyUpdate.project_id).subquery()
+
+    query = db.query(
+        Project.id,
+        Project.name,
+        Project.start_date,
+        Project.end_date,
+        Project.task_count,
+        Project.done_task_count,
+        blocked_counts.c.blocked
+    ).outerjoin(
+        blocked_counts, blocked_counts.c.project_id == Project.id
+    ).filter(
+        Project.start_date.isnot(None),
+        Project.end_date.isnot(None)
+    )
+
+    if project_ids is not None:
+        query = query.filter(Project.id.in_(project_ids))
+    else:
+        query = query.filter(Project.status == "Active")
+
+    rows = query.all()
+    if not rows:
+        return []
+
+    ids, names, starts, ends, totals, dones, blocked = zip(*rows)
+    scores = score_delay_risk(starts, ends, totals, dones, blocked)
+
+    result = []
+    for index in np.flatnonzero(scores["valid"]):
+        result.append({
+            "projectId": ids[index],
+            "name": names[index],
+            "riskPercentage": int(scores["riskPercentage"][index]),
+            "risk": scores["risk"][index]
+        })
+
+    return result
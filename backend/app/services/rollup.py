@@ -0,0 +1,104 @@
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Tuple, Any
+
+from sqlalchemy import Date, cast, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.analytics_rollup import AnalyticsDailyRollup
+from app.models.task import Task
+from app.models.update import WeeklyUpdate
+
+# Metrics kept in the daily rollup
+TASKS_CREATED = "tasks_created"
+TASKS_COMPLETED = "tasks_completed"  # Done tasks, bucketed by their last update
+UPDATES_CREATED = "updates_created"
+
+RollupKey = Tuple[Any, Any, str]
+
+
+def task_rollup_deltas(project_id, status: str, created_at: datetime, updated_at: datetime,
+                       sign: int = 1) -> Counter:
+    """
+    Rollup contribution of a single task
+
+    Use sign=-1 to remove the contribution of a task's previous state.
+    """
+    deltas = Counter()
+    if created_at is not None:
+        deltas[(project_id, created_at.date(), TASKS_CREATED)] += sign
+    if status == "Done" and updated_at is not None:
+        deltas[(project_id, updated_at.date(), TASKS_COMPLETED)] += sign
+    return deltas
+
+
+def update_rollup_deltas(project_id, created_at: datetime, sign: int = 1) -> Counter:
+    """
+    Rollup contribution of a single weekly update
+    """
+    deltas = Counter()
+    if created_at is not None:
+        deltas[(project_id, created_at.date(), UPDATES_CREATED)] += sign
+    return deltas
+
+
+def apply_rollup_deltas(db: Session, deltas: Dict[RollupKey, int]) -> None:
+    """
+    Add deltas to the daily rollup in a single upsert
+
+    Runs inside the caller's transaction so the rollup is committed
+    together with the write that produced it.
+    """
+    rows = [
+        {"project_id": project_id, "day": day, "metric": metric, "value": delta}
+        for (project_id, day, metric), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+
+    stmt = insert(AnalyticsDailyRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AnalyticsDailyRollup.project_id, AnalyticsDailyRollup.day, AnalyticsDailyRollup.metric],
+        set_={"value": AnalyticsDailyRollup.value + stmt.excluded.value}
+    )
+    db.execute(stmt)
+
+
+def rebuild_rollups(db: Session) -> int:
+    """
+    Recompute the whole rollup table from tasks and weekly updates
+
+    Does not commit; the caller decides when the rebuild becomes visible.
+
+    Returns:
+        Number of rollup rows written
+    """
+    db.query(AnalyticsDailyRollup).delete(synchronize_session=False)
+
+    columns = ["project_id", "day", "metric", "value"]
+    sources = [
+        (Task.project_id, cast(Task.created_at, Date), TASKS_CREATED, []),
+        (Task.project_id, cast(Task.updated_at, Date), TASKS_COMPLETED, [Task.status == "Done"]),
+        (WeeklyUpdate.project_id, cast(WeeklyUpdate.created_at, Date), UPDATES_CREATED, []),
+    ]
+
+    written = 0
+    for project_column, day_column, metric, criteria in sources:
+        select_stmt = db.query(
+            project_column,
+            day_column,
+            literal(metric),
+            func.count()
+        ).filter(
+            day_column.isnot(None),
+            *criteria
+        ).group_by(project_column, day_column).statement
+
+        result = db.execute(
+            AnalyticsDailyRollup.__table__.insert().from_select(columns, select_stmt)
+        )
+        written += result.rowcount
+
+    return written
@@ -0,0 +1,107 @@
+import uuid
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Float, String, Text, cast, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.pagination import Page, SortKey, paginate
+from app.models.project import Project
+from app.models.task import Task
+from app.models.update import WeeklyUpdate
+
+# Searchable result types
+SEARCH_KINDS = ["project", "task", "update"]
+
+# Options for the highlighted snippet shown with each result
+SNIPPET_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=5, StartSel=<mark>, StopSel=</mark>"
+
+
+def _kind_select(kind: str, model, title, body, project_id, ts_query, status_filter: Optional[str],
+                 project_filter: Optional[str]):
+    """
+    Matching rows of one searchable table in the common result shape
+    """
+    stmt = select(
+        literal(kind, String).label("kind"),
+        model.id.label("id"),
+        project_id.label("project_id"),
+        cast(title, String).label("title"),
+        cast(body, Text).label("body"),
+        model.status.label("status"),
+        # Double precision, so the rank round-trips exactly through a cursor
+        cast(func.ts_rank(model.search_vector, ts_query), Float).label("rank")
+    ).where(model.search_vector.op("@@")(ts_query))
+
+    if status_filter:
+        stmt = stmt.where(model.status == status_filter)
+    if project_filter:
+        stmt = stmt.where(project_id == project_filter)
+    return stmt
+
+
+def search(
+        db: Session,
+        q: str,
+        kinds: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+) -> Page:
+    """
+    Full-text search across projects, tasks and weekly updates
+
+    The query uses web search syntax ("quoted phrases", OR, -excluded) and
+    is matched against the generated search_vector columns through their
+    GIN indexes. Results of all types are merged and ranked together;
+    highlighted snippets are only built for the returned page.
+
+    Args:
+        db: Database session
+        q: Search query
+        kinds: Restrict to these result types (default: all)
+        project_id: Restrict to one project
+        status_filter: Restrict to results with this status
+        limit: Maximum number of results in the page
+        cursor: Cursor of the next page from a previous search
+
+    Returns:
+        Page of results, best match first
+    """
+    kinds = kinds or SEARCH_KINDS
+    unknown = set(kinds) - set(SEARCH_KINDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Search types must be among {SEARCH_KINDS}"
+        )
+
+    ts_query = func.websearch_to_tsquery("english", q)
+    sources = {
+        "project": (Project, Project.name, Project.description, Project.id),
+        "task": (Task, Task.title, Task.description, Task.project_id),
+        "update": (WeeklyUpdate, WeeklyUpdate.date, WeeklyUpdate.notes, WeeklyUpdate.project_id),
+    }
+    matches = union_all(*[
+        _kind_select(kind, *sources[kind], ts_query, status_filter, project_id)
+        for kind in SEARCH_KINDS if kind in kinds
+    ]).subquery("matches")
+
+    query = db.query(
+        matches.c.kind,
+        matches.c.id,
+        matches.c.project_id,
+        Project.name.label("project_name"),
+        matches.c.title,
+        func.ts_headline("english", func.coalesce(matches.c.body, ""), ts_query, SNIPPET_OPTIONS).label("snippet"),
+        matches.c.status,
+        matches.c.rank
+    ).join(Project, Project.id == matches.c.project_id)
+
+    keys = [
+        SortKey(matches.c.rank, lambda row: row.rank, float),
+        SortKey(matches.c.kind, lambda row: row.kind, str),
+        SortKey(matches.c.id, lambda row: row.id, uuid.UUID),
+    ]
+    return paginate(query, keys, cursor=cursor, limit=limit, descending=True)
@@ -0,0 +1,384 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import SessionLocal, on_commit, update_or_404
+from app.core.jobs import JobQueue
+from app.models.update import WeeklyUpdate
+from app.services.ai import ai_available, summarize_update_notes
+from app.services.ai_providers import AIUnavailableError, get_ai_provider
+
+# States of an update's AI summary, in ai_summary_status
+SUMMARY_PENDING = "pending"
+SUMMARY_RUNNING = "running"
+SUMMARY_DONE = "done"
+SUMMARY_FAILED = "failed"
+
+# Summaries are generated off the request thread, a few at a time. The
+# provider already retries transient errors itself, so a job is only
+# retried when it was refused without calling the provider at all
+summary_queue = JobQueue(
+    "ai-summary",
+    max_workers=settings.AI_SUMMARY_WORKERS,
+    max_pending=settings.AI_SUMMARY_QUEUE_SIZE,
+    max_retries=settings.AI_SUMMARY_MAX_RETRIES,
+    backoff_seconds=settings.AI_SUMMARY_RETRY_BACKOFF_SECONDS,
+    retry_if=lambda error: isinstance(error, AIUnavailableError),
+)
+
+
+# Batch summarization runs one at a time, in a thread of its own
+batch_queue = JobQueue("ai-batch", max_workers=1, max_pending=0, max_retries=0, backoff_seconds=0)
+_batch_lock = threading.Lock()
+_batch_stop = threading.Event()
+_batch_progress: Dict[str, Any] = {"running": False}
+
+# Rough characters per token, to keep prompts within budget without a tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def _set_summary(db: Session, update_id: Any, values: Dict[str, Any], *criteria) -> Any:
+    # Summary bookkeeping is not an edit of the update, so updated_at is kept
+    stmt = update(WeeklyUpdate).where(WeeklyUpdate.id == update_id, *criteria).values(
+        updated_at=WeeklyUpdate.updated_at, **values
+    ).returning(WeeklyUpdate.notes)
+    return db.execute(stmt.execution_options(synchronize_session=False)).first()
+
+
+def run_update_summary(update_id: Any) -> None:
+    """
+    Generate the AI summary of one update; the body of a summary job
+
+    Runs in a worker thread with its own session. The pending summary is
+    claimed (pending -> running) before the provider is called, so a job
+    queued twice, by two processes or after a restart, runs once. If the
+    provider fails the claim is released and the error raised, so the
+    queue can retry the job.
+    """
+    with SessionLocal() as db:
+        claimed = _set_summary(
+            db, update_id, {"ai_summary_status": SUMMARY_RUNNING, "ai_summary_started_at": func.now()},
+            WeeklyUpdate.ai_summary_status == SUMMARY_PENDING
+        )
+        db.commit()
+        if claimed is None:
+            # Deleted, claimed by another worker, or its summary was already written
+            return
+
+        try:
+            summary = summarize_update_notes(claimed.notes)
+        except Exception:
+            _set_summary(db, update_id, {"ai_summary_status": SUMMARY_PENDING},
+                         WeeklyUpdate.ai_summary_status == SUMMARY_RUNNING)
+            db.commit()
+            raise
+
+        written = _set_summary(
+            db, update_id, {"ai_summary": summary, "ai_summary_status": SUMMARY_DONE},
+            WeeklyUpdate.ai_summary_status == SUMMARY_RUNNING, WeeklyUpdate.notes == claimed.notes
+        )
+        if written is None:
+            # The notes were edited in the meantime: summarize them again,
+            # unless the edit already queued a summary of its own
+            requeued = _set_summary(db, update_id, {"ai_summary_status": SUMMARY_PENDING},
+                                    WeeklyUpdate.ai_summary_status == SUMMARY_RUNNING)
+            db.commit()
+            if requeued is not None:
+                enqueue_update_summary(update_id)
+            return
+        db.commit()
+
+
+def _mark_failed(update_id: Any, error: Optional[Exception] = None) -> None:
+    with SessionLocal() as db:
+        _set_summary(
+            db, update_id, {"ai_summary_status": SUMMARY_FAILED},
+            WeeklyUpdate.ai_summary_status.in_([SUMMARY_PENDING, SUMMARY_RUNNING])
+        )
+        db.commit()
+
+
+def enqueue_update_summary(update_id: Any) -> bool:
+    """
+    Hand an update with a pending summary to the summary workers
+
+    If the queue is full the summary is marked failed so that clients stop
+    polling; it can be requested again later.
+    """
+    if summary_queue.submit(run_update_summary, update_id, on_failure=partial(_mark_failed, update_id)):
+        return True
+    _mark_failed(update_id)
+    return False
+
+
+def queue_update_summary(db: Session, update_id: Any) -> None:
+    """
+    Queue the summary of an update once the current transaction commits
+
+    The update's ai_summary_status must already be set to pending in the
+    same transaction. Does not commit.
+    """
+    on_commit(db, partial(enqueue_update_summary, update_id))
+
+
+def _stale_claim() -> Any:
+    # A running summary whose worker has not finished within AI_SUMMARY_STALE_SECONDS
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.AI_SUMMARY_STALE_SECONDS)
+    return and_(
+        WeeklyUpdate.ai_summary_status == SUMMARY_RUNNING,
+        or_(WeeklyUpdate.ai_summary_started_at.is_(None), WeeklyUpdate.ai_summary_started_at < cutoff)
+    )
+
+
+def recover_update_summaries() -> int:
+    """
+    Queue again the summaries left behind by a restart or crash
+
+    Jobs only live in the process that queued them. Claims older than
+    AI_SUMMARY_STALE_SECONDS are released back to pending, then every
+    pending summary is queued; ones beyond the queue's capacity are marked
+    failed like any other overflow. Run at startup.
+
+    Returns:
+        Number of summaries queued
+    """
+    with SessionLocal() as db:
+        stmt = update(WeeklyUpdate).where(_stale_claim()).values(ai_summary_status=SUMMARY_PENDING, updated_at=WeeklyUpdate.updated_at)
+        db.execute(stmt.execution_options(synchronize_session=False))
+        update_ids = db.scalars(
+            select(WeeklyUpdate.id).where(WeeklyUpdate.ai_summary_status == SUMMARY_PENDING)
+        ).all()
+        db.commit()
+
+    for update_id in update_ids:
+        enqueue_update_summary(update_id)
+    return len(update_ids)
+
+
+def request_update_summary(db: Session, update_id: str) -> WeeklyUpdate:
+    """
+    Mark an update's AI summary pending and queue its generation
+
+    Args:
+        db: Database session
+        update_id: Update to summarize
+
+    Returns:
+        The update, with ai_summary_status "pending"
+    """
+    if not ai_available():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="AI summaries are not available"
+        )
+
+    db_update = update_or_404(db, WeeklyUpdate, update_id, {"ai_summary_status": SUMMARY_PENDING},
+                              detail="Update not found")
+    queue_update_summary(db, db_update.id)
+    return db_update
+
+
+def get_summary_status(db: Session, update_id: str) -> Dict[str, Any]:
+    """
+    Progress of an update's AI summary
+    """
+    row = db.query(
+        WeeklyUpdate.id, WeeklyUpdate.ai_summary_status, WeeklyUpdate.ai_summary
+    ).filter(WeeklyUpdate.id == update_id).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Update not found"
+        )
+
+    return {"update_id": row.id, "status": row.ai_summary_status, "ai_summary": row.ai_summary}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate number of model tokens in `text`
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def pack_batches(rows: Sequence[Any], token_budget: int, max_items: int) -> List[List[Any]]:
+    """
+    Split updates into prompts of at most `max_items` updates and about
+    `token_budget` tokens of notes, keeping their order
+
+    An update that alone exceeds the budget gets a prompt of its own.
+    """
+    batches: List[List[Any]] = []
+    batch: List[Any] = []
+    tokens = 0
+    for row in rows:
+        row_tokens = estimate_tokens(row.notes)
+        if batch and (len(batch) >= max_items or tokens + row_tokens > token_budget):
+            batches.append(batch)
+            batch, tokens = [], 0
+        batch.append(row)
+        tokens += row_tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _needs_summary() -> List[Any]:
+    # No summary yet, and no summary job queued or working on it; failed
+    # summaries and claims abandoned by a crashed worker are taken over
+    return [
+        WeeklyUpdate.ai_summary.is_(None),
+        or_(
+            WeeklyUpdate.ai_summary_status.is_(None),
+            WeeklyUpdate.ai_summary_status == SUMMARY_FAILED,
+            _stale_claim()
+        ),
+    ]
+
+
+def _write_batch(db: Session, batch: List[Any], values: Dict[str, Any]) -> int:
+    stmt = update(WeeklyUpdate).where(
+        WeeklyUpdate.id.in_([row.id for row in batch]), *_needs_summary()
+    ).values(updated_at=WeeklyUpdate.updated_at, **values)
+    return db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+
+
+def summarize_pending_updates(
+        limit: Optional[int] = None,
+        progress: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> Dict[str, Any]:
+    """
+    Summarize updates that have no AI summary, several per prompt
+
+    Updates are read in pages ordered by ID, each page starting after the
+    last ID of the previous one, and packed into prompts of at most
+    AI_BATCH_MAX_UPDATES updates within AI_BATCH_TOKEN_BUDGET tokens. The
+    summaries of a prompt are written with one UPDATE and committed, so an
+    interrupted run keeps what it has done. A prompt the provider fails on
+    marks its updates failed and the run goes on. Updates with a summary
+    job queued are left to it, while failed summaries and stale claims
+    are taken over. Uses a session of its own; run it from
+    app.summarize_updates or start_batch_summary().
+
+    Args:
+        limit: Most updates to summarize (default: all)
+        progress: Called with the running totals after each prompt
+
+    Returns:
+        Totals: updates to summarize, summarized, failed and prompts sent
+    """
+    provider = get_ai_provider()
+    with SessionLocal() as db:
+        total = db.query(func.count(WeeklyUpdate.id)).filter(*_needs_summary()).scalar()
+        totals = {"total": total if limit is None else min(total, limit), "summarized": 0, "failed": 0, "batches": 0}
+        remaining = totals["total"]
+        last_id = None
+
+        while remaining > 0 and not _batch_stop.is_set():
+            query = db.query(WeeklyUpdate.id, WeeklyUpdate.notes).filter(*_needs_summary())
+            if last_id is not None:
+                query = query.filter(WeeklyUpdate.id > last_id)
+            page = query.order_by(WeeklyUpdate.id).limit(min(settings.AI_BATCH_PAGE_SIZE, remaining)).all()
+            if not page:
+                break
+            last_id = page[-1].id
+            remaining -= len(page)
+
+            for batch in pack_batches(page, settings.AI_BATCH_TOKEN_BUDGET, settings.AI_BATCH_MAX_UPDATES):
+                if _batch_stop.is_set():
+                    break
+                try:
+                    summaries = provider.summarize_updates([row.notes for row in batch])
+                except Exception as e:
+                    print(f"Error summarizing a batch of {len(batch)} updates: {e}")
+                    totals["failed"] += _write_batch(db, batch, {"ai_summary_status": SUMMARY_FAILED})
+                else:
+                    totals["summarized"] += _write_batch(db, batch, {
+                        "ai_summary": case(
+                            {row.id: summary for row, summary in zip(batch, summaries)}, value=WeeklyUpdate.id
+                        ),
+                        "ai_summary_status": SUMMARY_DONE,
+                    })
+                db.commit()
+
+                totals["batches"] += 1
+                if progress is not None:
+                    progress(dict(totals))
+
+    return totals
+
+
+def _record_batch_progress(totals: Dict[str, Any]) -> None:
+    with _batch_lock:
+        _batch_progress.update(totals)
+
+
+def _finish_batch(error: Optional[Exception] = None) -> None:
+    with _batch_lock:
+        _batch_progress["running"] = False
+        if error is not None:
+            _batch_progress["error"] = str(error)
+
+
+def _run_batch(limit: Optional[int]) -> None:
+    totals = summarize_pending_updates(limit=limit, progress=_record_batch_progress)
+    _record_batch_progress(totals)
+    _finish_batch()
+
+
+def start_batch_summary(limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Start summarizing updates without an AI summary in the background
+
+    Only one run at a time is allowed per process; the API workers of a
+    multi-process deployment do not see each other's runs. Two concurrent
+    runs waste model calls but not writes, as each summary is written
+    only while the update still has none.
+
+    Args:
+        limit: Most updates to summarize (default: all)
+
+    Returns:
+        Progress of the run, as reported by get_batch_summary_progress()
+    """
+    if not ai_available():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="AI summaries are not available"
+        )
+
+    with _batch_lock:
+        if _batch_progress["running"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A batch summarization is already running"
+            )
+        _batch_progress.clear()
+        _batch_progress.update({"running": True, "total": None, "summarized": 0, "failed": 0, "batches": 0})
+
+    _batch_stop.clear()
+    if not batch_queue.submit(_run_batch, limit, on_failure=_finish_batch):
+        _finish_batch(RuntimeError("Batch summarization could not be started"))
+    return get_batch_summary_progress()
+
+
+def get_batch_summary_progress() -> Dict[str, Any]:
+    """
+    Progress of the current or last batch summarization in this process
+    """
+    with _batch_lock:
+        return dict(_batch_progress)
+
+
+def stop_batch_summary() -> None:
+    """
+    Stop a running batch summarization after its current prompt
+    """
+    _batch_stop.set()
+    batch_queue.shutdown(wait=False)
@@ -1,12 +1,30 @@
-from typing import List, Optional
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set
+from sqlalchemy import any_, bindparam, case, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as pgUUID
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 import uuid
 
-from app.models.task import Task
+from app.core.config import settings
+from app.core.db import delete_or_404
+from app.core.pagination import Page, SortKey, paginate
+from app.models.task import Task, NO_DUE_DATE
 from app.models.project import Project
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskBulkUpdate, TaskCreate, TaskUpdate
+from app.services.analytics import invalidate_analytics
+from app.services.burndown import record_status_transitions, status_transition
+from app.services.counters import apply_counter_deltas, task_counter_deltas
+from app.services.rollup import apply_rollup_deltas, task_rollup_deltas
+
+
+# Tasks are listed by due date, undated tasks last, then by ID
+TASK_SORT_KEYS = [
+    SortKey(func.coalesce(Task.due_date, NO_DUE_DATE), lambda task: task.due_date or NO_DUE_DATE, date.fromisoformat),
+    SortKey(Task.id, lambda task: task.id, uuid.UUID),
+]
 
 
 def get_task(db: Session, task_id: str) -> Optional[Task]:
@@ -16,22 +34,69 @@ def get_task(db: Session, task_id: str) -> Optional[Task]:
     return db.query(Task).filter(Task.id == task_id).first()
 
 
-def get_tasks_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[Task]:
+def filter_tasks(
+        query,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        overdue: bool = False
+):
+    """
+    Apply task list filters to a task query
+
+    Args:
+        query: Query over Task
+        status: Only tasks with this status
+        priority: Only tasks with this priority
+        assigned_to: Only tasks assigned to this user
+        due_from: Only tasks due on or after this date
+        due_to: Only tasks due on or before this date
+        overdue: Only tasks past their due date that are not done
+
+    Returns:
+        Filtered query
+    """
+    if status:
+        query = query.filter(Task.status == status)
+    if priority:
+        query = query.filter(Task.priority == priority)
+    if assigned_to:
+        query = query.filter(Task.assigned_to == assigned_to)
+    if due_from:
+        query = query.filter(Task.due_date >= due_from)
+    if due_to:
+        query = query.filter(Task.due_date <= due_to)
+    if overdue:
+        query = query.filter(Task.due_date < datetime.now().date(), Task.status != "Done")
+    return query
+
+
+def get_tasks_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100,
+                         cursor: Optional[str] = None, **filters) -> Page:
     """
     Get tasks for a project
+
+    Pass the next_cursor of a page as `cursor` to get the following page;
+    `skip` is only used without a cursor. Other keyword arguments are
+    filters, see filter_tasks.
     """
-    return db.query(Task).filter(
-        Task.project_id == project_id
-    ).order_by(Task.due_date.asc()).offset(skip).limit(limit).all()
+    query = filter_tasks(db.query(Task).filter(Task.project_id == project_id), **filters)
+    return paginate(query, TASK_SORT_KEYS, cursor=cursor, skip=skip, limit=limit)
 
 
-def get_tasks_by_user(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[Task]:
+def get_tasks_by_user(db: Session, user_id: str, skip: int = 0, limit: int = 100,
+                      cursor: Optional[str] = None, **filters) -> Page:
     """
     Get tasks assigned to a user
+
+    Pass the next_cursor of a page as `cursor` to get the following page;
+    `skip` is only used without a cursor. Other keyword arguments are
+    filters, see filter_tasks.
     """
-    return db.query(Task).filter(
-        Task.assigned_to == user_id
-    ).order_by(Task.due_date.asc()).offset(skip).limit(limit).all()
+    query = filter_tasks(db.query(Task).filter(Task.assigned_to == user_id), **filters)
+    return paginate(query, TASK_SORT_KEYS, cursor=cursor, skip=skip, limit=limit)
 
 
 def create_task(db: Session, task: TaskCreate, created_by: str) -> Task:
@@ -69,55 +134,220 @@ def create_task(db: Session, task: TaskCreate, created_by: str) -> Task:
     )
 
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    db.flush()
+
+    # Record the new task in the analytics rollup
+    apply_rollup_deltas(db, task_rollup_deltas(
+        db_task.project_id, db_task.status, db_task.created_at, db_task.updated_at
+    ))
+    record_status_transitions(db, [
+        status_transition(db_task.id, db_task.project_id, None, db_task.status, changed_by=created_by)
+    ])
+    apply_counter_deltas(db, task_counter_deltas(db_task.project_id, db_task.status))
+    invalidate_analytics(db)
+
+    db.flush()
     return db_task
 
 
-def update_task(db: Session, task_id: str, task: TaskUpdate) -> Task:
+def _check_assignees(db: Session, assignees: Set[Any]) -> None:
     """
-    Update a task
+    Raise 404 unless all assignees exist, using one query
     """
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
+    if not assignees:
+        return
+    found = {row.id for row in db.query(User.id).filter(User.id.in_(assignees))}
+    if assignees - found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
+            detail="Assigned user not found"
         )
 
-    # Check if assigned user exists (if provided)
-    if task.assigned_to:
-        user = db.query(User).filter(User.id == task.assigned_to).first()
-        if not user:
+
+def _update_tasks(db: Session, condition, values: Dict[str, Any]) -> List[Any]:
+    """
+    Run one UPDATE ... RETURNING over the tasks matching `condition`
+
+    Each returned row holds the task's new columns plus its
+    previous_status and previous_updated_at. They come from a snapshot
+    of the tasks taken, with row locks, in the same statement; the locks
+    make the snapshot agree with the row version the UPDATE applies to.
+    """
+    tasks = Task.__table__
+    previous = select(tasks.c.id, tasks.c.status, tasks.c.updated_at).where(
+        condition
+    ).with_for_update().subquery("previous")
+    # Generated columns (the search document) are not part of the response
+    returned = [column for column in tasks.c if column.computed is None]
+    stmt = update(tasks).where(tasks.c.id == previous.c.id).values(values).returning(
+        *returned,
+        previous.c.status.label("previous_status"),
+        previous.c.updated_at.label("previous_updated_at")
+    )
+    return db.execute(stmt).all()
+
+
+def _apply_task_changes(db: Session, rows: List[Any], fields: Set[str], changed_by: Optional[str] = None) -> None:
+    """
+    Adjust the rollup, status history and project counters for updated tasks
+
+    Args:
+        db: Database session
+        rows: Rows returned by _update_tasks
+        fields: Names of the fields that were patched
+        changed_by: User the status changes are attributed to
+    """
+    rollup_deltas = Counter()
+    counter_deltas = Counter()
+    transitions = []
+    for row in rows:
+        rollup_deltas.update(task_rollup_deltas(
+            row.project_id, row.previous_status, row.created_at, row.previous_updated_at, sign=-1
+        ))
+        rollup_deltas.update(task_rollup_deltas(row.project_id, row.status, row.created_at, row.updated_at))
+        if row.status != row.previous_status:
+            transitions.append(status_transition(row.id, row.project_id, row.previous_status, row.status,
+                                                 changed_by=changed_by))
+            counter_deltas.update(task_counter_deltas(row.project_id, row.previous_status, sign=-1))
+            counter_deltas.update(task_counter_deltas(row.project_id, row.status))
+
+    apply_rollup_deltas(db, rollup_deltas)
+    record_status_transitions(db, transitions)
+    apply_counter_deltas(db, counter_deltas)
+    if "status" in fields or "assigned_to" in fields:
+        invalidate_analytics(db)
+
+
+def update_task(db: Session, task_id: str, task: TaskUpdate, changed_by: Optional[str] = None) -> Any:
+    """
+    Update a task
+
+    The task is written and read back by a single UPDATE ... RETURNING.
+    Status changes are appended to the task's status history, attributed
+    to `changed_by`.
+    """
+    task_data = task.dict(exclude_unset=True)
+    if not task_data:
+        db_task = get_task(db, task_id=task_id)
+        if not db_task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Assigned user not found"
+                detail="Task not found"
             )
+        return db_task
 
-    # Update task fields
-    task_data = task.dict(exclude_unset=True)
-    for key, value in task_data.items():
-        setattr(db_task, key, value)
+    # Check if assigned user exists (if provided)
+    _check_assignees(db, {task.assigned_to} if task.assigned_to else set())
 
-    db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
-    return db_task
+    rows = _update_tasks(db, Task.id == task_id, task_data)
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
 
+    _apply_task_changes(db, rows, set(task_data), changed_by=changed_by)
+    db.flush()
+    return rows[0]
 
-def delete_task(db: Session, task_id: str) -> None:
+
+def _check_found(missing: Set[Any]) -> None:
     """
-    Delete a task
+    Raise 404 listing the requested tasks that do not exist, if any
     """
-    db_task = get_task(db, task_id=task_id)
-    if not db_task:
+    if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
+            detail=f"Tasks not found: {', '.join(sorted(str(task_id) for task_id in missing))}"
+        )
+
+
+def bulk_update_tasks(db: Session, bulk: TaskBulkUpdate, changed_by: Optional[str] = None) -> List[Any]:
+    """
+    Update many tasks in a single statement
+
+    All tasks are patched by one UPDATE ... WHERE id = ANY(...) RETURNING,
+    which also returns each task's previous status so the rollup, status
+    history and project counters are adjusted in bulk. Either every task
+    is updated or, if one is missing, none is; tasks with an empty patch
+    are left unchanged but must exist too.
+
+    Args:
+        db: Database session
+        bulk: The same patch for a list of IDs, or a patch per task
+        changed_by: User the status changes are attributed to
+
+    Returns:
+        Updated task rows, in the order they were requested
+    """
+    if bulk.items is not None:
+        patches: Dict[Any, Dict[str, Any]] = {
+            item.id: item.dict(exclude_unset=True, exclude={"id"}) for item in bulk.items
+        }
+    else:
+        patch = bulk.patch.dict(exclude_unset=True)
+        patches = {task_id: patch for task_id in bulk.ids}
+
+    if len(patches) > settings.TASK_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.TASK_BULK_MAX_ITEMS} tasks can be updated at once"
         )
+    # Items without changes are not updated, but must still exist
+    unchanged = [task_id for task_id, patch in patches.items() if not patch]
+    missing = set()
+    if unchanged:
+        missing = set(unchanged) - {row.id for row in db.query(Task.id).filter(Task.id.in_(unchanged))}
+    patches = {task_id: patch for task_id, patch in patches.items() if patch}
+    if not patches:
+        _check_found(missing)
+        return []
+
+    _check_assignees(db, {patch["assigned_to"] for patch in patches.values() if patch.get("assigned_to")})
+
+    tasks = Task.__table__
+    fields = {key for patch in patches.values() for key in patch}
+    if bulk.items is None:
+        values = {key: literal(value, type_=tasks.c[key].type) for key, value in patch.items()}
+    else:
+        # Each field is set from a CASE over the task ID, keeping the
+        # current value for tasks whose patch does not touch it
+        values = {
+            key: case(
+                {task_id: literal(patch[key], type_=tasks.c[key].type)
+                 for task_id, patch in patches.items() if key in patch},
+                value=tasks.c.id, else_=tasks.c[key]
+            )
+            for key in fields
+        }
+
+    uuid_array = ARRAY(pgUUID(as_uuid=True))
+    task_ids = cast(bindparam("task_ids", list(patches), type_=uuid_array), uuid_array)
+    rows = _update_tasks(db, tasks.c.id == any_(task_ids), values)
+
+    _check_found(missing | (set(patches) - {row.id for row in rows}))
+
+    _apply_task_changes(db, rows, fields, changed_by=changed_by)
+    db.flush()
+
+    order = {task_id: position for position, task_id in enumerate(patches)}
+    return sorted(rows, key=lambda row: order[row.id])
+
+
+def delete_task(db: Session, task_id: str) -> None:
+    """
+    Delete a task
+    """
+    deleted = delete_or_404(db, Task, task_id, detail="Task not found",
+                            returning=[Task.project_id, Task.status, Task.created_at, Task.updated_at])
+
+    apply_rollup_deltas(db, task_rollup_deltas(
+        deleted.project_id, deleted.status, deleted.created_at, deleted.updated_at, sign=-1
+    ))
+    apply_counter_deltas(db, task_counter_deltas(deleted.project_id, deleted.status, sign=-1))
+    invalidate_analytics(db)
 
-    db.delete(db_task)
-    db.commit()
+    db.flush()
 
 
 def get_tasks_with_user_info(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[dict]:
@@ -0,0 +1,223 @@
+import codecs
+import csv
+import uuid
+import zipfile
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.db import copy_rows
+from app.models.project import Project
+from app.models.task import Task
+from app.models.task_transition import TaskStatusTransition
+from app.models.user import User
+from app.schemas.task import TaskBase
+from app.services.analytics import invalidate_analytics
+from app.services.burndown import status_transition
+from app.services.counters import apply_counter_deltas, task_counter_deltas
+from app.services.rollup import apply_rollup_deltas, task_rollup_deltas
+
+# Supported import formats, by file extension
+IMPORT_FORMATS = ("csv", "xlsx")
+
+# Columns read from an import file; any others are ignored
+IMPORT_COLUMNS = ("title", "description", "status", "priority", "due_date", "assignee_email")
+
+
+def import_format(filename: Optional[str]) -> str:
+    """
+    Import format of an uploaded file, from its extension
+    """
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File must be one of {list(IMPORT_FORMATS)}"
+        )
+    return extension
+
+
+def _normalize_header(header: Any) -> str:
+    return str(header or "").strip().lower().replace(" ", "_")
+
+
+def _csv_rows(file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    reader = csv.reader(codecs.iterdecode(file, "utf-8-sig"))
+    headers = [_normalize_header(header) for header in next(reader, [])]
+    for values in reader:
+        yield dict(zip(headers, values))
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    try:
+        import openpyxl
+        from openpyxl.utils.exceptions import InvalidFileException
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="XLSX import is not available; install openpyxl"
+        )
+
+    # Read-only mode streams the sheet instead of loading it whole. A zip
+    # archive that is not a workbook fails with KeyError on a missing part.
+    try:
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    except (InvalidFileException, KeyError, zipfile.BadZipFile):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is not a valid XLSX file"
+        )
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [_normalize_header(header) for header in next(rows, ())]
+        for values in rows:
+            yield dict(zip(headers, values))
+    finally:
+        workbook.close()
+
+
+def read_import_rows(file: BinaryIO, file_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Rows of an import file as dicts keyed by normalized column header
+    """
+    return _xlsx_rows(file) if file_format == "xlsx" else _csv_rows(file)
+
+
+def _clean(column: str, value: Any) -> Any:
+    # Spreadsheet cells may hold numbers or dates; only due_date keeps its type
+    if value is not None and column != "due_date":
+        value = str(value)
+    if isinstance(value, str):
+        value = value.strip()
+    return None if value == "" else value
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+def import_tasks(
+        db: Session,
+        project_id: str,
+        file: BinaryIO,
+        file_format: str,
+        created_by: str
+) -> Dict[str, Any]:
+    """
+    Create tasks in a project from a CSV or XLSX file
+
+    The file is read in chunks of IMPORT_BATCH_SIZE rows. Each chunk
+    resolves its assignee emails with one query and its tasks and their
+    status history are loaded with COPY; the rollup and project counters
+    are adjusted once for the whole file. Invalid rows are skipped and
+    reported, the others are committed together at the end.
+
+    Args:
+        db: Database session
+        project_id: Project the tasks are added to
+        file: Uploaded file
+        file_format: "csv" or "xlsx"
+        created_by: User importing the tasks
+
+    Returns:
+        Number of imported tasks and the errors of skipped rows
+    """
+    project = db.query(Project.id).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    project_id = project.id
+
+    rows = read_import_rows(file, file_format)
+    now = datetime.now(timezone.utc)
+    imported = 0
+    errors: List[Dict[str, Any]] = []
+    rollup_deltas = Counter()
+    counter_deltas = Counter()
+
+    # Data rows are numbered from 2, after the header row
+    numbered = enumerate(rows, start=2)
+    while True:
+        try:
+            chunk = list(islice(numbered, settings.IMPORT_BATCH_SIZE))
+        except (UnicodeDecodeError, csv.Error, zipfile.BadZipFile):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File is not a valid {file_format.upper()} file"
+            )
+        if not chunk:
+            break
+
+        parsed = []
+        for row_number, row in chunk:
+            values = {column: _clean(column, row.get(column)) for column in IMPORT_COLUMNS}
+            if all(value is None for value in values.values()):
+                continue
+            email = values.pop("assignee_email")
+            try:
+                task = TaskBase(**{**values, "status": values["status"] or "Pending"})
+            except ValidationError as error:
+                errors.append({"row": row_number, "detail": _validation_message(error)})
+                continue
+            parsed.append((row_number, task, str(email).lower() if email else None))
+
+        # Resolve the chunk's assignee emails in one query
+        emails = {email for _, _, email in parsed if email}
+        user_ids = {}
+        if emails:
+            user_ids = dict(
+                db.query(func.lower(User.email), User.id).filter(func.lower(User.email).in_(emails)).all()
+            )
+
+        tasks = []
+        for row_number, task, email in parsed:
+            if email and email not in user_ids:
+                errors.append({"row": row_number, "detail": f"Unknown assignee email: {email}"})
+                continue
+            tasks.append({
+                "id": uuid.uuid4(),
+                "project_id": project_id,
+                "title": task.title,
+                "description": task.description,
+                "assigned_to": user_ids.get(email),
+                "due_date": task.due_date,
+                "status": task.status,
+                "priority": task.priority,
+                "created_by": created_by,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+        if not tasks:
+            continue
+        copy_rows(db, Task.__table__, tasks)
+        copy_rows(db, TaskStatusTransition.__table__, [
+            {"id": uuid.uuid4(), "changed_at": now,
+             **status_transition(task["id"], project_id, None, task["status"], changed_by=created_by)}
+            for task in tasks
+        ])
+        for task in tasks:
+            rollup_deltas.update(task_rollup_deltas(project_id, task["status"], now, now))
+            counter_deltas.update(task_counter_deltas(project_id, task["status"]))
+        imported += len(tasks)
+
+    if imported:
+        apply_rollup_deltas(db, rollup_deltas)
+        apply_counter_deltas(db, counter_deltas)
+        invalidate_analytics(db)
+        db.flush()
+
+    # Email lookups are per chunk, so their errors come after the chunk's others
+    errors.sort(key=lambda error: error["row"])
+    return {"imported": imported, "errors": errors}
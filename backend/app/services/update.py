@@ -1,11 +1,25 @@
+from datetime import date
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 import uuid
 
+from app.core.db import delete_or_404, update_or_404
+from app.core.pagination import Page, SortKey, paginate
 from app.models.update import WeeklyUpdate
 from app.models.project import Project
 from app.schemas.update import UpdateCreate, UpdateUpdate
+from app.services.analytics import invalidate_analytics
+from app.services.counters import UPDATES_COUNT, apply_counter_deltas
+from app.services.rollup import apply_rollup_deltas, update_rollup_deltas
+from app.services.summaries import SUMMARY_PENDING, queue_update_summary
+
+
+# Updates are listed newest first, then by ID
+UPDATE_SORT_KEYS = [
+    SortKey(WeeklyUpdate.date, lambda update: update.date, date.fromisoformat),
+    SortKey(WeeklyUpdate.id, lambda update: update.id, uuid.UUID),
+]
 
 
 def get_update(db: Session, update_id: str) -> Optional[WeeklyUpdate]:
@@ -15,18 +29,25 @@ def get_update(db: Session, update_id: str) -> Optional[WeeklyUpdate]:
     return db.query(WeeklyUpdate).filter(WeeklyUpdate.id == update_id).first()
 
 
-def get_updates_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100) -> List[WeeklyUpdate]:
+def get_updates_by_project(db: Session, project_id: str, skip: int = 0, limit: int = 100,
+                           cursor: Optional[str] = None) -> Page:
     """
     Get updates for a project
+
+    Pass the next_cursor of a page as `cursor` to get the following page;
+    `skip` is only used without a cursor.
     """
-    return db.query(WeeklyUpdate).filter(
-        WeeklyUpdate.project_id == project_id
-    ).order_by(WeeklyUpdate.date.desc()).offset(skip).limit(limit).all()
+    query = db.query(WeeklyUpdate).filter(WeeklyUpdate.project_id == project_id)
+    return paginate(query, UPDATE_SORT_KEYS, cursor=cursor, skip=skip, limit=limit, descending=True)
 
 
-def create_update(db: Session, update: UpdateCreate, project_id: str, user_id: str) -> WeeklyUpdate:
+def create_update(db: Session, update: UpdateCreate, project_id: str, user_id: str,
+                  summarize: bool = False) -> WeeklyUpdate:
     """
     Create a new update
+
+    With `summarize`, its AI summary is generated in the background once
+    the update is committed.
     """
     # Check if project exists
     project = db.query(Project).filter(Project.id == project_id).first()
@@ -44,33 +65,42 @@ def create_update(db: Session, update: UpdateCreate, project_id: str, user_id: s
         date=update.date,
         status=update.status,
         notes=update.notes,
-        linked_task_ids=update.linked_task_ids  # Add this line
+        linked_task_ids=update.linked_task_ids,  # Add this line
+        ai_summary_status=SUMMARY_PENDING if summarize else None
     )
 
     db.add(db_update)
-    db.commit()
-    db.refresh(db_update)
+    db.flush()
+
+    # Record the new update in the analytics rollup
+    apply_rollup_deltas(db, update_rollup_deltas(db_update.project_id, db_update.created_at))
+    apply_counter_deltas(db, {(db_update.project_id, UPDATES_COUNT): 1})
+    invalidate_analytics(db)
+    if summarize:
+        queue_update_summary(db, db_update.id)
+
+    db.flush()
     return db_update
 
-def update_update(db: Session, update_id: str, update: UpdateUpdate) -> WeeklyUpdate:
+
+def update_update(db: Session, update_id: str, update: UpdateUpdate, summarize: bool = False) -> WeeklyUpdate:
     """
     Update an update
-    """
-    db_update = get_update(db, update_id=update_id)
-    if not db_update:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Update not found"
-        )
 
-    # Update fields
+    With `summarize`, its AI summary is regenerated in the background once
+    the change is committed.
+    """
     update_data = update.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_update, key, value)
+    if summarize:
+        update_data["ai_summary_status"] = SUMMARY_PENDING
+    db_update = update_or_404(db, WeeklyUpdate, update_id, update_data, detail="Update not found")
+    if summarize:
+        queue_update_summary(db, db_update.id)
 
-    db.add(db_update)
-    db.commit()
-    db.refresh(db_update)
+    if "status" in update_data:
+        invalidate_analytics(db)
+
+    db.flush()
     return db_update
 
 
@@ -78,15 +108,14 @@ def delete_update(db: Session, update_id: str) -> None:
     """
     Delete an update
     """
-    db_update = get_update(db, update_id=update_id)
-    if not db_update:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Update not found"
-        )
+    deleted = delete_or_404(db, WeeklyUpdate, update_id, detail="Update not found",
+                            returning=[WeeklyUpdate.project_id, WeeklyUpdate.created_at])
+
+    apply_rollup_deltas(db, update_rollup_deltas(deleted.project_id, deleted.created_at, sign=-1))
+    apply_counter_deltas(db, {(deleted.project_id, UPDATES_COUNT): -1})
+    invalidate_analytics(db)
 
-    db.delete(db_update)
-    db.commit()
+    db.flush()
 
 
 def get_latest_project_update(db: Session, project_id: str) -> Optional[WeeklyUpdate]:
@@ -1,10 +1,10 @@
+from collections import Counter
 from datetime import datetime, timedelta
-from operator import or_
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, distinct
+from sqlalchemy import func, distinct, cast, Date, case, or_
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash, verify_password
@@ -15,29 +15,97 @@ from app.models.task import Task
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.schemas.user import UserProjectSummary, UserSkill
+from app.services.analytics import invalidate_analytics
+from app.services.counters import UPDATES_COUNT, MEMBERS_COUNT, apply_counter_deltas
+from app.services.rollup import apply_rollup_deltas, UPDATES_CREATED
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 100, role: Optional[str] = None) -> List[User]:
+# Largest number of suggestions returned by user autocomplete
+AUTOCOMPLETE_LIMIT = 20
+
+# Shorter queries only match the start of a name, a word in it or an email:
+# trigram indexes cannot narrow down substring matches of one or two characters
+MIN_SUBSTRING_SEARCH_LENGTH = 3
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _filter_users_by_search(query, search: str):
+    """
+    Restrict a user query to name/email matches of `search`, best first
+
+    Matches at the start of the name or email come first, then matches at
+    the start of a word in the name, then any other substring match. The
+    ILIKE patterns are served by the pg_trgm GIN indexes on name and email.
     """
-    Get users with optional filtering by role
+    term = _escape_like(search.strip())
+    prefix = f"{term}%"
+    word_prefix = f"% {term}%"
+
+    prefix_match = or_(User.name.ilike(prefix, escape="\\"), User.email.ilike(prefix, escape="\\"))
+    word_match = User.name.ilike(word_prefix, escape="\\")
+    if len(search.strip()) >= MIN_SUBSTRING_SEARCH_LENGTH:
+        substring = f"%{term}%"
+        query = query.filter(or_(User.name.ilike(substring, escape="\\"),
+                                 User.email.ilike(substring, escape="\\")))
+    else:
+        query = query.filter(or_(prefix_match, word_match))
+
+    return query.order_by(
+        case((prefix_match, 0), (word_match, 1), else_=2),
+        func.length(User.name),
+        User.name,
+        User.id
+    )
+
+
+def get_users(db: Session, skip: int = 0, limit: int = 100, role: Optional[str] = None,
+              search: Optional[str] = None) -> List[User]:
+    """
+    Get users with optional filtering by role and name/email search
 
     Args:
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
         role: Optional role filter
+        search: Optional text matched against name and email
 
     Returns:
-        List of users
+        List of users, best search matches first
     """
     query = db.query(User)
 
     if role:
         query = query.filter(User.role == role)
 
+    if search and search.strip():
+        query = _filter_users_by_search(query, search)
+
     return query.offset(skip).limit(limit).all()
 
 
+def autocomplete_users(db: Session, query: str, limit: int = 10) -> List[User]:
+    """
+    Suggestions for a user picker, best matches first
+
+    Args:
+        db: Database session
+        query: Text typed so far
+        limit: Maximum number of suggestions (at most AUTOCOMPLETE_LIMIT)
+
+    Returns:
+        List of active matching users
+    """
+    if not query.strip():
+        return []
+
+    users = db.query(User).filter(User.is_active.isnot(False))
+    return _filter_users_by_search(users, query).limit(min(limit, AUTOCOMPLETE_LIMIT)).all()
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """
     Get a user by email
@@ -97,8 +165,8 @@ def create_user(db: Session, user: UserCreate) -> User:
     )
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    invalidate_analytics(db)
+    db.flush()
 
     return db_user
 
@@ -133,9 +201,11 @@ def update_user(db: Session, user_id: UUID, user: UserUpdate) -> User:
     for field, value in update_data.items():
         setattr(db_user, field, value)
 
+    if "role" in update_data:
+        invalidate_analytics(db)
+
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db.flush()
 
     return db_user
 
@@ -172,8 +242,8 @@ def update_user_role(db: Session, user_id: UUID, role: str) -> User:
     db_user.role = role
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    invalidate_analytics(db)
+    db.flush()
 
     return db_user
 
@@ -196,7 +266,25 @@ def delete_user(db: Session, user_id: str):
     try:
         # Cleanup related records before deleting the user
 
-        # 1. Delete weekly updates created by this user
+        # 1. Delete weekly updates created by this user, removing them from the analytics rollup
+        update_days = cast(WeeklyUpdate.created_at, Date)
+        update_counts = db.query(WeeklyUpdate.project_id, update_days, func.count(WeeklyUpdate.id)) \
+            .filter(WeeklyUpdate.user_id == user_id) \
+            .group_by(WeeklyUpdate.project_id, update_days) \
+            .all()
+        apply_rollup_deltas(db, {
+            (project_id, day, UPDATES_CREATED): -count for project_id, day, count in update_counts
+        })
+
+        # Remove the user's updates and memberships from the project counters
+        counter_deltas = Counter()
+        for project_id, _, count in update_counts:
+            counter_deltas[(project_id, UPDATES_COUNT)] -= count
+        member_projects = db.query(ProjectMember.project_id).filter(ProjectMember.user_id == user_id).all()
+        for project_id, in member_projects:
+            counter_deltas[(project_id, MEMBERS_COUNT)] -= 1
+        apply_counter_deltas(db, counter_deltas)
+
         deleted_updates = db.query(WeeklyUpdate).filter(WeeklyUpdate.user_id == user_id).delete()
         print(f"Deleted {deleted_updates} weekly updates for user {user_id}")
 
@@ -205,11 +293,14 @@ def delete_user(db: Session, user_id: str):
         print(f"Deleted {deleted_memberships} project memberships for user {user_id}")
 
         # 3. Set assigned_to to NULL for tasks assigned to this user
-        updated_tasks = db.query(Task).filter(Task.assigned_to == user_id).update({"assigned_to": None})
+        # (keep updated_at: the analytics rollup buckets completed tasks by it)
+        updated_tasks = db.query(Task).filter(Task.assigned_to == user_id) \
+            .update({"assigned_to": None, "updated_at": Task.updated_at})
         print(f"Updated {updated_tasks} tasks assigned to user {user_id}")
 
         # 4. Set created_by to NULL for tasks created by this user
-        updated_creator_tasks = db.query(Task).filter(Task.created_by == user_id).update({"created_by": None})
+        updated_creator_tasks = db.query(Task).filter(Task.created_by == user_id) \
+            .update({"created_by": None, "updated_at": Task.updated_at})
         print(f"Updated {updated_creator_tasks} tasks created by user {user_id}")
 
         # 5. Set created_by to NULL for projects created by this user
@@ -218,10 +309,10 @@ def delete_user(db: Session, user_id: str):
 
         # 6. Now delete the user
         db.delete(db_user)
-        db.commit()
+        invalidate_analytics(db)
+        db.flush()
         return True
     except Exception as e:
-        db.rollback()
         print(f"Error deleting user: {str(e)}")
         raise
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
@@ -258,12 +349,10 @@ def search_users(db: Session, query: str, limit: int = 10) -> List[User]:
     Returns:
         List of matching users
     """
-    return db.query(User).filter(
-        or_(
-            User.name.ilike(f"%{query}%"),
-            User.email.ilike(f"%{query}%")
-        )
-    ).limit(limit).all()
+    if not query.strip():
+        return []
+
+    return _filter_users_by_search(db.query(User), query).limit(limit).all()
 
 def get_user_stats(db: Session, user_id: str) -> Dict[str, Any]:
     """
@@ -0,0 +1,32 @@
+"""
+Batch summarization script.
+Run this to write AI summaries for all weekly updates that have none,
+several updates per prompt:
+
+    python -m app.summarize_updates [--limit N]
+"""
+
+import argparse
+
+from app.services.ai import ai_available
+from app.services.summaries import summarize_pending_updates
+
+
+def print_progress(totals):
+    print(f"Batch {totals['batches']}: {totals['summarized'] + totals['failed']}/{totals['total']} updates, "
+          f"{totals['failed']} failed")
+
+
+def summarize_updates(limit=None):
+    if not ai_available():
+        print("AI summaries are not available; set AI_PROVIDER and OPENAI_API_KEY.")
+        return
+
+    totals = summarize_pending_updates(limit=limit, progress=print_progress)
+    print(f"{totals['summarized']} updates summarized in {totals['batches']} prompts, {totals['failed']} failed.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize weekly updates without an AI summary")
+    parser.add_argument("--limit", type=int, default=None, help="Most updates to summarize")
+    summarize_updates(limit=parser.parse_args().limit)
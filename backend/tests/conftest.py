@@ -0,0 +1,67 @@
+"""
+Fixtures for tests that need PostgreSQL.
+
+Services that rely on PostgreSQL features (arrays, RETURNING, COPY) are
+tested against the database named by TEST_DATABASE_URL, whose tables are
+dropped and recreated; without it those tests are skipped.
+"""
+
+import os
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 (registers every table)
+from app.core.db import Base
+from app.models import Project, User
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def pg_engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def pg_sessionmaker(pg_engine):
+    # Configured like app.core.db.SessionLocal
+    yield sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=pg_engine)
+
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with pg_engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+
+@pytest.fixture
+def pg_db(pg_sessionmaker):
+    db = pg_sessionmaker()
+    yield db
+    db.rollback()
+    db.close()
+
+
+@pytest.fixture
+def pg_user(pg_db):
+    user = User(id=uuid.uuid4(), email="manager@example.com", name="Manager", password_hash="x", role="Manager")
+    pg_db.add(user)
+    pg_db.commit()
+    return user
+
+
+@pytest.fixture
+def pg_project(pg_db, pg_user):
+    project = Project(id=uuid.uuid4(), name="Apollo", start_date=date(2025, 1, 1), end_date=date(2025, 12, 31),
+                      status="Active", created_by=pg_user.id)
+    pg_db.add(project)
+    pg_db.commit()
+    return project
@@ -0,0 +1,41 @@
+"""
+Tests for the AI response cache keys and its in-memory LRU level.
+"""
+
+import time
+
+from app.core.cache import LRUCache
+from app.services.ai_cache import cache_key
+
+
+def test_cache_key_depends_on_every_part():
+    """Keys change with the model, the system prompt and the input"""
+    key = cache_key("gpt", "system", "notes")
+    assert key == cache_key("gpt", "system", "notes")
+    assert len(key) == 64
+    assert key != cache_key("gpt-4", "system", "notes")
+    assert key != cache_key("gpt", "other", "notes")
+    assert key != cache_key("gpt", "system", "other notes")
+    assert cache_key("gpt", "ab", "c") != cache_key("gpt", "a", "bc")
+
+
+def test_lru_evicts_least_recently_used():
+    """The least recently read entry is evicted first"""
+    cache = LRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_expires_after_ttl():
+    """Entries are misses once the TTL has passed"""
+    cache = LRUCache(max_entries=10, ttl_seconds=0.01)
+    cache.set("a", "1")
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["hitRate"] == 0.0
@@ -0,0 +1,52 @@
+"""
+Tests for the offline AI providers.
+"""
+
+import time
+from datetime import date, timedelta
+
+from app.services.ai_providers import LocalProvider, SimulatedLatencyProvider, extractive_summary
+
+
+def _project(**facts):
+    project = {
+        "name": "Website", "status": "Active",
+        "start_date": date.today() - timedelta(days=90), "end_date": date.today() + timedelta(days=10),
+        "total_tasks": 10, "completed_tasks": 1, "in_progress_tasks": 4, "pending_tasks": 5,
+        "completion_percentage": 10, "blocked_updates": 0,
+        "updates": [{"date": date.today(), "status": "Blocked", "notes": "Waiting on review. Nothing else."}],
+    }
+    project.update(facts)
+    return project
+
+
+def test_extractive_summary_keeps_representative_sentences():
+    """The sentences sharing the most words with the text are kept, in order"""
+    notes = ("Finished the login API. The API tests for login pass. Lunch was good. "
+             "Started the API docs. Next week: login API review.")
+    summary = extractive_summary(notes, max_sentences=2)
+    assert summary == extractive_summary(notes, max_sentences=2)
+    assert "Lunch" not in summary
+    assert summary.count(".") == 2
+
+
+def test_short_notes_are_kept_whole():
+    """Notes shorter than the summary are returned as they are"""
+    assert extractive_summary("  Done.\nAll good. ") == "Done. All good."
+
+
+def test_local_risk_follows_schedule():
+    """A project far behind schedule is a high risk, one ahead a low risk"""
+    provider = LocalProvider()
+    assert provider.analyze_delay(_project(), "").startswith("High risk")
+    assert provider.analyze_delay(_project(completed_tasks=10), "").startswith("Low risk")
+    assert "Status report: Website" in provider.write_report(_project(), "")
+
+
+def test_simulated_latency_delays_calls():
+    """Every call waits for the configured latency"""
+    provider = SimulatedLatencyProvider(LocalProvider(), latency_seconds=0.05)
+    started = time.monotonic()
+    assert provider.summarize_update("Done.") == "Done."
+    assert time.monotonic() - started >= 0.05
+    assert provider.model == LocalProvider.model
@@ -0,0 +1,106 @@
+"""
+Tests for the circuit breaker and the bounded, retrying AI provider.
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.core.breaker import CircuitBreaker
+from app.services.ai_providers import AIProvider, AIUnavailableError, ResilientProvider
+
+
+class FlakyProvider(AIProvider):
+    def __init__(self, failures, error=TimeoutError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def summarize_update(self, notes):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("provider unavailable")
+        return notes
+
+
+def _resilient(provider, breaker=None, max_retries=2, max_concurrency=4, wait_seconds=1.0):
+    breaker = breaker or CircuitBreaker(failure_threshold=10, reset_seconds=60)
+    return ResilientProvider(provider, breaker, max_concurrency=max_concurrency, wait_seconds=wait_seconds,
+                             max_retries=max_retries, backoff_seconds=0.001)
+
+
+def test_breaker_opens_and_recovers():
+    """The circuit opens after the threshold and closes after a good trial call"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.02)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open()
+    assert not breaker.allow()
+
+    time.sleep(0.03)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.stats()["state"] == "closed"
+
+
+def test_transient_errors_are_retried():
+    """Timeouts are retried; client errors are not"""
+    provider = FlakyProvider(failures=2)
+    assert _resilient(provider).summarize_update("done") == "done"
+    assert provider.calls == 3
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    provider = FlakyProvider(failures=1, error=BadRequest)
+    with pytest.raises(BadRequest):
+        _resilient(provider).summarize_update("done")
+    assert provider.calls == 1
+
+
+def test_other_errors_neither_retry_nor_open_the_circuit():
+    """A malformed answer or a bug is raised at once and not counted as an outage"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    provider = FlakyProvider(failures=100, error=ValueError)
+    resilient = _resilient(provider, breaker=breaker, max_retries=3)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            resilient.summarize_update("done")
+    assert provider.calls == 3
+    assert not breaker.is_open()
+    assert breaker.stats()["consecutiveFailures"] == 0
+
+
+def test_open_circuit_fails_fast():
+    """Once the circuit is open the provider is not called"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    provider = FlakyProvider(failures=100)
+    resilient = _resilient(provider, breaker=breaker, max_retries=5)
+    with pytest.raises(AIUnavailableError):
+        resilient.summarize_update("done")
+    assert provider.calls == 2
+    with pytest.raises(AIUnavailableError):
+        resilient.summarize_update("done")
+    assert provider.calls == 2
+
+
+def test_concurrency_is_bounded():
+    """A call that cannot get a slot in time is refused"""
+    release = threading.Event()
+
+    class SlowProvider(AIProvider):
+        def summarize_update(self, notes):
+            release.wait()
+            return notes
+
+    resilient = _resilient(SlowProvider(), max_concurrency=1, wait_seconds=0.01)
+    worker = threading.Thread(target=resilient.summarize_update, args=("first",))
+    worker.start()
+    time.sleep(0.01)
+    with pytest.raises(AIUnavailableError):
+        resilient.summarize_update("second")
+    release.set()
+    worker.join()
@@ -0,0 +1,82 @@
+"""
+Tests for the analytics snapshot cache.
+"""
+
+import threading
+import time
+
+from app.core.cache import SnapshotCache
+
+
+def test_cache_hit_after_miss():
+    """Second lookup is served from the cache"""
+    cache = SnapshotCache(ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    assert cache.get_or_compute("projects", compute) == {"value": 1}
+    assert cache.get_or_compute("projects", compute) == {"value": 1}
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_expires_after_ttl():
+    """Entries are recomputed once the TTL has passed"""
+    cache = SnapshotCache(ttl_seconds=0.01)
+    cache.get_or_compute("projects", lambda: 1)
+    time.sleep(0.02)
+    assert cache.get_or_compute("projects", lambda: 2) == 2
+
+
+def test_invalidate_drops_entries():
+    """Invalidation forces a recomputation"""
+    cache = SnapshotCache(ttl_seconds=60)
+    cache.get_or_compute("projects", lambda: 1)
+    cache.invalidate()
+    assert cache.get_or_compute("projects", lambda: 2) == 2
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_value_computed_during_invalidation_is_not_stored():
+    """A snapshot that raced with an invalidation is not cached"""
+    cache = SnapshotCache(ttl_seconds=60)
+
+    def compute():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_compute("projects", compute) == "stale"
+    assert cache.get_or_compute("projects", lambda: "fresh") == "fresh"
+
+
+def test_single_computation_per_key():
+    """Concurrent misses on one key run a single computation"""
+    cache = SnapshotCache(ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "snapshot"
+
+    threads = [threading.Thread(target=cache.get_or_compute, args=("users", compute)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 7
+
+
+def test_key_locks_do_not_grow_with_keys():
+    """Many distinct keys share a fixed set of locks"""
+    cache = SnapshotCache(ttl_seconds=0, lock_stripes=4)
+    for day in range(100):
+        assert cache.get_or_compute(("trend", day), lambda: day) == day
+    assert len(cache._key_locks) == 4
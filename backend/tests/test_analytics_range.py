@@ -0,0 +1,37 @@
+"""
+Tests for analytics time-range resolution.
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.analytics import resolve_time_range, _bucket_labels
+
+
+def test_default_range_covers_last_six_buckets():
+    """Without a start date the range starts six buckets back"""
+    end = date(2025, 3, 20)
+    assert resolve_time_range(None, end, "month") == (date(2024, 10, 1), end)
+    assert resolve_time_range(None, end, "week") == (date(2025, 2, 10), end)
+    assert resolve_time_range(None, end, "quarter") == (date(2023, 10, 1), end)
+
+
+def test_invalid_ranges_are_rejected():
+    """Unknown granularity, reversed and oversized ranges are 400s"""
+    for args in [
+        (None, date(2025, 1, 1), "year"),
+        (date(2025, 2, 1), date(2025, 1, 1), "day"),
+        (date(2000, 1, 1), date(2025, 1, 1), "day"),
+    ]:
+        with pytest.raises(HTTPException) as error:
+            resolve_time_range(*args)
+        assert error.value.status_code == 400
+
+
+def test_bucket_labels():
+    """Labels match the granularity of the bucket"""
+    assert _bucket_labels(date(2025, 4, 1), "month") == ("Apr", "2025-04")
+    assert _bucket_labels(date(2025, 4, 1), "quarter") == ("Q2 2025", "2025-Q2")
+    assert _bucket_labels(date(2025, 4, 7), "week") == ("Apr 07", "2025-04-07")
@@ -0,0 +1,51 @@
+"""
+Tests for packing updates into batch summarization prompts.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ai_providers import OpenAIProvider
+from app.services.summaries import estimate_tokens, pack_batches
+
+
+def _rows(*lengths):
+    return [SimpleNamespace(id=index, notes="x" * length) for index, length in enumerate(lengths)]
+
+
+def test_batches_respect_token_budget():
+    """Updates are packed in order until the next one would exceed the budget"""
+    rows = _rows(40, 40, 40, 40)
+    budget = 2 * estimate_tokens(rows[0].notes)
+    batches = pack_batches(rows, token_budget=budget, max_items=10)
+    assert [[row.id for row in batch] for batch in batches] == [[0, 1], [2, 3]]
+
+
+def test_batches_respect_max_items():
+    """No prompt holds more than max_items updates"""
+    batches = pack_batches(_rows(*[4] * 5), token_budget=1000, max_items=2)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_oversized_update_gets_its_own_batch():
+    """An update over the budget is sent alone rather than dropped"""
+    batches = pack_batches(_rows(4, 400, 4), token_budget=20, max_items=10)
+    assert [[row.id for row in batch] for batch in batches] == [[0], [1], [2]]
+
+
+def _openai_answering(content):
+    provider = OpenAIProvider(api_key="key", model="model", timeout_seconds=1, max_connections=1)
+    message = SimpleNamespace(content=content)
+    create = lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    provider._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return provider
+
+
+def test_openai_batch_answer_is_parsed():
+    """One summary per update is read from the model's JSON array"""
+    provider = _openai_answering('Here you go: ["First.", "Second."]')
+    assert provider.summarize_updates(["a", "b"]) == ["First.", "Second."]
+
+    with pytest.raises(ValueError):
+        _openai_answering('["Only one."]').summarize_updates(["a", "b"])
@@ -0,0 +1,19 @@
+"""
+Tests for project counter deltas.
+"""
+
+from app.services.counters import task_counter_deltas, TASK_COUNT, DONE_TASK_COUNT
+
+
+def test_done_task_counts_twice():
+    """A Done task adds to both the task and done task counters"""
+    assert task_counter_deltas("p1", "Done") == {("p1", TASK_COUNT): 1, ("p1", DONE_TASK_COUNT): 1}
+    assert task_counter_deltas("p1", "Pending") == {("p1", TASK_COUNT): 1}
+
+
+def test_status_change_moves_done_count_only():
+    """Reopening a Done task leaves the total unchanged"""
+    deltas = task_counter_deltas("p1", "Done", sign=-1)
+    deltas.update(task_counter_deltas("p1", "In Progress"))
+    assert deltas[("p1", TASK_COUNT)] == 0
+    assert deltas[("p1", DONE_TASK_COUNT)] == -1
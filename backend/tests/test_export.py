@@ -0,0 +1,81 @@
+"""
+Tests for streaming exports.
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Date, DateTime, Integer, MetaData, String, Table, Uuid, create_engine, select
+
+from app.core.security import get_current_user
+from app.main import app
+from app.services.export import stream_export
+
+TASK_ID = uuid.UUID("6f1c2c1e-8a58-4f0e-9a49-0b7c6c3b2f11")
+
+metadata = MetaData()
+rows = Table(
+    "rows", metadata,
+    Column("position", Integer, primary_key=True),
+    Column("id", Uuid),
+    Column("title", String),
+    Column("due_date", Date),
+    Column("updated_at", DateTime(timezone=True)),
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(rows.insert(), [
+            {"position": 1, "id": TASK_ID, "title": "Write spec, then review", "due_date": date(2025, 3, 1),
+             "updated_at": datetime(2025, 2, 1, 9, 30, tzinfo=timezone.utc)},
+            {"position": 2, "id": None, "title": "Ship", "due_date": None, "updated_at": None},
+            {"position": 3, "id": None, "title": "Celebrate", "due_date": None, "updated_at": None},
+        ])
+    yield engine
+    engine.dispose()
+
+
+def _stmt():
+    return select(rows.c.id, rows.c.title, rows.c.due_date, rows.c.updated_at).order_by(rows.c.position)
+
+
+def test_ndjson_has_one_object_per_line(engine):
+    """UUIDs and dates are written as strings, one chunk per batch"""
+    chunks = list(stream_export(engine, _stmt(), "ndjson", batch_size=2))
+    assert len(chunks) == 2
+    lines = "".join(chunks).splitlines()
+    assert json.loads(lines[0]) == {"id": str(TASK_ID), "title": "Write spec, then review",
+                                    "due_date": "2025-03-01", "updated_at": "2025-02-01T09:30:00"}
+    assert json.loads(lines[1]) == {"id": None, "title": "Ship", "due_date": None, "updated_at": None}
+    assert len(lines) == 3
+
+
+def test_csv_has_a_header_and_quoted_values(engine):
+    """The header row comes first and values with commas are quoted"""
+    text = "".join(stream_export(engine, _stmt(), "csv", batch_size=2))
+    assert text.splitlines()[1].startswith(f'{TASK_ID},"Write spec, then review",2025-03-01,')
+    parsed = list(csv.reader(io.StringIO(text)))
+    assert parsed[0] == ["id", "title", "due_date", "updated_at"]
+    assert parsed[2] == ["", "Ship", "", ""]
+    assert len(parsed) == 4
+
+
+@pytest.mark.parametrize("path", ["/api/export/tasks", "/api/export/updates", "/api/export/analytics"])
+def test_export_requires_admin_or_manager(path):
+    """Contributors get a 403 before any row is read"""
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(role="Contributor")
+    try:
+        response = TestClient(app).get(path)
+    finally:
+        app.dependency_overrides.pop(get_current_user)
+    assert response.status_code == 403
@@ -0,0 +1,70 @@
+"""
+Tests for the background job queue.
+"""
+
+import threading
+
+from app.core.jobs import JobQueue
+
+
+def test_failed_job_is_retried():
+    """A job that fails is retried until it succeeds"""
+    queue = JobQueue("test", max_workers=1, max_pending=1, max_retries=3, backoff_seconds=0.001)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("provider unavailable")
+
+    assert queue.submit(flaky)
+    queue.shutdown(wait=True)
+    assert len(attempts) == 3
+    assert queue.stats()["retried"] == 2
+    assert queue.stats()["completed"] == 1
+
+
+def test_on_failure_after_last_retry():
+    """on_failure is called once retries are exhausted"""
+    queue = JobQueue("test", max_workers=1, max_pending=1, max_retries=1, backoff_seconds=0.001)
+    errors = []
+
+    def broken():
+        raise RuntimeError("provider unavailable")
+
+    queue.submit(broken, on_failure=errors.append)
+    queue.shutdown(wait=True)
+    assert len(errors) == 1
+    assert queue.stats()["failed"] == 1
+
+
+def test_only_accepted_errors_are_retried():
+    """An error that retry_if rejects fails the job at once"""
+    queue = JobQueue("test", max_workers=1, max_pending=1, max_retries=3, backoff_seconds=0.001,
+                     retry_if=lambda error: isinstance(error, TimeoutError))
+    attempts = []
+    errors = []
+
+    def invalid():
+        attempts.append(1)
+        raise ValueError("malformed answer")
+
+    queue.submit(invalid, on_failure=errors.append)
+    queue.shutdown(wait=True)
+    assert len(attempts) == 1
+    assert isinstance(errors[0], ValueError)
+    assert queue.stats()["retried"] == 0
+
+
+def test_submit_refused_when_full():
+    """Jobs beyond the running and pending limits are refused"""
+    queue = JobQueue("test", max_workers=1, max_pending=1, max_retries=0, backoff_seconds=0)
+    release = threading.Event()
+
+    assert queue.submit(release.wait)
+    assert queue.submit(release.wait)
+    assert not queue.submit(release.wait)
+    release.set()
+    queue.shutdown(wait=True)
+    assert queue.stats()["rejected"] == 1
+
@@ -0,0 +1,99 @@
+"""
+Tests for the "My work" overview.
+"""
+
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.models import Project, ProjectMember, Task, WeeklyUpdate
+from app.services import overview
+from app.services.overview import get_my_overview
+
+TODAY = date(2025, 6, 11)
+
+
+def test_groups_keep_bucket_order_and_totals(monkeypatch):
+    """Tasks are grouped per project in bucket order; totals count truncated tasks too"""
+    project = SimpleNamespace(id="p1", name="Apollo", status="Active", end_date=None, task_count=4,
+                              done_task_count=1, is_member=True)
+    tasks = [
+        SimpleNamespace(id=f"t{number}", project_id="p1", title="Task", status="Pending", priority=None,
+                        due_date=None, bucket=bucket, total=total)
+        for number, (bucket, total) in enumerate([("later", 1), ("overdue", 5), ("overdue", 5)])
+    ]
+    monkeypatch.setattr(overview, "_projects", lambda db, user_id: [project])
+    monkeypatch.setattr(overview, "_open_tasks", lambda db, user_id, today, per_bucket: tasks)
+    monkeypatch.setattr(overview, "_latest_updates", lambda db, project_ids: {})
+
+    [result] = get_my_overview(None, "u1", today=TODAY)["projects"]
+    assert [group["bucket"] for group in result["task_groups"]] == ["overdue", "later"]
+    assert [group["total"] for group in result["task_groups"]] == [5, 1]
+    assert [task["id"] for task in result["task_groups"][0]["tasks"]] == ["t1", "t2"]
+    assert result["open_tasks"] == 6
+    assert result["progress"] == 25
+    assert result["latest_update"] is None
+
+
+@pytest.fixture
+def add_task(pg_db, pg_user, pg_project):
+    def add(due_date, status="Pending", project_id=None):
+        pg_db.add(Task(id=uuid.uuid4(), project_id=project_id or pg_project.id, title=f"Due {due_date}",
+                       status=status, assigned_to=pg_user.id, due_date=due_date))
+        pg_db.commit()
+    return add
+
+
+def _buckets(pg_db, pg_user):
+    [project] = get_my_overview(pg_db, pg_user.id, today=TODAY)["projects"]
+    return {group["bucket"]: [task["due_date"] for task in group["tasks"]] for group in project["task_groups"]}
+
+
+def test_due_bucket_boundaries(pg_db, pg_user, add_task):
+    """Today is its own bucket, this week ends 7 days ahead, undated tasks come last"""
+    for days in [-1, 0, 1, 7, 8]:
+        add_task(TODAY + timedelta(days=days))
+    add_task(None)
+    add_task(TODAY, status="Done")
+
+    assert _buckets(pg_db, pg_user) == {
+        "overdue": [TODAY - timedelta(days=1)],
+        "today": [TODAY],
+        "this_week": [TODAY + timedelta(days=1), TODAY + timedelta(days=7)],
+        "later": [TODAY + timedelta(days=8)],
+        "no_due_date": [None],
+    }
+
+
+def test_buckets_are_truncated(pg_db, pg_user, add_task, monkeypatch):
+    """Each bucket lists its earliest tasks up to the limit, with the full total"""
+    monkeypatch.setattr(settings, "OVERVIEW_TASKS_PER_BUCKET", 2)
+    for days in [5, 3, 4]:
+        add_task(TODAY - timedelta(days=days))
+
+    [project] = get_my_overview(pg_db, pg_user.id, today=TODAY)["projects"]
+    [group] = project["task_groups"]
+    assert group["total"] == 3
+    assert [task["due_date"] for task in group["tasks"]] == [TODAY - timedelta(days=5), TODAY - timedelta(days=4)]
+    assert project["open_tasks"] == 3
+    assert project["is_member"] is False
+
+
+def test_projects_and_latest_update(pg_db, pg_user, pg_project):
+    """Member projects are listed without open tasks; the latest update falls back to the notes"""
+    pg_db.add(ProjectMember(project_id=pg_project.id, user_id=pg_user.id, role="Team Member"))
+    for day, notes in [(1, "Older notes"), (2, "Newest notes")]:
+        pg_db.add(WeeklyUpdate(id=uuid.uuid4(), project_id=pg_project.id, user_id=pg_user.id,
+                               date=date(2025, 6, day), status="In Progress", notes=notes, linked_task_ids=[]))
+    other = Project(id=uuid.uuid4(), name="Other", start_date=TODAY, end_date=TODAY, status="Active")
+    pg_db.add(other)
+    pg_db.commit()
+
+    [project] = get_my_overview(pg_db, pg_user.id, today=TODAY)["projects"]
+    assert project["id"] == pg_project.id
+    assert (project["is_member"], project["open_tasks"], project["task_groups"]) == (True, 0, [])
+    assert project["latest_update"]["summary"] == "Newest notes"
+    assert project["latest_update"]["author_name"] == pg_user.name
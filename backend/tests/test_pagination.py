@@ -0,0 +1,30 @@
+"""
+Tests for keyset pagination cursors.
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import SortKey, encode_cursor, decode_cursor
+
+KEYS = [
+    SortKey(None, lambda row: row[0], date.fromisoformat),
+    SortKey(None, lambda row: row[1], uuid.UUID),
+]
+
+
+def test_cursor_round_trip():
+    """A cursor decodes back to the sort-key values it was built from"""
+    values = [date(2025, 3, 1), uuid.uuid4()]
+    assert decode_cursor(encode_cursor(values), KEYS) == values
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor(["2025-03-01"]), encode_cursor(["x", "y"])])
+def test_invalid_cursor_is_rejected(cursor):
+    """Malformed cursors are 400s"""
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, KEYS)
+    assert error.value.status_code == 400
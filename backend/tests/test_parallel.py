@@ -0,0 +1,59 @@
+"""
+Tests for running analytics sections concurrently.
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.parallel import run_sections
+
+
+@pytest.fixture
+def db():
+    session = Session(bind=create_engine("sqlite://"))
+    yield session
+    session.close()
+
+
+def test_sections_run_on_separate_sessions(db):
+    """Each section gets a session of its own on the same engine"""
+    barrier = threading.Barrier(3, timeout=5)
+    sessions = {}
+
+    def section(name):
+        def run(session):
+            # All three must be running at once to get past the barrier
+            barrier.wait()
+            sessions[name] = session
+            return session.execute(text("SELECT 1")).scalar()
+        return run
+
+    results = run_sections(db, {name: section(name) for name in "abc"}, max_workers=3)
+    assert results == {"a": 1, "b": 1, "c": 1}
+    assert len({id(session) for session in sessions.values()} | {id(db)}) == 4
+    assert all(session.get_bind() is db.get_bind() for session in sessions.values())
+
+
+def test_results_are_returned_per_key(db):
+    """Results are keyed like the sections, whatever order they finish in"""
+    sections = {key: (lambda session, key=key: key * 2) for key in range(8)}
+    assert run_sections(db, sections, max_workers=4) == {key: key * 2 for key in range(8)}
+
+
+def test_single_worker_runs_on_the_request_session(db):
+    """With a cap of 1 the sections run in turn on `db`"""
+    used = []
+    run_sections(db, {"a": used.append, "b": used.append}, max_workers=1)
+    assert used == [db, db]
+
+
+def test_section_error_reaches_the_caller(db):
+    """An exception in one section is raised by run_sections"""
+    def broken(session):
+        raise ValueError("bad section")
+
+    with pytest.raises(ValueError, match="bad section"):
+        run_sections(db, {"ok": lambda session: 1, "broken": broken}, max_workers=2)
@@ -0,0 +1,50 @@
+"""
+Tests for batch delay-risk scoring.
+"""
+
+from datetime import date
+
+from app.services.risk import score_delay_risk
+
+TODAY = date(2025, 7, 1)
+
+
+def test_risk_matches_schedule_gap():
+    """Half the schedule elapsed with no task done is Medium risk"""
+    scores = score_delay_risk(
+        [date(2025, 1, 1)], [date(2025, 12, 31)], [10], [0], [0], today=TODAY
+    )
+    assert scores["riskPercentage"][0] == 49
+    assert scores["risk"][0] == "Medium"
+
+
+def test_risk_is_clamped_and_levelled():
+    """Scores stay within 0-100 and map to Low/Medium/High"""
+    scores = score_delay_risk(
+        [date(2025, 1, 1), date(2025, 1, 1), date(2024, 1, 1)],
+        [date(2025, 12, 31), date(2025, 12, 31), date(2024, 6, 1)],
+        [10, 0, 5],
+        [10, 0, 0],
+        [0, 0, 0],
+        today=TODAY
+    )
+    assert list(scores["riskPercentage"]) == [0, 49, 100]
+    assert list(scores["risk"]) == ["Low", "Medium", "High"]
+
+
+def test_projects_without_duration_are_invalid():
+    """Projects ending on their start date are not scored"""
+    scores = score_delay_risk(
+        [date(2025, 1, 1)], [date(2025, 1, 1)], [1], [0], [0], today=TODAY
+    )
+    assert not scores["valid"][0]
+
+
+def test_weights_and_thresholds_are_configurable():
+    """Blocked updates add points and thresholds can be moved"""
+    scores = score_delay_risk(
+        [date(2025, 1, 1)], [date(2025, 12, 31)], [10], [5], [3], today=TODAY,
+        blocked_weight=10, medium_threshold=20, high_threshold=25
+    )
+    assert scores["riskPercentage"][0] == 29
+    assert scores["risk"][0] == "High"
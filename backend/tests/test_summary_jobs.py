@@ -0,0 +1,67 @@
+"""
+Tests for the background summary job of a weekly update.
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+
+from app.models import WeeklyUpdate
+from app.services import summaries
+
+
+@pytest.fixture
+def pending_update(pg_db, pg_user, pg_project, pg_sessionmaker, monkeypatch):
+    monkeypatch.setattr(summaries, "SessionLocal", pg_sessionmaker)
+    update = WeeklyUpdate(id=uuid.uuid4(), project_id=pg_project.id, user_id=pg_user.id, date=date(2025, 5, 5),
+                          status="In Progress", notes="Shipped the importer.", ai_summary_status="pending",
+                          linked_task_ids=[])
+    pg_db.add(update)
+    pg_db.commit()
+    return update
+
+
+def _summary_state(pg_db, update_id):
+    pg_db.expire_all()
+    update = pg_db.get(WeeklyUpdate, update_id)
+    return update.ai_summary_status, update.ai_summary
+
+
+def test_summary_is_written(pg_db, pending_update, monkeypatch):
+    """A pending summary is claimed, generated and marked done"""
+    monkeypatch.setattr(summaries, "summarize_update_notes", lambda notes: f"Summary: {notes}")
+    summaries.run_update_summary(pending_update.id)
+    assert _summary_state(pg_db, pending_update.id) == ("done", "Summary: Shipped the importer.")
+
+
+def test_notes_edited_during_the_job_are_summarized_again(pg_db, pg_sessionmaker, pending_update, monkeypatch):
+    """An edit that did not ask for a new summary does not leave it running"""
+    queued = []
+
+    def summarize_while_edited(notes):
+        with pg_sessionmaker() as other:
+            other.get(WeeklyUpdate, pending_update.id).notes = "Shipped the exporter."
+            other.commit()
+        return f"Summary: {notes}"
+
+    monkeypatch.setattr(summaries, "summarize_update_notes", summarize_while_edited)
+    monkeypatch.setattr(summaries, "enqueue_update_summary", queued.append)
+    summaries.run_update_summary(pending_update.id)
+    assert _summary_state(pg_db, pending_update.id) == ("pending", None)
+    assert queued == [pending_update.id]
+
+    monkeypatch.setattr(summaries, "summarize_update_notes", lambda notes: f"Summary: {notes}")
+    summaries.run_update_summary(pending_update.id)
+    assert _summary_state(pg_db, pending_update.id) == ("done", "Summary: Shipped the exporter.")
+
+
+def test_failed_call_releases_the_claim(pg_db, pending_update, monkeypatch):
+    """The summary is pending again so that a retry can claim it"""
+    def fail(notes):
+        raise TimeoutError("provider timed out")
+
+    monkeypatch.setattr(summaries, "summarize_update_notes", fail)
+    with pytest.raises(TimeoutError):
+        summaries.run_update_summary(pending_update.id)
+    assert _summary_state(pg_db, pending_update.id) == ("pending", None)
@@ -0,0 +1,96 @@
+"""
+Tests for bulk task updates.
+"""
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.models import Project, Task
+from app.schemas.task import TaskBulkUpdate, TaskCreate
+from app.services.task import bulk_update_tasks, create_task
+
+
+def test_ids_with_patch_or_items_are_accepted():
+    """Both request forms validate"""
+    task_id = uuid.uuid4()
+    assert TaskBulkUpdate(ids=[task_id], patch={"status": "Done"}).ids == [task_id]
+    assert TaskBulkUpdate(items=[{"id": str(task_id), "priority": "Low"}]).items[0].id == task_id
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"ids": [str(uuid.uuid4())]},
+    {"patch": {"status": "Done"}},
+    {"ids": [str(uuid.uuid4())], "patch": {"status": "Done"}, "items": []},
+    {"items": [{"id": str(uuid.uuid4()), "status": "Finished"}]},
+])
+def test_invalid_bodies_are_rejected(body):
+    """Exactly one form is required and patches are validated like single updates"""
+    with pytest.raises(ValidationError):
+        TaskBulkUpdate(**body)
+
+
+def test_too_many_tasks_are_rejected(monkeypatch):
+    """More than TASK_BULK_MAX_ITEMS tasks is a 400, before any query"""
+    monkeypatch.setattr(settings, "TASK_BULK_MAX_ITEMS", 2)
+    bulk = TaskBulkUpdate(ids=[uuid.uuid4() for _ in range(3)], patch={"status": "Done"})
+    with pytest.raises(HTTPException) as error:
+        bulk_update_tasks(None, bulk)
+    assert error.value.status_code == 400
+
+
+@pytest.fixture
+def pg_tasks(pg_db, pg_user, pg_project):
+    tasks = [
+        create_task(pg_db, TaskCreate(title=f"Task {number}", status="Pending", priority="Low",
+                                      project_id=pg_project.id), created_by=pg_user.id)
+        for number in range(3)
+    ]
+    pg_db.commit()
+    return tasks
+
+
+def test_each_item_gets_its_own_patch(pg_db, pg_project, pg_tasks):
+    """Fields an item does not patch keep their values; counters follow the new statuses"""
+    first, second, third = pg_tasks
+    bulk = TaskBulkUpdate(items=[
+        {"id": str(third.id), "title": "Renamed"},
+        {"id": str(first.id), "status": "Done"},
+        {"id": str(second.id), "priority": "High", "status": "In Progress"},
+    ])
+    rows = bulk_update_tasks(pg_db, bulk)
+    pg_db.commit()
+
+    assert [row.id for row in rows] == [third.id, first.id, second.id]
+    pg_db.expire_all()
+    tasks = {task.id: task for task in pg_db.query(Task)}
+    assert (tasks[first.id].title, tasks[first.id].status, tasks[first.id].priority) == ("Task 0", "Done", "Low")
+    assert (tasks[second.id].status, tasks[second.id].priority) == ("In Progress", "High")
+    assert (tasks[third.id].title, tasks[third.id].status) == ("Renamed", "Pending")
+    project = pg_db.get(Project, pg_project.id)
+    assert (project.task_count, project.done_task_count) == (3, 1)
+
+
+def test_same_patch_for_all_ids(pg_db, pg_tasks):
+    """The uniform form sets the same values on every task"""
+    rows = bulk_update_tasks(pg_db, TaskBulkUpdate(ids=[task.id for task in pg_tasks], patch={"status": "Done"}))
+    assert {row.status for row in rows} == {"Done"}
+
+
+@pytest.mark.parametrize("missing_patch", [{"status": "Done"}, {}])
+def test_missing_task_fails_the_whole_update(pg_db, pg_tasks, missing_patch):
+    """A missing task is a 404 naming it, whether or not its patch changes anything"""
+    missing = uuid.uuid4()
+    bulk = TaskBulkUpdate(items=[{"id": str(pg_tasks[0].id), "status": "Done"}, {"id": str(missing), **missing_patch}])
+    with pytest.raises(HTTPException) as error:
+        bulk_update_tasks(pg_db, bulk)
+    assert error.value.status_code == 404
+    assert str(missing) in error.value.detail
+
+    # The request's transaction is rolled back, as get_db does
+    pg_db.rollback()
+    assert pg_db.get(Task, pg_tasks[0].id).status == "Pending"
@@ -0,0 +1,44 @@
+"""
+Tests for reading task import files.
+"""
+
+import io
+import zipfile
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.task_import import import_format, read_import_rows
+
+
+@pytest.mark.parametrize("filename,expected", [("tasks.csv", "csv"), ("Sprint 4.XLSX", "xlsx")])
+def test_import_format_from_extension(filename, expected):
+    """The format follows the file extension"""
+    assert import_format(filename) == expected
+
+
+@pytest.mark.parametrize("filename", [None, "tasks", "tasks.xls", "tasks.csv.zip"])
+def test_unsupported_import_format_is_rejected(filename):
+    """Other files are 400s"""
+    with pytest.raises(HTTPException) as error:
+        import_format(filename)
+    assert error.value.status_code == 400
+
+
+def test_csv_rows_use_normalized_headers():
+    """Headers are matched case-insensitively, with spaces as underscores"""
+    data = "\ufeffTitle,Due Date,Assignee Email\nWrite spec,2025-03-01,a@example.com\n".encode()
+    rows = list(read_import_rows(io.BytesIO(data), "csv"))
+    assert rows == [{"title": "Write spec", "due_date": "2025-03-01", "assignee_email": "a@example.com"}]
+
+
+def test_zip_that_is_not_a_workbook_is_rejected():
+    """A zip archive without workbook parts is a 400, not a server error"""
+    pytest.importorskip("openpyxl")
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w") as archive:
+        archive.writestr("notes.txt", "not a spreadsheet")
+    data.seek(0)
+    with pytest.raises(HTTPException) as error:
+        list(read_import_rows(data, "xlsx"))
+    assert error.value.status_code == 400